@@ -16,12 +16,18 @@ from core.llm import generate_query_with_explanation
 from core.connection_manager import (
     list_connections, add_connection, delete_connection as rem_connection,
     get_adapter_for_connection, test_connection, test_new_connection,
+    adapter_registry_stats,
 )
 from core.adapters import DB_TYPES, DB_DISPLAY_NAMES, DB_CONNECTION_FIELDS
-from core.metrics import get_summary
+from core.adapters.base import QueryCancelled
+from core.metrics import get_summary, get_export_summary
 from core.dashboards import list_dashboards, get_dashboard
 from core import llm_manager
 from core import join_center
+from core.pagination import (
+    PAGE_SIZE, query_budget, is_system_query,
+    paginate_by_token, read_page, read_totals,
+)
 from core.paths import db_path
 
 import os
@@ -45,7 +51,6 @@ ROLE_PERMISSIONS = {
 
 GROQ_API_KEY = os.environ.get("GROQ_API_KEY", "")
 analysis_enabled = bool(GROQ_API_KEY)
-PAGE_SIZE = 50
 
 
 def is_allowed(role, task):
@@ -80,32 +85,6 @@ def get_active_db_info():
     return {"name": name, "db_type": "sqlite", "display_type": "SQLite", "is_nosql": False, "supports_snapshot": True}
 
 
-def is_system_query(sql):
-    sql_l = sql.lower()
-    return any(k in sql_l for k in ("sqlite_master", "pragma", "information_schema"))
-
-
-def is_already_limited(sql):
-    sql_l = sql.lower()
-    return " limit " in sql_l or " offset " in sql_l
-
-
-def paginate_sql(sql, page):
-    sql = sql.rstrip(";")
-    offset = (page - 1) * PAGE_SIZE
-    return f"{sql} LIMIT {PAGE_SIZE} OFFSET {offset}"
-
-
-def safe_count(adapter, sql):
-    if is_system_query(sql) or is_already_limited(sql):
-        return None
-    try:
-        _, rows = adapter.execute(f"SELECT COUNT(*) FROM ({sql.rstrip(';')}) AS subq")
-        return rows[0][0] if rows else 0
-    except Exception:
-        return None
-
-
 # ---------------------------------------------------
 # Auth
 # ---------------------------------------------------
@@ -312,19 +291,15 @@ def api_command():
     # --- TABLE COUNTS ---
     if cmd_lower in ("show table counts", "show row counts", "count all tables", "table sizes"):
         try:
-            tables = adapter.list_tables()
-            columns = ["Table Name", "Row Count"]
-            rows = []
-            for t in tables:
-                try:
-                    _, cr = adapter.execute(f'SELECT COUNT(*) FROM "{t}"')
-                    rows.append([t, cr[0][0] if cr else 0])
-                except Exception:
-                    rows.append([t, "Error"])
+            stats = adapter.table_stats()
+            columns = ["Table Name", "Row Count", "Estimated"]
+            rows = [[s["table"], s["rows"] if s["rows"] is not None
+                     else ("?" if s["estimated"] else "Error"),
+                     "Yes" if s["estimated"] else "No"] for s in stats]
             session["last_read_sql"] = "-- Table Row Counts"
             session["last_read_columns"] = columns
             return jsonify({"task": "SYSTEM", "columns": columns, "results": rows, "total_rows": len(rows), "page": 1, "page_size": len(rows),
-                            "explanation": f"Row counts for {len(tables)} tables."})
+                            "explanation": f"Row counts for {len(stats)} tables (catalog estimates where available)."})
         except Exception as e:
             return jsonify({"error": str(e)})
 
@@ -368,7 +343,7 @@ def api_command():
                         "total_rows": len(tables), "page": 1, "page_size": len(tables)})
 
     # --- LLM Query Generation ---
-    schema = adapter.get_schema()
+    schema = adapter.cached_schema()
     conversation_context = session.get("conversation_context", [])
     llm_provider = session.get("llm_provider", "mistral")
 
@@ -399,17 +374,24 @@ def api_command():
         session["last_read_sql"] = query
         session["last_explanation"] = explanation
 
+        has_more = False
+        totals = {}
         try:
-            if adapter.is_nosql:
-                columns, rows = adapter.execute(query)
-                total_rows = len(rows)
-            elif is_system_query(query) or is_already_limited(query):
-                columns, rows = adapter.execute(query)
-                total_rows = len(rows)
-            else:
-                paginated = paginate_sql(query, 1)
-                columns, rows = adapter.execute(paginated)
-                total_rows = safe_count(adapter, query)
+            with adapter.deadline(query_budget(role)):
+                if adapter.supports_paging_state:
+                    columns, rows, _, has_more = paginate_by_token(session, adapter, query, 1)
+                    total_rows = None
+                elif adapter.is_nosql:
+                    columns, rows = adapter.execute(query)
+                    total_rows = len(rows)
+                elif is_system_query(query):
+                    columns, rows = adapter.execute(query)
+                    total_rows = len(rows)
+                else:
+                    columns, rows, _, totals = read_page(session, adapter, query, 1)
+                    total_rows, has_more = totals["total_rows"], totals["has_more"]
+        except QueryCancelled as e:
+            return jsonify({"error": str(e), "sql": query, "explanation": explanation, "task": "READ"})
         except Exception as e:
             # Try AI Ask fallback
             if analysis_enabled:
@@ -432,6 +414,10 @@ def api_command():
             "columns": columns,
             "results": rows_to_list(rows) if rows and not isinstance(rows[0], list) else rows if rows else [],
             "page": 1, "page_size": PAGE_SIZE, "total_rows": total_rows,
+            "has_more": has_more,
+            "total_estimated": totals.get("total_estimated", False),
+            "total_display": totals.get("total_display", ""),
+            "count_status": totals.get("count_status"),
         })
 
     # WRITE / SCHEMA -> needs review
@@ -453,14 +439,19 @@ def api_paginate():
     page = max(1, int(request.args.get("page", 1)))
     adapter = get_active_adapter()
 
+    has_more = False
+    totals = {}
     try:
-        if adapter.is_nosql:
-            columns, rows = adapter.execute(sql)
-            total_rows = len(rows)
-        else:
-            paginated = paginate_sql(sql, page)
-            columns, rows = adapter.execute(paginated)
-            total_rows = safe_count(adapter, sql)
+        with adapter.deadline(query_budget(session.get("role"))):
+            if adapter.supports_paging_state:
+                columns, rows, page, has_more = paginate_by_token(session, adapter, sql, page)
+                total_rows = None
+            elif adapter.is_nosql:
+                columns, rows = adapter.execute(sql)
+                total_rows = len(rows)
+            else:
+                columns, rows, _, totals = read_page(session, adapter, sql, page)
+                total_rows, has_more = totals["total_rows"], totals["has_more"]
     except Exception as e:
         return jsonify({"error": f"Execution failed: {str(e)}"})
 
@@ -469,9 +460,25 @@ def api_paginate():
         "columns": columns,
         "results": rows_to_list(rows) if rows and not isinstance(rows[0], list) else rows if rows else [],
         "page": page, "page_size": PAGE_SIZE, "total_rows": total_rows,
+        "has_more": has_more,
+        "total_estimated": totals.get("total_estimated", False),
+        "total_display": totals.get("total_display", ""),
+        "count_status": totals.get("count_status"),
     })
 
 
+@api.route('/api/command/count', methods=['GET'])
+def api_result_count():
+    """Poll the background COUNT(*) of the active read."""
+    sql = session.get("last_read_sql")
+    if not sql:
+        return jsonify({"error": "No active query"})
+    adapter = get_active_adapter()
+    if adapter.is_nosql or adapter.supports_paging_state:
+        return jsonify({"count_status": "unavailable", "total_rows": None})
+    return jsonify(read_totals(session, adapter, sql))
+
+
 # ---------------------------------------------------
 # Execute WRITE/SCHEMA
 # ---------------------------------------------------
@@ -500,12 +507,18 @@ def api_execute():
         take_snapshot(adapter, session.get("active_db", "Default SQLite"))
 
     try:
-        adapter.execute(query)
+        with adapter.deadline(query_budget(role)):
+            adapter.execute(query)
         session.pop("last_sql", None)
         session.pop("last_task", None)
         return jsonify({"success": True, "message": "Query executed successfully."})
     except Exception as e:
         return jsonify({"success": False, "error": f"Execution failed: {str(e)}"})
+    finally:
+        if task in ("WRITE", "SCHEMA"):
+            adapter.note_write()
+        if task == "SCHEMA":
+            adapter.invalidate_schema_cache()
 
 
 # ---------------------------------------------------
@@ -596,6 +609,8 @@ def api_admin_metrics():
         "summary": summary,
         "llm_config": llm_config,
         "ollama_models": ollama_models,
+        "adapter_pools": adapter_registry_stats(),
+        "exports": get_export_summary(),
     })
 
 
@@ -704,7 +719,11 @@ def api_join_schema():
         return err
     try:
         snapshot = join_center.build_schema_snapshot(adapter)
-        return jsonify(snapshot)
+        resp = jsonify(snapshot)
+        if snapshot.get("version"):
+            resp.set_etag(snapshot["version"])
+            return resp.make_conditional(request)
+        return resp
     except join_center.JoinSpecError as e:
         return jsonify({"error": str(e)}), 400
     except Exception as e:
@@ -729,6 +748,22 @@ def api_join_suggest():
         return _join_server_error(e)
 
 
+@api.route('/api/join/plan', methods=['POST'])
+def api_join_plan():
+    adapter, err = _join_guard()
+    if err:
+        return err
+    data = request.json or {}
+    try:
+        plan = join_center.plan_join(adapter, data.get("tables"), data.get("type") or "INNER")
+        plan["sql"] = join_center.build_join_sql(plan["spec"], join_center.get_schema_model(adapter))
+        return jsonify(plan)
+    except join_center.JoinSpecError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return _join_server_error(e)
+
+
 @api.route('/api/join/preview', methods=['POST'])
 def api_join_preview():
     adapter, err = _join_guard()
@@ -736,7 +771,7 @@ def api_join_preview():
         return err
     spec = request.json or {}
     try:
-        schema = join_center.build_schema_snapshot(adapter)
+        schema = join_center.get_schema_model(adapter)
         sql = join_center.build_join_sql(spec, schema)
         return jsonify({"sql": sql})
     except join_center.JoinSpecError as e:
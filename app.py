@@ -3,6 +3,7 @@ from io import StringIO
 import csv
 import re
 import time
+import zlib
 from flask import (
     Flask, render_template, request,
     session, redirect, url_for, Response, jsonify, send_file
@@ -23,12 +24,19 @@ from core.connection_manager import (
     ensure_default_sqlite,
 )
 from core.adapters import DB_TYPES, DB_DISPLAY_NAMES, DB_CONNECTION_FIELDS
-from core.metrics import get_summary
+from core.adapters.base import QueryCancelled
+from core.metrics import get_summary, log_export
 from core.dashboards import (
     list_dashboards, get_dashboard, create_dashboard, 
     delete_dashboard, add_widget, remove_widget
 )
 from core import llm_manager
+from core import row_limit
+from core.pagination import (
+    PAGE_SIZE, query_budget, is_system_query,
+    paginate_by_token, read_page,
+)
+from core.join_center import quote_ident
 from core.paths import db_path, repo_path
 
 
@@ -52,8 +60,6 @@ app.config["SESSION_PERMANENT"] = False
 GROQ_API_KEY = os.environ.get("GROQ_API_KEY", "")
 analysis_enabled = bool(GROQ_API_KEY)
 
-PAGE_SIZE = 50
-
 # Ensure default SQLite connection exists on startup
 ensure_default_sqlite()
 
@@ -161,30 +167,11 @@ def is_allowed(role, task):
     return task in ROLE_PERMISSIONS.get(role, set())
 
 
-def is_system_query(sql):
-    sql = sql.lower()
-    return any(k in sql for k in ("sqlite_master", "pragma", "information_schema"))
-
-
-def is_already_limited(sql):
-    sql = sql.lower()
-    return " limit " in sql or " offset " in sql
-
-
-def paginate_sql(sql, page):
-    sql = sql.rstrip(";")
-    offset = (page - 1) * PAGE_SIZE
-    return f"{sql} LIMIT {PAGE_SIZE} OFFSET {offset}"
-
-
-def safe_count(adapter, sql):
-    if is_system_query(sql) or is_already_limited(sql):
-        return None
-    try:
-        _, rows = adapter.execute(f"SELECT COUNT(*) FROM ({sql.rstrip(';')}) AS subq")
-        return rows[0][0] if rows else 0
-    except Exception:
-        return None
+def table_sample_query(adapter, table, limit):
+    """First `limit` rows of a table, in the adapter's own query language."""
+    if adapter.dialect == "mongodb":
+        return json.dumps({"operation": "find", "collection": table, "limit": limit})
+    return row_limit.limit_sql(f"SELECT * FROM {quote_ident(table, adapter.dialect)}", adapter.dialect, limit)
 
 
 def add_to_history(query, sql, task, status):
@@ -489,15 +476,11 @@ def index():
         # --- SHOW TABLE COUNT / SHOW ROW COUNTS ---
         if cmd_lower in ("show table counts", "show row counts", "count all tables", "table sizes"):
             try:
-                tables = adapter.list_tables()
-                columns = ["Table Name", "Row Count"]
-                rows = []
-                for t in tables:
-                    try:
-                        _, count_rows = adapter.execute(f'SELECT COUNT(*) FROM "{t}"')
-                        rows.append([t, count_rows[0][0] if count_rows else 0])
-                    except Exception:
-                        rows.append([t, "Error"])
+                stats = adapter.table_stats()
+                columns = ["Table Name", "Row Count", "Estimated"]
+                rows = [[s["table"], s["rows"] if s["rows"] is not None
+                         else ("?" if s["estimated"] else "Error"),
+                         "Yes" if s["estimated"] else "No"] for s in stats]
 
                 session["last_read_sql"] = "-- Table Row Counts"
                 session["last_query"] = user_cmd
@@ -507,7 +490,7 @@ def index():
                 return render_template(
                     "index.html", task="SYSTEM", columns=columns, results=rows,
                     page=1, page_size=len(rows), total_rows=len(rows),
-                    explanation=f"Row counts for all {len(tables)} tables.",
+                    explanation=f"Row counts for all {len(stats)} tables (catalog estimates where available).",
                     history=session.get("history", []), db_info=db_info,
                     connections=connections, llm_provider=llm_provider,
                     analysis_enabled=analysis_enabled,
@@ -631,7 +614,7 @@ def index():
             )
 
         # LLM: Generate query
-        schema = adapter.get_schema()
+        schema = adapter.cached_schema()
         conversation_context = session.get("conversation_context", [])
         
         query, explanation = generate_query_with_explanation(
@@ -683,30 +666,36 @@ def index():
             session["last_query"] = user_cmd
 
             page = 1
+            has_more = False
+            totals = {}
 
             try:
-                if adapter.is_nosql:
-                    # NoSQL: execute directly, no pagination
-                    columns, rows = adapter.execute(query)
-                    total_rows = len(rows)
-                    paginated_sql = query
-                elif is_system_query(query) or is_already_limited(query):
-                    paginated_sql = query
-                    columns, rows = adapter.execute(query)
-                    total_rows = len(rows)
-                else:
-                    paginated_sql = paginate_sql(query, page)
-                    columns, rows = adapter.execute(paginated_sql)
-                    total_rows = safe_count(adapter, query)
+                with adapter.deadline(query_budget(role)):
+                    if adapter.supports_paging_state:
+                        columns, rows, page, has_more = paginate_by_token(session, adapter, query, page)
+                        total_rows = None
+                        paginated_sql = query
+                    elif adapter.is_nosql:
+                        # NoSQL: execute directly, no pagination
+                        columns, rows = adapter.execute(query)
+                        total_rows = len(rows)
+                        paginated_sql = query
+                    elif is_system_query(query):
+                        paginated_sql = query
+                        columns, rows = adapter.execute(query)
+                        total_rows = len(rows)
+                    else:
+                        columns, rows, paginated_sql, totals = read_page(session, adapter, query, page)
+                        total_rows, has_more = totals["total_rows"], totals["has_more"]
             except Exception as e:
                 # If it's a "Safe Unknown" (plain text), or if the generated SQL fails,
                 # try AI Ask as a fallback to answer the user's question directly
-                if task == "UNKNOWN" and effective_task == "READ":
+                if task == "UNKNOWN" and effective_task == "READ" and not isinstance(e, QueryCancelled):
                     # Try AI Ask with Groq if available
                     if analysis_enabled:
                         try:
                             from core.analyzer import ai_ask
-                            schema = adapter.get_schema()
+                            schema = adapter.cached_schema()
                             db_name = session.get("active_db", "Unknown DB")
                             ai_result = ai_ask(user_cmd, schema, db_name, dialect=dialect)
                             if "error" not in ai_result:
@@ -749,7 +738,7 @@ def index():
                     if analysis_enabled and "syntax" in str(e).lower() or "no such" in str(e).lower():
                         try:
                             from core.analyzer import ai_ask
-                            schema = adapter.get_schema()
+                            schema = adapter.cached_schema()
                             db_name = session.get("active_db", "Unknown DB")
                             ai_result = ai_ask(user_cmd, schema, db_name, dialect=dialect)
                             if "error" not in ai_result:
@@ -799,6 +788,8 @@ def index():
                 page=page,
                 page_size=PAGE_SIZE,
                 total_rows=total_rows,
+                has_more=has_more,
+                totals=totals,
                 history=session.get("history", []),
                 db_info=db_info,
                 connections=connections,
@@ -830,16 +821,22 @@ def index():
         explanation = session.get("last_explanation")
         page = max(1, int(page))
         page_task = "READ"
+        has_more = False
+        totals = {}
 
         try:
-            if adapter.is_nosql:
-                columns, rows = adapter.execute(sql)
-                total_rows = len(rows)
-                paginated_sql = sql
-            else:
-                paginated_sql = paginate_sql(sql, page)
-                columns, rows = adapter.execute(paginated_sql)
-                total_rows = safe_count(adapter, sql)
+            with adapter.deadline(query_budget(session.get("role"))):
+                if adapter.supports_paging_state:
+                    columns, rows, page, has_more = paginate_by_token(session, adapter, sql, page)
+                    total_rows = None
+                    paginated_sql = sql
+                elif adapter.is_nosql:
+                    columns, rows = adapter.execute(sql)
+                    total_rows = len(rows)
+                    paginated_sql = sql
+                else:
+                    columns, rows, paginated_sql, totals = read_page(session, adapter, sql, page)
+                    total_rows, has_more = totals["total_rows"], totals["has_more"]
         except Exception as e:
             return render_template(
                 "index.html",
@@ -863,6 +860,8 @@ def index():
             page=page,
             page_size=PAGE_SIZE,
             total_rows=total_rows,
+            has_more=has_more,
+            totals=totals,
             history=session.get("history", []),
             db_info=db_info,
             connections=connections,
@@ -883,6 +882,63 @@ def index():
 # ---------------------------------------------------
 # CSV Export
 # ---------------------------------------------------
+EXPORT_BATCH_SIZE = 2000   # rows fetched per server-side cursor batch
+EXPORT_FLUSH_ROWS = 500    # rows buffered before a chunk is sent
+
+
+def _stream_csv(columns, batches, compress):
+    """
+    Yield CSV (optionally gzip-compressed) chunks from execute_iter() batches,
+    flushing every EXPORT_FLUSH_ROWS rows. Rows and bytes sent are logged
+    to the metrics layer when the stream ends or the client disconnects.
+    """
+    started = time.time()
+    buf = StringIO()
+    writer = csv.writer(buf)
+    gz = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None  # wbits=31 -> gzip framing
+    sent = {"rows": 0, "bytes": 0}
+    completed = False
+
+    def drain():
+        data = buf.getvalue().encode("utf-8")
+        buf.seek(0)
+        buf.truncate()
+        if gz:
+            data = gz.compress(data)
+        sent["bytes"] += len(data)
+        return data
+
+    try:
+        writer.writerow(columns)
+        pending = 0
+        for _, rows in batches:
+            for r in rows:
+                writer.writerow(r)
+                pending += 1
+                if pending >= EXPORT_FLUSH_ROWS:
+                    sent["rows"] += pending
+                    pending = 0
+                    chunk = drain()
+                    if chunk:
+                        yield chunk
+        sent["rows"] += pending
+        chunk = drain()
+        if gz:
+            tail = gz.flush()
+            sent["bytes"] += len(tail)
+            chunk += tail
+        if chunk:
+            yield chunk
+        completed = True
+    finally:
+        batches.close()
+        try:
+            log_export(sent["rows"], sent["bytes"], time.time() - started,
+                       compressed=bool(gz), completed=completed)
+        except Exception:
+            pass
+
+
 @app.route("/export")
 def export_csv():
     sql = session.get("last_read_sql")
@@ -891,21 +947,42 @@ def export_csv():
         return redirect(url_for("index"))
 
     adapter = get_active_adapter()
-    columns, rows = adapter.execute(sql)
+    batches = adapter.execute_iter(sql, EXPORT_BATCH_SIZE)
+    # The statement starts on the first batch and its watchdog is armed then,
+    # so the role's budget covers the whole stream, not just this handler
+    try:
+        with adapter.deadline(query_budget(session.get("role"))):
+            columns, first_rows = next(batches, ([], []))
+    except QueryCancelled as e:
+        session["error"] = str(e)
+        return redirect(url_for("index"))
 
     if not columns:
+        batches.close()
         return redirect(url_for("index"))
 
-    output = StringIO()
-    writer = csv.writer(output)
-    writer.writerow(columns)
-    for r in rows:
-        writer.writerow(r if isinstance(r, list) else list(r))
+    def all_batches():
+        try:
+            yield columns, first_rows
+            yield from batches
+        finally:
+            batches.close()
+
+    # ?gzip=1 compresses the stream when the client accepts it
+    compress = (request.args.get("gzip") in ("1", "true")
+                and "gzip" in request.headers.get("Accept-Encoding", ""))
+    headers = {
+        "Content-Disposition": "attachment; filename=results.csv",
+        "X-Accel-Buffering": "no",
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
 
     return Response(
-        output.getvalue(),
+        _stream_csv(columns, all_batches(), compress),
         mimetype="text/csv",
-        headers={"Content-Disposition": "attachment; filename=results.csv"}
+        headers=headers,
     )
 
 
@@ -939,7 +1016,7 @@ def refine_query():
     
     adapter = get_active_adapter()
     dialect = adapter.dialect
-    schema = adapter.get_schema()
+    schema = adapter.cached_schema()
     llm_provider = session.get("llm_provider", "mistral")
     
     # We construct a new prompt that includes the current SQL and the refinement feedback
@@ -1000,10 +1077,16 @@ def execute():
         if query.lower().startswith("delete"):
             adapter.preview_delete(query)
 
-        adapter.execute(query)
+        with adapter.deadline(query_budget(role)):
+            adapter.execute(query)
         session["message"] = "Query executed successfully."
     except Exception as e:
         session["error"] = f"Execution failed: {str(e)}"
+    finally:
+        if task in ("WRITE", "SCHEMA"):
+            adapter.note_write()
+        if task == "SCHEMA":
+            adapter.invalidate_schema_cache()
 
     session.pop("last_sql", None)
     session.pop("last_task", None)
@@ -1148,7 +1231,8 @@ def api_query_data():
         
     try:
         adapter = get_adapter_for_connection(db_name)
-        columns, rows = adapter.execute(query)
+        with adapter.deadline(query_budget(session.get("role"))):
+            columns, rows = adapter.execute(query)
         return jsonify({
             "success": True,
             "columns": columns,
@@ -1166,18 +1250,14 @@ def api_auto_generate_dashboard():
 
     active_db = session.get("active_db", "Default SQLite")
     adapter = get_active_adapter()
-    schema = adapter.get_schema()
+    schema = adapter.cached_schema()
 
     # Collect table stats for better context
     table_stats = ""
     try:
-        tables = adapter.list_tables()
-        for t in tables:
-            try:
-                _, cr = adapter.execute(f'SELECT COUNT(*) FROM "{t}"')
-                table_stats += f"  - {t}: {cr[0][0]} rows\n"
-            except Exception:
-                table_stats += f"  - {t}: ? rows\n"
+        for s in adapter.table_stats():
+            rows = s["rows"] if s["rows"] is not None else "?"
+            table_stats += f"  - {s['table']}: {rows} rows\n"
     except Exception:
         pass
 
@@ -1372,12 +1452,11 @@ def export_ppt():
     try:
         adapter = get_active_adapter()
         # Limit to 10 rows for PPT summary table
-        if not (adapter.is_nosql or is_system_query(sql) or is_already_limited(sql)):
-            fetch_sql = paginate_sql(sql, 1)
+        if adapter.supports_paging_state or adapter.is_nosql or is_system_query(sql):
+            columns, rows = adapter.execute(sql)
         else:
-            fetch_sql = sql
-
-        columns, rows = adapter.execute(fetch_sql)
+            # Usually the page the user is looking at, already in the result cache
+            columns, rows, _, _ = read_page(session, adapter, sql, 1, count=False)
         results = rows_to_list(rows)[:10]
     except Exception as e:
         session["error"] = f"Error fetching data for PPT: {str(e)}"
@@ -1391,7 +1470,7 @@ def export_ppt():
 
     # 2. Schema slide (shows DB structure for context)
     try:
-        schema = adapter.get_schema()
+        schema = adapter.cached_schema()
         if schema:
             gen.add_schema_slide(schema)
     except Exception:
@@ -1921,7 +2000,7 @@ def generate_insights():
         
     try:
         adapter = get_active_adapter()
-        schema = adapter.get_schema()
+        schema = adapter.cached_schema()
         db_name = session.get("active_db", "Unknown DB")
         from core.analyzer import analyze_schema
         result = analyze_schema(schema, db_name)
@@ -1942,7 +2021,7 @@ def analyze():
     try:
         adapter = get_active_adapter()
         # Ensure we only analyze a reasonable chunk (analyzer cuts off at 100 rows anyway)
-        paginated_sql = paginate_sql(sql, 1) if not (adapter.is_nosql or is_system_query(sql) or is_already_limited(sql)) else sql
+        paginated_sql = sql if is_system_query(sql) else row_limit.limit_sql(sql, adapter.dialect, PAGE_SIZE)
         fetched_columns, rows = adapter.execute(paginated_sql)
 
         # Use fetched columns if session columns are missing
@@ -2002,10 +2081,10 @@ def analyze_direct():
             sql_lower = custom_sql.strip().lower()
             if not sql_lower.startswith("select"):
                 return jsonify({"error": "Only SELECT queries are allowed for analysis."})
-            sql = custom_sql.rstrip(";")
+            sql = row_limit.limit_sql(custom_sql, adapter.dialect, 200)
         elif source:
             # Fetch from table directly
-            sql = f'SELECT * FROM "{source}" LIMIT 200'
+            sql = table_sample_query(adapter, source, 200)
         else:
             return jsonify({"error": "Provide a table name or custom SQL query."})
 
@@ -2033,15 +2112,8 @@ def api_tables_list():
     """Returns list of tables with row counts for the analysis page."""
     try:
         adapter = get_active_adapter()
-        tables = adapter.list_tables()
-        result = []
-        for t in tables:
-            try:
-                _, count_rows = adapter.execute(f'SELECT COUNT(*) FROM "{t}"')
-                count = count_rows[0][0] if count_rows else 0
-            except Exception:
-                count = 0
-            result.append({"name": t, "rows": count})
+        result = [{"name": s["table"], "rows": s["rows"] or 0, "estimated": s["estimated"]}
+                  for s in adapter.table_stats()]
         return jsonify({"tables": result, "db_name": session.get("active_db", "Unknown")})
     except Exception as e:
         return jsonify({"error": str(e)})
@@ -2061,11 +2133,9 @@ def api_table_preview():
             sql_lower = custom_sql.strip().lower()
             if not sql_lower.startswith("select"):
                 return jsonify({"error": "Only SELECT queries allowed."})
-            sql = custom_sql.rstrip(";")
-            if "limit" not in sql_lower:
-                sql += " LIMIT 10"
+            sql = row_limit.limit_sql(custom_sql, adapter.dialect, 10)
         elif source:
-            sql = f'SELECT * FROM "{source}" LIMIT 10'
+            sql = table_sample_query(adapter, source, 10)
         else:
             return jsonify({"error": "Provide a table name or SQL."})
 
@@ -2123,20 +2193,15 @@ def ai_ask_endpoint():
 
     try:
         adapter = get_active_adapter()
-        schema = adapter.get_schema()
+        schema = adapter.cached_schema()
         dialect = adapter.dialect
         db_name = session.get("active_db", "Unknown DB")
 
         # Get table stats for context
         table_stats = []
         try:
-            tables = adapter.list_tables()
-            for t in tables:
-                try:
-                    _, count_rows = adapter.execute(f'SELECT COUNT(*) FROM "{t}"')
-                    table_stats.append({"table": t, "rows": count_rows[0][0] if count_rows else 0})
-                except Exception:
-                    table_stats.append({"table": t, "rows": "?"})
+            for s in adapter.table_stats():
+                table_stats.append({"table": s["table"], "rows": s["rows"] if s["rows"] is not None else "?"})
         except Exception:
             pass
 
@@ -2171,37 +2236,34 @@ def overview_page():
     )
 
 
-@app.route("/api/er-diagram", methods=["POST"])
+@app.route("/api/er-diagram", methods=["GET", "POST"])
 def api_er_diagram():
     """Returns table structures and foreign key relationships for ER diagram rendering."""
     adapter = get_active_adapter()
-    tables_data = []
     try:
-        tables = adapter.list_tables()
-        for t in tables:
-            try:
-                info = adapter.describe_table(t)
-                columns = []
-                for c in info.get("columns", []):
-                    columns.append({
-                        "name": c["name"],
-                        "type": c.get("type", ""),
-                        "pk": c.get("primary_key", False),
-                        "not_null": c.get("not_null", False),
-                    })
-                tables_data.append({
-                    "name": t,
-                    "columns": columns,
-                    "row_count": info.get("row_count", 0),
-                })
-            except Exception:
-                tables_data.append({"name": t, "columns": [], "row_count": 0})
-
+        # One cached bulk pass; its version doubles as the ETag
+        described = adapter.describe_all()
+        tables_data = []
         fks = []
-        if hasattr(adapter, 'get_foreign_keys'):
-            fks = adapter.get_foreign_keys()
-
-        return jsonify({"success": True, "tables": tables_data, "foreign_keys": fks})
+        for info in described["tables"]:
+            tables_data.append({
+                "name": info["table"],
+                "columns": [{
+                    "name": c["name"],
+                    "type": c.get("type", ""),
+                    "pk": c.get("primary_key", False),
+                    "not_null": c.get("not_null", False),
+                } for c in info.get("columns", [])],
+                "row_count": info.get("row_count") or 0,
+                "row_count_estimated": info.get("row_count_estimated", False),
+            })
+            for fk in info.get("foreign_keys", []):
+                fks.append({"from_table": info["table"], "from_column": fk["from"],
+                            "to_table": fk["to_table"], "to_column": fk["to_column"]})
+
+        resp = jsonify({"success": True, "tables": tables_data, "foreign_keys": fks})
+        resp.set_etag(described["version"])
+        return resp.make_conditional(request)
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -2213,37 +2275,21 @@ def api_overview():
     dialect = adapter.dialect
     db_name = session.get("active_db", "Unknown DB")
 
-    # Collect table stats
+    # Collect table stats and FK info from the cached bulk describe
     table_stats = []
+    fk_relationship_map = []
     try:
-        tables = adapter.list_tables()
-        for t in tables:
-            try:
-                _, count_rows = adapter.execute(f'SELECT COUNT(*) FROM "{t}"')
-                table_stats.append({"table": t, "rows": count_rows[0][0] if count_rows else 0})
-            except Exception:
-                table_stats.append({"table": t, "rows": 0})
+        for info in adapter.describe_all()["tables"]:
+            table_stats.append({"table": info["table"], "rows": info.get("row_count") or 0})
+            for fk in info.get("foreign_keys", []):
+                fk_relationship_map.append({"from": info["table"], "to": fk["to_table"], "via": fk["from"]})
     except Exception as e:
         return jsonify({"error": f"Failed to get tables: {str(e)}"})
 
-    # Collect FK info
-    fk_list = []
-    if hasattr(adapter, 'get_foreign_keys'):
-        try:
-            fk_list = adapter.get_foreign_keys()
-        except Exception:
-            pass
-
-    # Build FK relationship map for the response
-    fk_relationship_map = [
-        {"from": fk["from_table"], "to": fk["to_table"], "via": fk["from_column"]}
-        for fk in fk_list
-    ]
-
     # If Groq is available, get AI analysis
     if analysis_enabled:
         try:
-            schema = adapter.get_schema()
+            schema = adapter.cached_schema()
             from core.analyzer import get_table_overview
             ai_result = get_table_overview(schema, db_name, table_stats, dialect=dialect)
             if "error" not in ai_result:
@@ -2269,7 +2315,7 @@ def api_overview():
         "highlights": [
             {"label": "Total Tables", "value": str(len(table_stats))},
             {"label": "Total Rows", "value": f"{total_rows:,}"},
-            {"label": "Foreign Keys", "value": str(len(fk_list))},
+            {"label": "Foreign Keys", "value": str(len(fk_relationship_map))},
             {"label": "Largest Table", "value": max(table_stats, key=lambda x: x["rows"] if isinstance(x["rows"], int) else 0)["table"] if table_stats else "N/A"},
         ],
         "table_size_chart": {
@@ -2319,18 +2365,14 @@ def _get_full_db_context():
     db_name = session.get("active_db", "Unknown DB")
     schema = ""
     try:
-        schema = adapter.get_schema()
+        schema = adapter.cached_schema()
     except Exception:
         pass
 
     table_stats = []
     try:
-        for t in adapter.list_tables():
-            try:
-                _, c_rows = adapter.execute(f'SELECT COUNT(*) FROM "{t}"')
-                table_stats.append({"table": t, "rows": c_rows[0][0] if c_rows else 0})
-            except Exception:
-                table_stats.append({"table": t, "rows": "?"})
+        for s in adapter.table_stats():
+            table_stats.append({"table": s["table"], "rows": s["rows"] if s["rows"] is not None else "?"})
     except Exception:
         pass
 
@@ -2381,7 +2423,8 @@ def cc_deep_ask():
                     break
             if candidate:
                 try:
-                    cols, rows = adapter.execute(candidate)
+                    with adapter.deadline(query_budget(session.get("role"))):
+                        cols, rows = adapter.execute(candidate)
                     executed = {
                         "sql": candidate,
                         "columns": cols,
@@ -2428,16 +2471,23 @@ def cc_execute_raw():
     statements = [s.strip() for s in _re.split(r";\s*\n|;\s*$", sql) if s.strip()]
     results = []
     t0 = time.time()
+    schema_changed = False
     for stmt in statements:
         r = {"sql": stmt}
+        schema_changed = schema_changed or classify_query(stmt, adapter.dialect) == "SCHEMA"
         try:
-            cols, rows = adapter.execute(stmt)
+            with adapter.deadline(query_budget(ROLE_ADMIN)):
+                cols, rows = adapter.execute(stmt)
             r["columns"] = cols or []
             r["rows"] = rows_to_list(rows)[:500] if rows else []
             r["row_count"] = len(rows) if rows else 0
         except Exception as e:
             r["error"] = str(e)
         results.append(r)
+    if not is_read:
+        adapter.note_write()
+    if schema_changed:
+        adapter.invalidate_schema_cache()
     return jsonify({
         "success": True,
         "statements": results,
@@ -2483,7 +2533,8 @@ def cc_auto_insights():
             if not sql:
                 continue
             try:
-                cols, rows = adapter.execute(sql)
+                with adapter.deadline(query_budget(session.get("role"))):
+                    cols, rows = adapter.execute(sql)
                 insights.append({
                     "title": title,
                     "sql": sql,
@@ -2511,18 +2562,15 @@ def cc_data_health():
     """
     try:
         adapter = get_active_adapter()
-        tables = adapter.list_tables()
+        # The scan reads every table anyway, so exact counts (run concurrently)
+        counts = {s["table"]: s["rows"] for s in adapter.table_stats(exact=True)}
+        tables = list(counts)
         report = []
         totals = {"null_warnings": 0, "dup_warnings": 0, "empty_tables": 0}
 
         for t in tables:
             issues = []
-            # row count
-            try:
-                _, c_rows = adapter.execute(f'SELECT COUNT(*) FROM "{t}"')
-                total = c_rows[0][0] if c_rows else 0
-            except Exception:
-                total = 0
+            total = counts[t] or 0
 
             if total == 0:
                 issues.append({"kind": "empty_table", "msg": "Table has no rows"})
@@ -2673,7 +2721,8 @@ def cc_anomalies():
                     total = stat_rows[0][1]
 
                     # Basic stddev (SQL-engine-agnostic: fetch a sample and compute client-side)
-                    sample_sql = f'SELECT "{col}" FROM "{t}" WHERE "{col}" IS NOT NULL LIMIT 5000'
+                    sample_sql = row_limit.limit_sql(
+                        f'SELECT "{col}" FROM "{t}" WHERE "{col}" IS NOT NULL', adapter.dialect, 5000)
                     _, srows = adapter.execute(sample_sql)
                     vals = [float(r[0]) for r in (srows or []) if r and r[0] is not None]
                     if len(vals) < 10:
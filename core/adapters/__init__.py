@@ -48,6 +48,8 @@ DB_CONNECTION_FIELDS = {
         {"name": "username", "label": "Username", "type": "text", "placeholder": "root"},
         {"name": "password", "label": "Password", "type": "password", "placeholder": ""},
         {"name": "database", "label": "Database Name", "type": "text", "placeholder": "mydb"},
+        {"name": "replica_hosts", "label": "Read Replicas (optional)", "type": "text", "placeholder": "replica1:3306, replica2:3306"},
+        {"name": "max_replica_lag", "label": "Max Replica Lag, seconds (optional)", "type": "number", "placeholder": "30"},
     ],
     "postgresql": [
         {"name": "host", "label": "Host", "type": "text", "placeholder": "localhost"},
@@ -55,6 +57,9 @@ DB_CONNECTION_FIELDS = {
         {"name": "username", "label": "Username", "type": "text", "placeholder": "postgres"},
         {"name": "password", "label": "Password", "type": "password", "placeholder": ""},
         {"name": "database", "label": "Database Name", "type": "text", "placeholder": "mydb"},
+        {"name": "schemas", "label": "Schemas (optional)", "type": "text", "placeholder": "public, sales"},
+        {"name": "replica_hosts", "label": "Read Replicas (optional)", "type": "text", "placeholder": "replica1:5432, replica2:5432"},
+        {"name": "max_replica_lag", "label": "Max Replica Lag, seconds (optional)", "type": "number", "placeholder": "30"},
     ],
     "mssql": [
         {"name": "host", "label": "Host", "type": "text", "placeholder": "localhost"},
@@ -62,6 +67,8 @@ DB_CONNECTION_FIELDS = {
         {"name": "username", "label": "Username", "type": "text", "placeholder": "sa"},
         {"name": "password", "label": "Password", "type": "password", "placeholder": ""},
         {"name": "database", "label": "Database Name", "type": "text", "placeholder": "mydb"},
+        {"name": "replica_hosts", "label": "Read Replicas (optional)", "type": "text", "placeholder": "replica1:1433"},
+        {"name": "max_replica_lag", "label": "Max Replica Lag, seconds (optional)", "type": "number", "placeholder": "30"},
     ],
     "oracle": [
         {"name": "host", "label": "Host", "type": "text", "placeholder": "localhost"},
@@ -69,6 +76,8 @@ DB_CONNECTION_FIELDS = {
         {"name": "username", "label": "Username", "type": "text", "placeholder": "system"},
         {"name": "password", "label": "Password", "type": "password", "placeholder": ""},
         {"name": "service_name", "label": "Service Name", "type": "text", "placeholder": "XEPDB1"},
+        {"name": "replica_hosts", "label": "Read Replicas (optional)", "type": "text", "placeholder": "standby1:1521"},
+        {"name": "max_replica_lag", "label": "Max Replica Lag, seconds (optional)", "type": "number", "placeholder": "30"},
     ],
     "mongodb": [
         {"name": "host", "label": "Host", "type": "text", "placeholder": "localhost"},
@@ -76,6 +85,9 @@ DB_CONNECTION_FIELDS = {
         {"name": "username", "label": "Username (optional)", "type": "text", "placeholder": ""},
         {"name": "password", "label": "Password (optional)", "type": "password", "placeholder": ""},
         {"name": "database", "label": "Database Name", "type": "text", "placeholder": "mydb"},
+        {"name": "pool_max_size", "label": "Max Pool Size (optional)", "type": "number", "placeholder": "10"},
+        {"name": "pool_min_size", "label": "Min Pool Size (optional)", "type": "number", "placeholder": "0"},
+        {"name": "schema_sample_size", "label": "Schema Sample Size (optional)", "type": "number", "placeholder": "200"},
     ],
     "cassandra": [
         {"name": "host", "label": "Host", "type": "text", "placeholder": "127.0.0.1"},
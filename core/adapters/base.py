@@ -3,7 +3,23 @@ Abstract Base Adapter
 All database adapters implement this interface.
 """
 
+import hashlib
+import itertools
+import json
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+
+# Process-wide, so a rebuilt adapter never reuses an earlier adapter's version
+_DATA_VERSIONS = itertools.count(1)
+
+# Statement deadline of the calling thread (a time.monotonic() value). It is
+# per thread rather than per adapter so replica adapters honour it too.
+_deadline = threading.local()
 
 
 class DatabaseError(Exception):
@@ -11,6 +27,202 @@ class DatabaseError(Exception):
     pass
 
 
+class QueryCancelled(DatabaseError):
+    """A statement was cancelled, by cancel() or because it ran past its deadline."""
+    pass
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of physical connections built by a factory.
+
+    - Blocks up to `timeout` seconds when `max_size` connections are out.
+    - Validates idle connections with `ping` before handing them out.
+    - Retires connections older than `max_lifetime` seconds, and idle ones
+      past `idle_timeout` while the pool is above `min_size`.
+    """
+
+    def __init__(self, factory, close, ping=None, min_size=0, max_size=10,
+                 timeout=30.0, max_lifetime=1800.0, idle_timeout=300.0):
+        self._factory = factory
+        self._close = close
+        self._ping = ping
+        self.max_size = max(1, int(max_size))
+        self.min_size = min(max(0, int(min_size)), self.max_size)
+        self.timeout = float(timeout)
+        self.max_lifetime = float(max_lifetime)
+        self.idle_timeout = float(idle_timeout)
+
+        self._idle = deque()      # (conn, created_at, last_used), newest last
+        self._checked_out = {}    # id(conn) -> created_at
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._counters = {"created": 0, "reused": 0, "discarded": 0, "timeouts": 0}
+
+    # --------------------------------------------------
+    # Borrow / return
+    # --------------------------------------------------
+    def acquire(self):
+        """Return a live connection, blocking until one is free or timeout."""
+        self.reap()
+        deadline = time.monotonic() + self.timeout
+        while True:
+            item = self._checkout(deadline)
+            if item is None:
+                return self._open()
+            conn, created, _ = item
+            if self._ping is None or self._is_alive(conn):
+                with self._cond:
+                    self._checked_out[id(conn)] = created
+                    self._counters["reused"] += 1
+                return conn
+            self._retire(conn)
+
+    def release(self, conn):
+        """Return a connection to the pool (closing it if it has expired)."""
+        now = time.time()
+        with self._cond:
+            created = self._checked_out.pop(id(conn), None)
+            if created is None:
+                return
+            expired = self._closed or now - created > self.max_lifetime
+            if expired:
+                self._size -= 1
+            else:
+                self._idle.append((conn, created, now))
+            self._cond.notify()
+        if expired:
+            self._close_quietly(conn)
+
+    def discard(self, conn):
+        """Drop a checked-out connection that is broken or in an unknown state."""
+        with self._cond:
+            if self._checked_out.pop(id(conn), None) is None:
+                return
+        self._retire(conn)
+
+    def fill(self):
+        """Open connections until the pool holds at least `min_size`."""
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                conn = self._factory()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            now = time.time()
+            with self._cond:
+                self._counters["created"] += 1
+                self._idle.append((conn, now, now))
+                self._cond.notify()
+
+    def reap(self):
+        """Close idle connections that outlived their lifetime or idle timeout."""
+        now = time.time()
+        stale = []
+        with self._cond:
+            keep = deque()
+            for item in self._idle:
+                conn, created, last_used = item
+                too_old = now - created > self.max_lifetime
+                too_idle = (now - last_used > self.idle_timeout
+                            and self._size - len(stale) > self.min_size)
+                if too_old or too_idle:
+                    stale.append(conn)
+                else:
+                    keep.append(item)
+            self._idle = keep
+            self._size -= len(stale)
+            self._counters["discarded"] += len(stale)
+            if stale:
+                self._cond.notify_all()
+        for conn in stale:
+            self._close_quietly(conn)
+
+    def close(self):
+        """Close idle connections now; checked-out ones close on release."""
+        with self._cond:
+            self._closed = True
+            idle = [item[0] for item in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            self._close_quietly(conn)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": len(self._checked_out),
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                **self._counters,
+            }
+
+    # --------------------------------------------------
+    # Internals
+    # --------------------------------------------------
+    def _checkout(self, deadline):
+        """Pop an idle connection, or reserve a slot (returns None) to open one."""
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise DatabaseError("Connection pool is closed.")
+                if self._idle:
+                    return self._idle.pop()
+                if self._size < self.max_size:
+                    self._size += 1
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._counters["timeouts"] += 1
+                    raise DatabaseError(
+                        f"Timed out after {self.timeout:g}s waiting for a pooled connection "
+                        f"({self.max_size} in use)."
+                    )
+                self._cond.wait(remaining)
+
+    def _open(self):
+        try:
+            conn = self._factory()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._checked_out[id(conn)] = time.time()
+            self._counters["created"] += 1
+        return conn
+
+    def _is_alive(self, conn) -> bool:
+        try:
+            return self._ping(conn) is not False
+        except Exception:
+            return False
+
+    def _retire(self, conn):
+        with self._cond:
+            self._size -= 1
+            self._counters["discarded"] += 1
+            self._cond.notify()
+        self._close_quietly(conn)
+
+    def _close_quietly(self, conn):
+        try:
+            self._close(conn)
+        except Exception:
+            pass
+
+
 class DatabaseAdapter(ABC):
     """
     Universal interface for all database backends.
@@ -21,6 +233,17 @@ class DatabaseAdapter(ABC):
     def __init__(self, config: dict):
         self.config = config
         self._conn = None
+        self._conn_pool = None
+        self._conn_pool_lock = threading.Lock()
+        self._replicas = None     # [{"adapter", "label", "healthy", "lag", ...}]
+        self._replica_rr = 0
+        self._pinned = threading.local()
+        self._schema_cache = {}   # key -> (fingerprint, loaded_at, value)
+        self._schema_cache_lock = threading.Lock()
+        self._schema_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+        self._data_version = next(_DATA_VERSIONS)
+        self._running = {}        # token -> statement entry (see _guarded) per statement in flight
+        self._running_lock = threading.Lock()
 
     # --------------------------------------------------
     # Connection
@@ -41,14 +264,241 @@ class DatabaseAdapter(ABC):
         ...
 
     def get_connection(self):
-        """Borrow a connection from the pool (or the single persistent one)."""
-        if not self._conn:
-            self.connect()
-        return self._conn
+        """
+        Borrow a connection from the pool (blocks up to pool_timeout).
+        Inside session() the thread's pinned connection is returned instead.
+        """
+        pinned = getattr(self._pinned, "conn", None)
+        if pinned is not None:
+            return pinned
+        return self.pool.acquire()
 
     def release_connection(self, conn):
-        """Return a connection to the pool."""
-        pass
+        """Return a connection to the pool (no-op for the pinned one)."""
+        if conn is getattr(self._pinned, "conn", None):
+            return
+        if self._conn_pool:
+            self._conn_pool.release(conn)
+
+    @contextmanager
+    def borrow(self):
+        """
+        Context manager around get_connection/release_connection.
+        If the block raises, the connection is rolled back before it goes
+        back to the pool, or dropped if even that fails.
+        """
+        conn = self.get_connection()
+        try:
+            yield conn
+        except BaseException:
+            try:
+                self._reset_connection(conn)
+            except Exception:
+                self._discard_connection(conn)
+                raise
+            self.release_connection(conn)
+            raise
+        else:
+            self.release_connection(conn)
+
+    @contextmanager
+    def session(self):
+        """
+        Pin one pooled connection to the calling thread for the block, so a
+        run of introspection calls (list_tables, then describe_table per
+        table, ...) shares it instead of borrowing one per call.
+        Nested session() blocks reuse the outer connection.
+        """
+        if getattr(self._pinned, "conn", None) is not None:
+            yield self._pinned.conn
+            return
+        with self.borrow() as conn:
+            self._pinned.conn = conn
+            try:
+                yield conn
+            finally:
+                self._pinned.conn = None
+
+    # --------------------------------------------------
+    # Pooling (adapters plug in a connection factory)
+    # --------------------------------------------------
+    def _create_connection(self):
+        """Open one physical connection. Override to use the shared pool."""
+        raise NotImplementedError(f"{type(self).__name__} does not provide pooled connections")
+
+    def _close_connection(self, conn):
+        """Close one physical connection."""
+        conn.close()
+
+    def _ping_connection(self, conn) -> bool:
+        """Cheap liveness check run on idle connections before reuse."""
+        return True
+
+    def _reset_connection(self, conn):
+        """Bring a connection back to a clean state after a failed block."""
+        rollback = getattr(conn, "rollback", None)
+        if rollback:
+            rollback()
+
+    def _discard_connection(self, conn):
+        if conn is getattr(self._pinned, "conn", None):
+            # session() releases it; pre-ping drops it if it is unusable
+            return
+        if self._conn_pool:
+            self._conn_pool.discard(conn)
+        else:
+            self.release_connection(conn)
+
+    def _pool_settings(self) -> dict:
+        """Pool sizing from the connection config (all keys optional)."""
+        cfg = self.config
+        return {
+            "min_size": int(cfg.get("pool_min_size") or 0),
+            "max_size": int(cfg.get("pool_max_size") or 10),
+            "timeout": float(cfg.get("pool_timeout") or 30),
+            "max_lifetime": float(cfg.get("pool_max_lifetime") or 1800),
+            "idle_timeout": float(cfg.get("pool_idle_timeout") or 300),
+        }
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """The adapter's connection pool, created on first use."""
+        if self._conn_pool is None:
+            with self._conn_pool_lock:
+                if self._conn_pool is None:
+                    self._conn_pool = self._build_pool()
+                    if self._conn_pool.min_size:
+                        # Open the warm connections off the request path
+                        threading.Thread(target=self._warm_pool, args=(self._conn_pool,),
+                                         daemon=True).start()
+        return self._conn_pool
+
+    def _build_pool(self):
+        """
+        Create the pool. Override to wrap a driver-native pool that offers
+        the same acquire/release/discard/fill/close/stats interface.
+        """
+        pre_ping = str(self.config.get("pool_pre_ping", "true")).lower() not in ("0", "false", "no")
+        return ConnectionPool(
+            self._create_connection,
+            self._close_connection,
+            ping=self._ping_connection if pre_ping else None,
+            **self._pool_settings(),
+        )
+
+    @staticmethod
+    def _warm_pool(pool):
+        try:
+            pool.fill()
+        except Exception:
+            pass
+
+    def close_pool(self):
+        """Close the pool (and any replica pools); a later get_connection() starts fresh."""
+        with self._conn_pool_lock:
+            pool, self._conn_pool = self._conn_pool, None
+            replicas, self._replicas = self._replicas, None
+        if pool:
+            pool.close()
+        for replica in replicas or []:
+            replica["adapter"].close_pool()
+
+    def pool_stats(self):
+        """Pool counters, or None if this adapter has not opened a pool."""
+        return self._conn_pool.stats() if self._conn_pool else None
+
+    # --------------------------------------------------
+    # Read replicas
+    # --------------------------------------------------
+    REPLICA_CHECK_INTERVAL = 10     # seconds between health/lag probes
+    DEFAULT_MAX_REPLICA_LAG = 30    # seconds; lagging replicas are skipped
+
+    def _replica_configs(self) -> list:
+        """
+        Configs for read replicas, from the optional comma-separated
+        "replica_hosts" field ("host" or "host:port"). Replicas share the
+        primary's credentials and database.
+        """
+        raw = str(self.config.get("replica_hosts") or "")
+        configs = []
+        for entry in raw.split(","):
+            entry = entry.strip()
+            if not entry:
+                continue
+            host, _, port = entry.partition(":")
+            cfg = dict(self.config, host=host.strip(), replica_hosts="")
+            if port.strip():
+                cfg["port"] = port.strip()
+            configs.append(cfg)
+        return configs
+
+    def replica_lag(self) -> float:
+        """
+        Seconds this (replica) database is behind its primary.
+        Raises if the server is unreachable. Engines override with a real probe.
+        """
+        with self.borrow():
+            pass
+        return 0.0
+
+    def _replica_entries(self) -> list:
+        if self._replicas is None:
+            with self._conn_pool_lock:
+                if self._replicas is None:
+                    cls = type(self)
+                    self._replicas = [{
+                        "adapter": cls(cfg),
+                        "label": cfg.get("host") or "read-only",
+                        "healthy": False, "lag": None,
+                        "checked_at": 0.0, "error": None,
+                    } for cfg in self._replica_configs()]
+        return self._replicas
+
+    def _check_replica(self, entry: dict):
+        max_lag = float(self.config.get("max_replica_lag") or self.DEFAULT_MAX_REPLICA_LAG)
+        try:
+            lag = entry["adapter"].replica_lag()
+            entry.update(lag=lag, healthy=lag is not None and lag <= max_lag, error=None)
+        except Exception as e:
+            entry.update(lag=None, healthy=False, error=str(e)[:200])
+        entry["checked_at"] = time.time()
+
+    def reader(self):
+        """A healthy, non-lagging replica adapter (round-robin), or self."""
+        entries = self._replica_entries()
+        if not entries:
+            return self
+        now = time.time()
+        for entry in entries:
+            if now - entry["checked_at"] > self.REPLICA_CHECK_INTERVAL:
+                self._check_replica(entry)
+        healthy = [e for e in entries if e["healthy"]]
+        if not healthy:
+            return self
+        self._replica_rr = (self._replica_rr + 1) % len(healthy)
+        return healthy[self._replica_rr]["adapter"]
+
+    def replica_for(self, query: str):
+        """
+        Adapter to run `query` on. READ/SYSTEM statements go to a replica
+        when one is healthy; writes, DDL and locking reads stay on the primary.
+        """
+        if not self._replica_entries():
+            return self
+        from core.validator import classify_query
+        q_lower = query.lower()
+        if classify_query(query, self.dialect) not in ("READ", "SYSTEM"):
+            return self
+        if any(k in q_lower for k in (" for update", " for share", " into ", "nextval(")):
+            return self
+        return self.reader()
+
+    def replica_status(self) -> list:
+        """Last known health and lag of each replica (for admin stats)."""
+        return [{
+            "replica": e["label"], "healthy": e["healthy"], "lag": e["lag"],
+            "error": e["error"], "pool": e["adapter"].pool_stats(),
+        } for e in (self._replicas or [])]
 
     # --------------------------------------------------
     # Schema
@@ -81,6 +531,28 @@ class DatabaseAdapter(ABC):
         """
         ...
 
+    def execute_iter(self, query: str, batch_size: int = 1000):
+        """
+        Execute a query and yield (columns, rows) batches of at most
+        batch_size rows, so large results can be consumed in constant memory.
+        The first batch may be empty; it always carries the column names.
+        The default materialises via execute(); adapters with server-side
+        cursors override it.
+        """
+        columns, rows = self.execute(query)
+        yield columns, rows[:batch_size]
+        for start in range(batch_size, len(rows), batch_size):
+            yield columns, rows[start:start + batch_size]
+
+    def execute_page(self, query: str, page_size: int, paging_state=None) -> tuple:
+        """
+        Fetch one page of a query, resuming from an opaque paging_state
+        token returned by the previous call (None for the first page).
+        Returns (columns, rows, next_state); next_state is None on the last
+        page. Only adapters with supports_paging_state implement it.
+        """
+        raise NotImplementedError(f"{self.dialect} does not support token paging")
+
     def dry_run(self, query: str) -> dict:
         """
         Execute a query without committing changes.
@@ -88,6 +560,120 @@ class DatabaseAdapter(ABC):
         """
         return {"affected_rows": 0, "status": "Not implemented"}
 
+    # --------------------------------------------------
+    # Deadlines & cancellation
+    # --------------------------------------------------
+    @contextmanager
+    def deadline(self, seconds):
+        """
+        Give the statements this thread runs inside the block a shared
+        budget of `seconds` (None or 0: no limit). Adapters push the time
+        left down to the server where the driver allows it, and a watchdog
+        cancels the statement when the budget runs out; either way the
+        caller gets QueryCancelled. A nested block never extends an outer one.
+        """
+        outer = getattr(_deadline, "at", None)
+        at = outer
+        if seconds:
+            at = time.monotonic() + float(seconds)
+            if outer is not None:
+                at = min(at, outer)
+        _deadline.at = at
+        try:
+            yield
+        finally:
+            _deadline.at = outer
+
+    def time_left(self):
+        """Seconds left before this thread's deadline, or None without one."""
+        at = getattr(_deadline, "at", None)
+        if at is None:
+            return None
+        left = at - time.monotonic()
+        if left <= 0:
+            raise QueryCancelled("Query budget used up before the statement started.")
+        return left
+
+    @contextmanager
+    def _guarded(self, conn):
+        """
+        Wrap one statement on `conn`: register it for cancel() and, under a
+        deadline, arm a watchdog that cancels it when the time runs out.
+        Yields the seconds left (None when unbounded) for driver-side
+        timeouts; a cancelled or server-timed-out statement raises QueryCancelled.
+        """
+        left = self.time_left()
+        token = object()
+        fired = threading.Event()
+        # Own lock per statement: "still running?" and the driver cancel are
+        # atomic for this statement without holding up the rest of the adapter
+        entry = {"conn": conn, "cancelled": fired, "lock": threading.Lock(), "done": False}
+        with self._running_lock:
+            self._running[token] = entry
+
+        timer = None
+        if left is not None:
+            timer = threading.Timer(left, self._stop_statement, (entry,))
+            timer.daemon = True
+            timer.start()
+        try:
+            yield left
+        except QueryCancelled:
+            raise
+        except Exception as e:
+            if fired.is_set() or self._is_timeout_error(e):
+                if left is None:
+                    raise QueryCancelled("Query cancelled.") from e
+                raise QueryCancelled(f"Query cancelled: it ran past its time budget ({left:.1f}s).") from e
+            raise
+        finally:
+            if timer:
+                timer.cancel()
+            with entry["lock"]:   # waits out a cancel in flight before conn is reused
+                entry["done"] = True
+            with self._running_lock:
+                self._running.pop(token, None)
+
+    def cancel(self) -> int:
+        """
+        Cancel every statement running through this adapter (and its
+        replicas) right now. Safe to call from any thread; returns how
+        many statements were signalled.
+        """
+        with self._running_lock:
+            running = list(self._running.values())
+        count = sum(self._stop_statement(entry) for entry in running)
+        for entry in self._replicas or []:
+            count += entry["adapter"].cancel()
+        return count
+
+    def _cancel_statement(self, conn):
+        """
+        Ask the server to abort whatever `conn` is running. Called from a
+        thread other than the one executing. Adapters without a
+        cancellation call rely on their server-side timeout instead.
+        """
+        raise NotImplementedError(f"{self.dialect} cannot cancel a running statement")
+
+    def _stop_statement(self, entry) -> bool:
+        """Cancel one registered statement unless it has already finished."""
+        with entry["lock"]:
+            if entry["done"]:
+                return False
+            entry["cancelled"].set()
+            self._cancel_quietly(entry["conn"])
+            return True
+
+    def _cancel_quietly(self, conn):
+        try:
+            self._cancel_statement(conn)
+        except Exception:
+            pass
+
+    def _is_timeout_error(self, exc) -> bool:
+        """True if a driver error means the server-side statement timeout fired."""
+        return False
+
     # --------------------------------------------------
     # Safety
     # --------------------------------------------------
@@ -109,6 +695,223 @@ class DatabaseAdapter(ABC):
         """Restore a database snapshot from filepath. Override if supported."""
         raise NotImplementedError
 
+    # --------------------------------------------------
+    # Schema cache
+    # --------------------------------------------------
+    SCHEMA_CACHE_TTL = 300          # seconds; upper bound even when the fingerprint matches
+
+    def schema_fingerprint(self):
+        """
+        A cheap value that changes whenever the schema does (e.g. SQLite's
+        schema_version). None means no fingerprint: cached entries then
+        live for the TTL only.
+        """
+        return None
+
+    def _cached_schema(self, key: str, loader):
+        """Serve loader() from the schema cache while the fingerprint and TTL hold."""
+        ttl = float(self.config.get("schema_cache_ttl") or self.SCHEMA_CACHE_TTL)
+        try:
+            fingerprint = self.schema_fingerprint()
+        except Exception:
+            fingerprint = None
+        now = time.time()
+        with self._schema_cache_lock:
+            entry = self._schema_cache.get(key)
+            if entry and entry[0] == fingerprint and now - entry[1] < ttl:
+                self._schema_cache_stats["hits"] += 1
+                return entry[2]
+            self._schema_cache_stats["misses"] += 1
+        value = loader()
+        with self._schema_cache_lock:
+            self._schema_cache[key] = (fingerprint, now, value)
+        return value
+
+    def cached_schema(self) -> str:
+        """get_schema() text, served from the schema cache."""
+        return self._cached_schema("schema", self.get_schema)
+
+    def invalidate_schema_cache(self):
+        """Drop cached schema data, e.g. after a SCHEMA statement ran."""
+        with self._schema_cache_lock:
+            self._schema_cache.clear()
+            self._schema_cache_stats["invalidations"] += 1
+
+    def schema_cache_stats(self) -> dict:
+        with self._schema_cache_lock:
+            stats = dict(self._schema_cache_stats)
+            stats["entries"] = len(self._schema_cache)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
+    @property
+    def data_version(self) -> int:
+        """Changes whenever a write goes through note_write(); keys cached results."""
+        return self._data_version
+
+    def note_write(self):
+        """Record that data may have changed (a WRITE/SCHEMA statement or a restore ran)."""
+        self._data_version = next(_DATA_VERSIONS)
+
+    # --------------------------------------------------
+    # Schema model (bulk introspection)
+    # --------------------------------------------------
+    def _load_schema_model(self):
+        """
+        Load columns, keys and indexes for every table in a few set-based
+        catalog queries. Returns an ordered dict:
+            {table: {"columns": [{"name", "type", "not_null", "default", "primary_key"}],
+                     "foreign_keys": [{"from", "to_table", "to_column"}],
+                     "indexes": [{"name", "unique", "primary", "columns"}]}}
+        or None if the adapter has no bulk loader.
+        """
+        return None
+
+    def schema_model(self):
+        """
+        The schema model for this connection. get_schema and the
+        introspection defaults below are all derived from it. Cached;
+        treat the result as read-only.
+        """
+        return self._cached_schema("model", self._load_schema_model)
+
+    @staticmethod
+    def _model_table(model: dict, table_name: str):
+        """Look a table up in the model, falling back to a case-insensitive match."""
+        if table_name in model:
+            return table_name, model[table_name]
+        for name, info in model.items():
+            if name.lower() == table_name.lower():
+                return name, info
+        return table_name, None
+
+    def _describe_from_model(self, table_name: str, model: dict = None) -> dict:
+        """describe_table() without the row count, read from the schema model."""
+        if model is None:
+            model = self.schema_model() or {}
+        name, info = self._model_table(model, table_name)
+        info = info or {"columns": [], "foreign_keys": [], "indexes": []}
+        return {
+            "table": name,
+            "columns": [dict(c) for c in info["columns"]],
+            "foreign_keys": [dict(fk) for fk in info["foreign_keys"]],
+            "indexes": [{"name": i["name"], "unique": i["unique"], "columns": list(i["columns"])}
+                        for i in info["indexes"]],
+        }
+
+    @staticmethod
+    def _render_schema(model: dict, samples: dict = None) -> str:
+        """
+        Format the model as the LLM-facing schema text. samples maps a
+        table to up to a few sample rows; binary values are skipped.
+        """
+        samples = samples or {}
+        schema = ""
+        for table_name, info in model.items():
+            schema += f"\nTABLE {table_name}:\n"
+            for col in info["columns"]:
+                notnull = " NOT NULL" if col["not_null"] else ""
+                default = f" DEFAULT {col['default']}" if col["default"] is not None else ""
+                pk_marker = " [PRIMARY KEY]" if col["primary_key"] else ""
+                schema += f"  - {col['name']} ({col['type']}{notnull}{default}{pk_marker})\n"
+
+            if info["foreign_keys"]:
+                schema += "  FOREIGN KEYS:\n"
+                for fk in info["foreign_keys"]:
+                    schema += f"    - {fk['from']} -> {fk['to_table']}.{fk['to_column']}\n"
+
+            if info["indexes"]:
+                schema += "  INDEXES:\n"
+                for idx in info["indexes"]:
+                    unique = "UNIQUE " if idx["unique"] else ""
+                    schema += f"    - {unique}{idx['name']} ({', '.join(idx['columns'])})\n"
+
+            sample_rows = samples.get(table_name)
+            if sample_rows:
+                col_names = [c["name"] for c in info["columns"]]
+                col_types = [str(c["type"]).upper() for c in info["columns"]]
+                schema += f"  SAMPLE DATA ({len(sample_rows)} rows):\n"
+                for sr in sample_rows:
+                    pairs = []
+                    for i in range(min(len(col_names), len(sr))):
+                        if col_types[i] in ("BLOB", "BINARY", "VARBINARY", "IMAGE"):
+                            continue
+                        val = sr[i]
+                        if isinstance(val, (bytes, bytearray, memoryview)):
+                            continue
+                        pairs.append(f"{col_names[i]}={str(val)[:60]}")
+                    schema += f"    {', '.join(pairs)}\n"
+        return schema
+
+    # --------------------------------------------------
+    # Table statistics
+    # --------------------------------------------------
+    EXACT_COUNT_WORKERS = 4
+
+    def _estimate_table_stats(self):
+        """
+        Catalog statistics without scanning tables:
+            {table: {"rows": int|None, "size_bytes": int|None, "last_analyzed": datetime|None}}
+        None (the default) means the engine offers no estimates.
+        """
+        return None
+
+    def estimate_query_rows(self, query: str):
+        """
+        The planner's row estimate for a read, without running it.
+        None (the default) means the engine has no cheap estimate.
+        """
+        return None
+
+    def _count_rows(self, table_name: str) -> int:
+        """Exact row count for one table."""
+        _, rows = self.execute(f'SELECT COUNT(*) FROM "{table_name}"')
+        return rows[0][0] if rows else 0
+
+    def _exact_counts(self, tables: list) -> dict:
+        """Run _count_rows for each table concurrently; failed counts are None."""
+        def count(table):
+            try:
+                return self._count_rows(table)
+            except Exception:
+                return None
+
+        if not tables:
+            return {}
+        workers = min(len(tables), int(self.config.get("count_workers") or self.EXACT_COUNT_WORKERS))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(tables, executor.map(count, tables)))
+
+    def table_stats(self, exact: bool = False) -> list:
+        """
+        Row counts, on-disk size and last-analyzed time for every table.
+        By default rows come from catalog estimates, so no table is
+        scanned; tables the catalog has no estimate for yet (never
+        analyzed) get rows None. exact=True counts every table
+        (concurrently); size and last-analyzed still come from the catalog.
+        Each item: {"table", "rows", "size_bytes", "last_analyzed", "estimated": bool}
+        """
+        tables = self.list_tables()
+        try:
+            estimates = self._estimate_table_stats() or {}
+        except Exception:
+            estimates = {}   # e.g. no permission on the statistics views
+        counts = self._exact_counts(tables) if exact else {}
+
+        stats = []
+        for t in tables:
+            est = estimates.get(t) or {}
+            estimated = t not in counts
+            stats.append({
+                "table": t,
+                "rows": est.get("rows") if estimated else counts[t],
+                "size_bytes": est.get("size_bytes"),
+                "last_analyzed": est.get("last_analyzed"),
+                "estimated": estimated,
+            })
+        return stats
+
     # --------------------------------------------------
     # Introspection (override in SQL adapters)
     # --------------------------------------------------
@@ -117,14 +920,28 @@ class DatabaseAdapter(ABC):
         Return all FK relationships across all tables.
         Each item: {"from_table", "from_column", "to_table", "to_column"}
         """
-        return []
+        model = self.schema_model()
+        if model is None:
+            return []
+        return [
+            {"from_table": table, "from_column": fk["from"],
+             "to_table": fk["to_table"], "to_column": fk["to_column"]}
+            for table, info in model.items() for fk in info["foreign_keys"]
+        ]
 
     def get_indexes(self) -> list:
         """
         Return all indexes across all tables.
         Each item: {"table", "index_name", "unique": bool, "columns": list}
         """
-        return []
+        model = self.schema_model()
+        if model is None:
+            return []
+        return [
+            {"table": table, "index_name": idx["name"],
+             "unique": idx["unique"], "columns": list(idx["columns"])}
+            for table, info in model.items() for idx in info["indexes"]
+        ]
 
     def describe_table(self, table_name: str) -> dict:
         """
@@ -134,12 +951,67 @@ class DatabaseAdapter(ABC):
         """
         raise NotImplementedError
 
+    def describe_all(self) -> dict:
+        """
+        describe_table() for every table in one bulk pass: the schema model
+        plus catalog row estimates, with no per-table COUNT(*). Cached with
+        the schema; treat the result as read-only.
+        Returns: {"version": str, "tables": [{"table", "columns", "foreign_keys",
+                  "indexes", "row_count", "row_count_estimated"}]}
+        "version" changes whenever the payload does (usable as an ETag).
+        """
+        return self._cached_schema("describe_all", self._describe_all)
+
+    def _describe_all(self) -> dict:
+        model = self.schema_model()
+        try:
+            stats = {s["table"]: s for s in self.table_stats()}
+        except Exception:
+            stats = {}
+        names = list(model) if model is not None else self.list_tables()
+
+        tables = []
+        for name in names:
+            if model is not None:
+                info = self._describe_from_model(name, model)
+            else:
+                # No bulk loader: fall back to the adapter's own describe_table
+                try:
+                    info = self.describe_table(name)
+                except Exception:
+                    info = {"table": name, "columns": [], "foreign_keys": [], "indexes": []}
+            stat = stats.get(name) or {}
+            info["row_count"] = stat.get("rows", info.get("row_count"))
+            info["row_count_estimated"] = bool(stat.get("estimated", False))
+            tables.append(info)
+
+        digest = hashlib.sha1(json.dumps(tables, sort_keys=True, default=str).encode("utf-8"))
+        return {"version": digest.hexdigest()[:16], "tables": tables}
+
     def get_constraints(self) -> list:
         """
         Return all constraints (PK, FK, NOT NULL, UNIQUE) across all tables.
         Each item: {"table", "type", "details"}
         """
-        return []
+        model = self.schema_model()
+        if model is None:
+            return []
+        constraints = []
+        for table, info in model.items():
+            pk_cols = [c["name"] for c in info["columns"] if c["primary_key"]]
+            if pk_cols:
+                constraints.append({"table": table, "type": "PRIMARY KEY", "details": ", ".join(pk_cols)})
+            for fk in info["foreign_keys"]:
+                constraints.append({"table": table, "type": "FOREIGN KEY",
+                                    "details": f"{fk['from']} -> {fk['to_table']}.{fk['to_column']}"})
+            for idx in info["indexes"]:
+                if idx["unique"] and not idx["primary"]:
+                    constraints.append({"table": table, "type": "UNIQUE",
+                                        "details": f"{idx['name']} ({', '.join(idx['columns'])})"})
+            for col in info["columns"]:
+                if col["not_null"]:
+                    constraints.append({"table": table, "type": "NOT NULL", "details": col["name"]})
+        return constraints
 
     def get_create_table(self, table_name: str) -> str:
         """
@@ -165,6 +1037,22 @@ class DatabaseAdapter(ABC):
         """Return True if file-based snapshots are supported."""
         return False
 
+    @property
+    def supports_paging_state(self) -> bool:
+        """Return True if execute_page() pages with driver paging tokens."""
+        return False
+
+    @property
+    def is_shareable(self) -> bool:
+        """
+        Return True if one instance may serve concurrent requests.
+        Shareable adapters are kept alive in the connection registry.
+        Adapters built on the shared ConnectionPool are shareable.
+        """
+        cls = type(self)
+        return (cls._create_connection is not DatabaseAdapter._create_connection
+                or cls._build_pool is not DatabaseAdapter._build_pool)
+
     @property
     def display_name(self) -> str:
         """Human-readable name for UI."""
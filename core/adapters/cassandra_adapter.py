@@ -3,9 +3,48 @@ Apache Cassandra Adapter
 Uses cassandra-driver. LLM generates CQL (Cassandra Query Language).
 """
 
+import threading
+from collections import OrderedDict
+
 from core.adapters.base import DatabaseAdapter
 
 
+class CassandraSessionPool:
+    """
+    One long-lived cluster Session behind the ConnectionPool interface
+    used by DatabaseAdapter. Sessions are thread-safe and hold their own
+    per-host connection pools, so every borrow hands out the same one.
+    """
+
+    min_size = 0
+
+    def __init__(self, session):
+        self._session = session
+
+    def acquire(self):
+        return self._session
+
+    def release(self, session):
+        pass
+
+    def discard(self, session):
+        # The driver reconnects failed hosts on its own
+        pass
+
+    def fill(self):
+        pass
+
+    def close(self):
+        self._session.cluster.shutdown()
+
+    def stats(self) -> dict:
+        hosts = self._session.get_pool_state()
+        return {
+            "hosts": len(hosts),
+            "open_connections": sum(state.get("open_count", 0) for state in hosts.values()),
+        }
+
+
 class CassandraAdapter(DatabaseAdapter):
 
     @property
@@ -16,10 +55,22 @@ class CassandraAdapter(DatabaseAdapter):
     def is_nosql(self):
         return True
 
+    @property
+    def supports_paging_state(self):
+        return True
+
+    DEFAULT_FETCH_SIZE = 100        # rows per page round trip
+    PREPARED_CACHE_SIZE = 128       # distinct CQL strings kept prepared
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self._prepared = OrderedDict()     # cql -> PreparedStatement, LRU order
+        self._prepared_lock = threading.Lock()
+
     # --------------------------------------------------
     # Connection
     # --------------------------------------------------
-    def connect(self):
+    def _build_pool(self):
         from cassandra.cluster import Cluster
         from cassandra.auth import PlainTextAuthProvider
 
@@ -33,25 +84,27 @@ class CassandraAdapter(DatabaseAdapter):
         if username and password:
             auth = PlainTextAuthProvider(username=username, password=password)
 
-        self._cluster = Cluster(
+        cluster = Cluster(
             contact_points=[host],
             port=port,
             auth_provider=auth,
         )
-        self._session = self._cluster.connect(keyspace if keyspace else None)
+        return CassandraSessionPool(cluster.connect(keyspace if keyspace else None))
+
+    def connect(self):
+        # Cluster bootstrap happens once, when the pool is built
+        self.pool.fill()
 
     def disconnect(self):
-        if hasattr(self, "_cluster") and self._cluster:
-            self._cluster.shutdown()
-            self._cluster = None
-            self._session = None
+        with self._prepared_lock:
+            self._prepared.clear()
+        self.close_pool()
 
     def test_connection(self) -> bool:
         try:
-            self.connect()
-            # Simple connectivity check
-            self._session.execute("SELECT release_version FROM system.local")
-            self.disconnect()
+            with self.borrow() as session:
+                # Simple connectivity check
+                session.execute("SELECT release_version FROM system.local")
             return True
         except Exception:
             return False
@@ -59,30 +112,35 @@ class CassandraAdapter(DatabaseAdapter):
     # --------------------------------------------------
     # Schema
     # --------------------------------------------------
+    def schema_fingerprint(self):
+        # Cluster-wide schema version UUID, regenerated on every DDL
+        with self.borrow() as session:
+            row = session.execute("SELECT schema_version FROM system.local").one()
+        return str(row.schema_version) if row else None
+
     def get_schema(self) -> str:
         keyspace = self.config.get("keyspace", "")
         if not keyspace:
             return "(no keyspace selected)"
 
-        self.connect()
-        rows = self._session.execute("""
-            SELECT table_name FROM system_schema.tables
-            WHERE keyspace_name = %s
-        """, (keyspace,))
-
-        tables = [row.table_name for row in rows]
-        schema = ""
-
-        for table_name in tables:
-            schema += f"\nTABLE {table_name}:\n"
-            cols = self._session.execute("""
-                SELECT column_name, type FROM system_schema.columns
-                WHERE keyspace_name = %s AND table_name = %s
-            """, (keyspace, table_name))
-            for col in cols:
-                schema += f"  - {col.column_name} ({col.type})\n"
-
-        self.disconnect()
+        with self.borrow() as session:
+            rows = session.execute("""
+                SELECT table_name FROM system_schema.tables
+                WHERE keyspace_name = %s
+            """, (keyspace,))
+
+            tables = [row.table_name for row in rows]
+            schema = ""
+
+            for table_name in tables:
+                schema += f"\nTABLE {table_name}:\n"
+                cols = session.execute("""
+                    SELECT column_name, type FROM system_schema.columns
+                    WHERE keyspace_name = %s AND table_name = %s
+                """, (keyspace, table_name))
+                for col in cols:
+                    schema += f"  - {col.column_name} ({col.type})\n"
+
         return schema
 
     def list_tables(self) -> list:
@@ -90,32 +148,122 @@ class CassandraAdapter(DatabaseAdapter):
         if not keyspace:
             return []
 
-        self.connect()
-        rows = self._session.execute("""
-            SELECT table_name FROM system_schema.tables
-            WHERE keyspace_name = %s
-        """, (keyspace,))
-        tables = [row.table_name for row in rows]
-        self.disconnect()
+        with self.borrow() as session:
+            rows = session.execute("""
+                SELECT table_name FROM system_schema.tables
+                WHERE keyspace_name = %s
+            """, (keyspace,))
+            tables = [row.table_name for row in rows]
         return tables
 
+    def _estimate_table_stats(self):
+        """
+        Per-table estimates from system.size_estimates (one row per token
+        range). Cassandra tracks partitions, so "rows" is a partition count.
+        """
+        keyspace = self.config.get("keyspace", "")
+        if not keyspace:
+            return {}
+        stats = {}
+        with self.borrow() as session:
+            rows = session.execute("""
+                SELECT table_name, partitions_count, mean_partition_size
+                FROM system.size_estimates WHERE keyspace_name = %s
+            """, (keyspace,))
+            for row in rows:
+                entry = stats.setdefault(row.table_name, {"rows": 0, "size_bytes": 0, "last_analyzed": None})
+                entry["rows"] += row.partitions_count
+                entry["size_bytes"] += row.partitions_count * row.mean_partition_size
+        return stats
+
     # --------------------------------------------------
     # Execution
     # --------------------------------------------------
+    def _fetch_size(self, fetch_size=None) -> int:
+        return int(fetch_size or self.config.get("fetch_size") or self.DEFAULT_FETCH_SIZE)
+
+    def _statement(self, session, query: str, fetch_size=None):
+        """
+        Build the statement for a CQL string. DML and SELECTs are prepared
+        once and reused from a small LRU; anything else runs as a simple
+        statement.
+        """
+        from cassandra.query import SimpleStatement
+
+        cql = query.strip().rstrip(";")
+        fetch_size = self._fetch_size(fetch_size)
+        verb = cql.split(None, 1)[0].lower() if cql else ""
+        if verb not in ("select", "insert", "update", "delete"):
+            return SimpleStatement(cql, fetch_size=fetch_size)
+
+        with self._prepared_lock:
+            prepared = self._prepared.get(cql)
+            if prepared is not None:
+                self._prepared.move_to_end(cql)
+        if prepared is None:
+            prepared = session.prepare(cql)
+            with self._prepared_lock:
+                self._prepared[cql] = prepared
+                while len(self._prepared) > int(self.config.get("prepared_cache_size") or self.PREPARED_CACHE_SIZE):
+                    self._prepared.popitem(last=False)
+
+        bound = prepared.bind(())
+        bound.fetch_size = fetch_size
+        return bound
+
     def execute(self, query: str) -> tuple:
-        self.connect()
-        result = self._session.execute(query)
+        with self.borrow() as session, self._guarded(session) as left:
+            statement = self._statement(session, query)
+            if left is None:
+                result = session.execute(statement)
+            else:
+                # Client request timeout; the coordinator's own read/write timeouts still apply
+                result = session.execute(statement, timeout=left)
 
-        if result.column_names:
-            columns = list(result.column_names)
-            rows = [list(row) for row in result]
-        else:
-            columns = []
-            rows = []
+            if result.column_names:
+                columns = list(result.column_names)
+                rows = [list(row) for row in result]
+            else:
+                columns = []
+                rows = []
 
-        self.disconnect()
         return columns, rows
 
+    def _is_timeout_error(self, exc) -> bool:
+        return type(exc).__name__ in ("OperationTimedOut", "ReadTimeout", "WriteTimeout")
+
+    def execute_iter(self, query: str, batch_size: int = 1000):
+        # Guarded across the yields; each page fetch gets the same client timeout
+        with self.borrow() as session, self._guarded(session) as left:
+            statement = self._statement(session, query, batch_size)
+            result = session.execute(statement) if left is None else session.execute(statement, timeout=left)
+            if not result.column_names:
+                yield [], []
+                return
+            columns = list(result.column_names)
+            yield columns, [list(row) for row in result.current_rows]
+            while result.has_more_pages:
+                result.fetch_next_page()
+                yield columns, [list(row) for row in result.current_rows]
+
+    def execute_page(self, query: str, page_size: int = None, paging_state=None) -> tuple:
+        """
+        One fetch_size page of a CQL query. paging_state is the hex token
+        returned for the previous page; the driver resumes from it
+        server-side instead of re-reading skipped rows.
+        """
+        state = bytes.fromhex(paging_state) if paging_state else None
+        with self.borrow() as session, self._guarded(session) as left:
+            statement = self._statement(session, query, page_size)
+            if left is None:
+                result = session.execute(statement, paging_state=state)
+            else:
+                result = session.execute(statement, paging_state=state, timeout=left)
+            columns = list(result.column_names or [])
+            rows = [list(row) for row in result.current_rows] if columns else []
+            next_state = result.paging_state.hex() if result.has_more_pages else None
+        return columns, rows, next_state
+
     # --------------------------------------------------
     # Safety
     # --------------------------------------------------
@@ -127,11 +275,8 @@ class CassandraAdapter(DatabaseAdapter):
         # CQL DELETE → SELECT COUNT(*)
         count_cql = q.lower().replace("delete", "select count(*)", 1)
         try:
-            self.connect()
-            result = self._session.execute(count_cql)
-            row = result.one()
-            self.disconnect()
+            with self.borrow() as session:
+                row = session.execute(count_cql).one()
             return row[0] if row else 0
         except Exception:
-            self.disconnect()
             return None
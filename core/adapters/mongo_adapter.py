@@ -1,13 +1,88 @@
 """
 MongoDB Adapter
 Uses pymongo. LLM generates JSON-based MongoDB queries.
-Schema is inferred by sampling documents from each collection.
+Schema is inferred from a $sample of documents in each collection.
 """
 
+import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor
 from core.adapters.base import DatabaseAdapter
 
 
+SCHEMA_SAMPLE_SIZE = 200      # documents drawn per collection by $sample
+SCHEMA_MAX_DEPTH = 6          # nested path levels flattened (a.b.c...)
+SCHEMA_WORKERS = 4            # collections sampled concurrently
+
+# BSON-flavoured names for the LLM; anything else falls back to the class name
+_TYPE_NAMES = {
+    "str": "string", "int": "int", "Int64": "long", "float": "double",
+    "bool": "bool", "NoneType": "null", "dict": "object", "SON": "object",
+    "list": "array", "datetime": "date", "ObjectId": "objectId",
+    "Decimal128": "decimal", "bytes": "binData", "Binary": "binData",
+}
+
+
+def _bson_type(value) -> str:
+    name = type(value).__name__
+    return _TYPE_NAMES.get(name, name)
+
+
+def _flatten(doc: dict, prefix: str = "", depth: int = 0):
+    """Yield (dotted path, value) for every field, descending into subdocuments and arrays of them."""
+    for key, value in doc.items():
+        path = f"{prefix}{key}"
+        yield path, value
+        if depth + 1 >= SCHEMA_MAX_DEPTH:
+            continue
+        if isinstance(value, dict):
+            yield from _flatten(value, path + ".", depth + 1)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    yield from _flatten(item, path + ".", depth + 1)
+
+
+class MongoClientPool:
+    """
+    One long-lived MongoClient behind the ConnectionPool interface used by
+    DatabaseAdapter. MongoClient is thread-safe and keeps its own socket
+    pool, so every borrow hands out the same Database handle and the
+    client is only closed when the adapter's pool is.
+    """
+
+    min_size = 0   # the client maintains minPoolSize itself
+
+    def __init__(self, client, database: str):
+        self._client = client
+        self._db = client[database]
+
+    def acquire(self):
+        return self._db
+
+    def release(self, db):
+        pass
+
+    def discard(self, db):
+        # Sockets are checked per operation; a failed call needs no cleanup here
+        pass
+
+    def fill(self):
+        self._client.admin.command("ping")
+
+    def close(self):
+        self._client.close()
+
+    def stats(self) -> dict:
+        opts = self._client.options.pool_options
+        return {
+            "min_size": opts.min_pool_size,
+            "max_size": opts.max_pool_size,
+            "wait_queue_timeout": opts.wait_queue_timeout,
+            "max_idle_time": opts.max_idle_time_seconds,
+        }
+
+
 class MongoAdapter(DatabaseAdapter):
 
     @property
@@ -25,7 +100,7 @@ class MongoAdapter(DatabaseAdapter):
     # --------------------------------------------------
     # Connection
     # --------------------------------------------------
-    def connect(self):
+    def _build_pool(self):
         from pymongo import MongoClient
 
         host = self.config.get("host", "localhost")
@@ -39,20 +114,32 @@ class MongoAdapter(DatabaseAdapter):
         else:
             uri = f"mongodb://{host}:{port}/"
 
-        self._client = MongoClient(uri, serverSelectionTimeoutMS=5000)
-        self._db = self._client[database]
+        settings = self._pool_settings()
+        client = MongoClient(
+            uri,
+            serverSelectionTimeoutMS=5000,
+            maxPoolSize=settings["max_size"],
+            minPoolSize=settings["min_size"],
+            waitQueueTimeoutMS=int(settings["timeout"] * 1000),
+            maxIdleTimeMS=int(settings["idle_timeout"] * 1000),
+        )
+        return MongoClientPool(client, database)
+
+    def _reset_connection(self, db):
+        # No transaction to roll back (and db.rollback would be a collection)
+        pass
+
+    def connect(self):
+        # Server selection + topology discovery happen once, here
+        self.pool.fill()
 
     def disconnect(self):
-        if hasattr(self, "_client") and self._client:
-            self._client.close()
-            self._client = None
-            self._db = None
+        self.close_pool()
 
     def test_connection(self) -> bool:
         try:
-            self.connect()
-            self._client.admin.command("ping")
-            self.disconnect()
+            with self.borrow() as db:
+                db.client.admin.command("ping")
             return True
         except Exception:
             return False
@@ -60,38 +147,92 @@ class MongoAdapter(DatabaseAdapter):
     # --------------------------------------------------
     # Schema (inferred from sampling)
     # --------------------------------------------------
+    def schema_fingerprint(self):
+        # Field-level changes are not visible cheaply; those ride the TTL
+        with self.borrow() as db:
+            names = sorted(db.list_collection_names())
+        return hashlib.sha1("\n".join(names).encode()).hexdigest()
+
+    def _sample_size(self) -> int:
+        return int(self.config.get("schema_sample_size") or SCHEMA_SAMPLE_SIZE)
+
+    def _infer_collection(self, coll_name: str) -> dict:
+        """
+        Field map for one collection from a random $sample:
+            {"sampled": n, "fields": {path: {"count", "frequency", "types": {type: count}}}}
+        count is the number of sampled documents containing the path.
+        """
+        with self.borrow() as db:
+            docs = list(db[coll_name].aggregate([{"$sample": {"size": self._sample_size()}}]))
+
+        fields = {}
+        for doc in docs:
+            seen = {}
+            for path, value in _flatten(doc):
+                # A path repeats within one document when it sits inside an array
+                seen.setdefault(path, set()).add(_bson_type(value))
+            for path, types in seen.items():
+                entry = fields.setdefault(path, {"count": 0, "types": {}})
+                entry["count"] += 1
+                for t in types:
+                    entry["types"][t] = entry["types"].get(t, 0) + 1
+
+        for entry in fields.values():
+            entry["frequency"] = round(entry["count"] / len(docs), 3)
+        return {"sampled": len(docs), "fields": dict(sorted(fields.items()))}
+
+    def infer_collection_schema(self, coll_name: str) -> dict:
+        """_infer_collection(), cached per collection with the schema cache."""
+        return self._cached_schema(f"collection:{coll_name}", lambda: self._infer_collection(coll_name))
+
+    def infer_schema(self) -> dict:
+        """Inferred field maps for every collection, sampled concurrently."""
+        collections = self.list_tables()
+        if not collections:
+            return {}
+        workers = min(len(collections), int(self.config.get("schema_workers") or SCHEMA_WORKERS))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(collections, executor.map(self.infer_collection_schema, collections)))
+
     def get_schema(self) -> str:
-        self.connect()
-        collections = self._db.list_collection_names()
         schema = ""
-
-        for coll_name in collections:
-            schema += f"\nCOLLECTION {coll_name}:\n"
-            # Sample up to 5 documents to infer fields
-            sample = list(self._db[coll_name].find().limit(5))
-            fields = set()
-            for doc in sample:
-                for key in doc.keys():
-                    if key != "_id":
-                        val = doc[key]
-                        ftype = type(val).__name__
-                        fields.add((key, ftype))
-
-            for field_name, field_type in sorted(fields):
-                schema += f"  - {field_name} ({field_type})\n"
-
-            if not fields:
+        for coll_name, inferred in self.infer_schema().items():
+            schema += f"\nCOLLECTION {coll_name} (sampled {inferred['sampled']} documents):\n"
+            for path, entry in inferred["fields"].items():
+                if path == "_id":
+                    continue
+                types = entry["types"]
+                if len(types) == 1:
+                    type_desc = next(iter(types))
+                else:
+                    ranked = sorted(types.items(), key=lambda kv: -kv[1])
+                    type_desc = " | ".join(f"{t} {round(100 * n / entry['count'])}%" for t, n in ranked)
+                presence = "" if entry["frequency"] >= 1 else f", in {round(100 * entry['frequency'])}% of docs"
+                schema += f"  - {path} ({type_desc}{presence})\n"
+
+            if not inferred["sampled"]:
                 schema += "  (empty collection)\n"
 
-        self.disconnect()
         return schema
 
     def list_tables(self) -> list:
-        self.connect()
-        collections = self._db.list_collection_names()
-        self.disconnect()
+        with self.borrow() as db:
+            collections = db.list_collection_names()
         return collections
 
+    def _estimate_table_stats(self):
+        # estimated_document_count reads collection metadata, not documents
+        with self.borrow() as db:
+            return {
+                name: {"rows": db[name].estimated_document_count(),
+                       "size_bytes": None, "last_analyzed": None}
+                for name in db.list_collection_names()
+            }
+
+    def _count_rows(self, table_name: str) -> int:
+        with self.borrow() as db:
+            return db[table_name].count_documents({})
+
     # --------------------------------------------------
     # Execution
     # --------------------------------------------------
@@ -112,93 +253,146 @@ class MongoAdapter(DatabaseAdapter):
         - updateOne, updateMany
         - deleteOne, deleteMany
         """
-        self.connect()
         try:
             cmd = json.loads(query)
         except json.JSONDecodeError:
-            self.disconnect()
             raise ValueError("Invalid MongoDB query JSON. Expected a JSON object.")
 
         operation = cmd.get("operation", "find")
         coll_name = cmd.get("collection", "")
-        coll = self._db[coll_name]
-
         columns = []
         rows = []
 
-        if operation == "find":
-            filt = cmd.get("filter", {})
-            proj = cmd.get("projection", None)
-            limit = cmd.get("limit", 50)
-            sort = cmd.get("sort", None)
-
-            cursor = coll.find(filt, proj)
-            if sort:
-                cursor = cursor.sort(list(sort.items()))
-            cursor = cursor.limit(limit)
-
-            docs = list(cursor)
-            if docs:
-                columns = list(docs[0].keys())
-                rows = [[str(doc.get(c, "")) for c in columns] for doc in docs]
-
-        elif operation == "aggregate":
-            pipeline = cmd.get("pipeline", [])
-            docs = list(coll.aggregate(pipeline))
-            if docs:
-                columns = list(docs[0].keys())
-                rows = [[str(doc.get(c, "")) for c in columns] for doc in docs]
-
-        elif operation == "count":
-            filt = cmd.get("filter", {})
-            cnt = coll.count_documents(filt)
-            columns = ["count"]
-            rows = [[cnt]]
-
-        elif operation == "insertOne":
-            doc = cmd.get("document", {})
-            result = coll.insert_one(doc)
-            columns = ["inserted_id"]
-            rows = [[str(result.inserted_id)]]
-
-        elif operation == "insertMany":
-            docs = cmd.get("documents", [])
-            result = coll.insert_many(docs)
-            columns = ["inserted_count"]
-            rows = [[len(result.inserted_ids)]]
-
-        elif operation == "updateOne":
-            filt = cmd.get("filter", {})
-            update = cmd.get("update", {})
-            result = coll.update_one(filt, update)
-            columns = ["matched", "modified"]
-            rows = [[result.matched_count, result.modified_count]]
+        with self.borrow() as db, self._guarded(db) as left:
+            coll = db[coll_name]
+            # Reads carry maxTimeMS so the server gives up on its own
+            max_time = {"maxTimeMS": max(1, int(left * 1000))} if left is not None else {}
+
+            if operation == "find":
+                filt = cmd.get("filter", {})
+                proj = cmd.get("projection", None)
+                limit = cmd.get("limit", 50)
+                sort = cmd.get("sort", None)
+
+                cursor = coll.find(filt, proj)
+                if max_time:
+                    cursor = cursor.max_time_ms(max_time["maxTimeMS"])
+                if sort:
+                    cursor = cursor.sort(list(sort.items()))
+                if cmd.get("skip"):
+                    cursor = cursor.skip(int(cmd["skip"]))
+                cursor = cursor.limit(limit)
+
+                docs = list(cursor)
+                if docs:
+                    columns = list(docs[0].keys())
+                    rows = [[str(doc.get(c, "")) for c in columns] for doc in docs]
+
+            elif operation == "aggregate":
+                pipeline = cmd.get("pipeline", [])
+                docs = list(coll.aggregate(pipeline, **max_time))
+                if docs:
+                    columns = list(docs[0].keys())
+                    rows = [[str(doc.get(c, "")) for c in columns] for doc in docs]
+
+            elif operation == "count":
+                filt = cmd.get("filter", {})
+                cnt = coll.count_documents(filt, **max_time)
+                columns = ["count"]
+                rows = [[cnt]]
+
+            elif operation == "insertOne":
+                doc = cmd.get("document", {})
+                result = coll.insert_one(doc)
+                columns = ["inserted_id"]
+                rows = [[str(result.inserted_id)]]
+
+            elif operation == "insertMany":
+                docs = cmd.get("documents", [])
+                result = coll.insert_many(docs)
+                columns = ["inserted_count"]
+                rows = [[len(result.inserted_ids)]]
+
+            elif operation == "updateOne":
+                filt = cmd.get("filter", {})
+                update = cmd.get("update", {})
+                result = coll.update_one(filt, update)
+                columns = ["matched", "modified"]
+                rows = [[result.matched_count, result.modified_count]]
+
+            elif operation == "updateMany":
+                filt = cmd.get("filter", {})
+                update = cmd.get("update", {})
+                result = coll.update_many(filt, update)
+                columns = ["matched", "modified"]
+                rows = [[result.matched_count, result.modified_count]]
+
+            elif operation == "deleteOne":
+                filt = cmd.get("filter", {})
+                result = coll.delete_one(filt)
+                columns = ["deleted"]
+                rows = [[result.deleted_count]]
+
+            elif operation == "deleteMany":
+                filt = cmd.get("filter", {})
+                result = coll.delete_many(filt)
+                columns = ["deleted"]
+                rows = [[result.deleted_count]]
 
-        elif operation == "updateMany":
-            filt = cmd.get("filter", {})
-            update = cmd.get("update", {})
-            result = coll.update_many(filt, update)
-            columns = ["matched", "modified"]
-            rows = [[result.matched_count, result.modified_count]]
+            else:
+                raise ValueError(f"Unsupported MongoDB operation: {operation}")
 
-        elif operation == "deleteOne":
-            filt = cmd.get("filter", {})
-            result = coll.delete_one(filt)
-            columns = ["deleted"]
-            rows = [[result.deleted_count]]
+        return columns, rows
 
-        elif operation == "deleteMany":
-            filt = cmd.get("filter", {})
-            result = coll.delete_many(filt)
-            columns = ["deleted"]
-            rows = [[result.deleted_count]]
+    def _is_timeout_error(self, exc) -> bool:
+        return type(exc).__name__ == "ExecutionTimeout"   # maxTimeMS expired
 
-        else:
-            self.disconnect()
-            raise ValueError(f"Unsupported MongoDB operation: {operation}")
+    def execute_iter(self, query: str, batch_size: int = 1000):
+        """
+        Streams find/aggregate results in cursor batches. Unlike execute(),
+        find has no default limit here. Other operations fall back to execute().
+        Columns are taken from the first document, as in execute().
+        """
+        try:
+            cmd = json.loads(query)
+        except json.JSONDecodeError:
+            raise ValueError("Invalid MongoDB query JSON. Expected a JSON object.")
 
-        self.disconnect()
-        return columns, rows
+        operation = cmd.get("operation", "find")
+        if operation not in ("find", "aggregate"):
+            yield from super().execute_iter(query, batch_size)
+            return
+
+        # Guarded across the yields; maxTimeMS covers the cursor's getMores too
+        with self.borrow() as db, self._guarded(db) as left:
+            coll = db[cmd.get("collection", "")]
+            max_time = {"maxTimeMS": max(1, int(left * 1000))} if left is not None else {}
+            if operation == "find":
+                cursor = coll.find(cmd.get("filter", {}), cmd.get("projection", None))
+                if max_time:
+                    cursor = cursor.max_time_ms(max_time["maxTimeMS"])
+                if cmd.get("sort"):
+                    cursor = cursor.sort(list(cmd["sort"].items()))
+                if cmd.get("limit"):
+                    cursor = cursor.limit(cmd["limit"])
+                cursor = cursor.batch_size(batch_size)
+            else:
+                cursor = coll.aggregate(cmd.get("pipeline", []), batchSize=batch_size, **max_time)
+
+            try:
+                columns = None
+                batch = []
+                for doc in cursor:
+                    if columns is None:
+                        columns = list(doc.keys())
+                    batch.append([str(doc.get(c, "")) for c in columns])
+                    if len(batch) >= batch_size:
+                        yield columns, batch
+                        batch = []
+                if batch or columns is None:
+                    yield columns or [], batch
+            finally:
+                cursor.close()
 
     # --------------------------------------------------
     # Safety
@@ -213,11 +407,10 @@ class MongoAdapter(DatabaseAdapter):
         if "delete" not in op.lower():
             return None
 
-        self.connect()
-        coll = self._db[cmd.get("collection", "")]
-        filt = cmd.get("filter", {})
-        count = coll.count_documents(filt)
-        self.disconnect()
+        with self.borrow() as db:
+            coll = db[cmd.get("collection", "")]
+            filt = cmd.get("filter", {})
+            count = coll.count_documents(filt)
         return count
 
     # --------------------------------------------------
@@ -20,28 +20,57 @@ class MSSQLAdapter(DatabaseAdapter):
     # --------------------------------------------------
     # Connection
     # --------------------------------------------------
-    def connect(self):
+    def _create_connection(self):
         import pymssql
-        self._conn = pymssql.connect(
+        return pymssql.connect(
             server=self.config.get("host", "localhost"),
             port=int(self.config.get("port", 1433)),
             user=self.config.get("username", "sa"),
             password=self.config.get("password", ""),
             database=self.config.get("database", "master"),
+            autocommit=True,
         )
 
+    def _ping_connection(self, conn) -> bool:
+        cur = conn.cursor()
+        cur.execute("SELECT 1")
+        cur.fetchall()
+        cur.close()
+        return True
+
+    def _pool_settings(self) -> dict:
+        # Keep a couple of sessions warm: the TDS/TLS login dominates short queries
+        settings = super()._pool_settings()
+        if not self.config.get("pool_min_size"):
+            settings["min_size"] = 2
+        return settings
+
+    def connect(self):
+        # Warm the shared pool up to pool_min_size
+        self.pool.fill()
+
     def disconnect(self):
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        self.close_pool()
+
+    def replica_lag(self) -> float:
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            # Always On readable secondary; NULL outside an availability group
+            cur.execute("""
+                SELECT MAX(secondary_lag_seconds)
+                FROM sys.dm_hadr_database_replica_states
+                WHERE is_local = 1 AND database_id = DB_ID()
+            """)
+            row = cur.fetchone()
+            cur.close()
+        return float(row[0]) if row and row[0] is not None else 0.0
 
     def test_connection(self) -> bool:
         try:
-            self.connect()
-            cur = self._conn.cursor()
-            cur.execute("SELECT 1")
-            cur.close()
-            self.disconnect()
+            with self.borrow() as conn:
+                cur = conn.cursor()
+                cur.execute("SELECT 1")
+                cur.close()
             return True
         except Exception:
             return False
@@ -49,50 +78,50 @@ class MSSQLAdapter(DatabaseAdapter):
     # --------------------------------------------------
     # Schema
     # --------------------------------------------------
-    def get_schema(self) -> str:
-        self.connect()
-        cur = self._conn.cursor()
-
-        cur.execute("""
-            SELECT TABLE_NAME
-            FROM INFORMATION_SCHEMA.TABLES
-            WHERE TABLE_TYPE = 'BASE TABLE'
-            ORDER BY TABLE_NAME
-        """)
-        tables = [r[0] for r in cur.fetchall()]
-
-        schema = ""
-        for table_name in tables:
-            schema += f"\nTABLE {table_name}:\n"
-
-            # Columns with PK, NOT NULL, defaults
+    def schema_fingerprint(self):
+        # modify_date moves on every ALTER of a user object
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT COUNT(*), MAX(modify_date) FROM sys.objects WHERE is_ms_shipped = 0")
+            row = tuple(cur.fetchone())
+            cur.close()
+        return row
+
+    def _load_schema_model(self):
+        """
+        Columns (with PK flags and defaults), foreign keys and index
+        columns for every user table: one sys.* catalog query each.
+        """
+        model = {}
+        with self.borrow() as conn:
+            cur = conn.cursor()
+
             cur.execute("""
-                SELECT c.COLUMN_NAME, c.DATA_TYPE, c.IS_NULLABLE,
-                       c.COLUMN_DEFAULT,
-                       CASE WHEN pk.COLUMN_NAME IS NOT NULL THEN 1 ELSE 0 END
-                FROM INFORMATION_SCHEMA.COLUMNS c
+                SELECT t.name, c.name, ty.name, c.is_nullable,
+                       OBJECT_DEFINITION(c.default_object_id),
+                       CASE WHEN pk.column_id IS NOT NULL THEN 1 ELSE 0 END
+                FROM sys.tables t
+                JOIN sys.columns c ON c.object_id = t.object_id
+                JOIN sys.types ty ON ty.user_type_id = c.user_type_id
                 LEFT JOIN (
-                    SELECT kcu.COLUMN_NAME
-                    FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
-                    JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
-                        ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
-                    WHERE tc.CONSTRAINT_TYPE = 'PRIMARY KEY' AND tc.TABLE_NAME = %s
-                ) pk ON pk.COLUMN_NAME = c.COLUMN_NAME
-                WHERE c.TABLE_NAME = %s
-                ORDER BY c.ORDINAL_POSITION
-            """, (table_name, table_name))
-            col_info = cur.fetchall()
-            col_names = []
-            for col_name, dtype, nullable, default, is_pk in col_info:
-                col_names.append(col_name)
-                notnull = " NOT NULL" if nullable == "NO" else ""
-                default_str = f" DEFAULT {default}" if default else ""
-                pk_marker = " [PRIMARY KEY]" if is_pk else ""
-                schema += f"  - {col_name} ({dtype}{notnull}{default_str}{pk_marker})\n"
-
-            # Foreign keys
+                    SELECT ic.object_id, ic.column_id
+                    FROM sys.indexes i
+                    JOIN sys.index_columns ic ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+                    WHERE i.is_primary_key = 1
+                ) pk ON pk.object_id = c.object_id AND pk.column_id = c.column_id
+                WHERE t.is_ms_shipped = 0
+                ORDER BY t.name, c.column_id
+            """)
+            for table, col, dtype, nullable, default, is_pk in cur.fetchall():
+                info = model.setdefault(table, {"columns": [], "foreign_keys": [], "indexes": []})
+                info["columns"].append({
+                    "name": col, "type": dtype,
+                    "not_null": not nullable, "default": default,
+                    "primary_key": bool(is_pk),
+                })
+
             cur.execute("""
-                SELECT cp.name, tr.name, cr.name
+                SELECT tp.name, cp.name, tr.name, cr.name
                 FROM sys.foreign_key_columns fkc
                 JOIN sys.tables tp ON fkc.parent_object_id = tp.object_id
                 JOIN sys.columns cp ON fkc.parent_object_id = cp.object_id
@@ -100,288 +129,201 @@ class MSSQLAdapter(DatabaseAdapter):
                 JOIN sys.tables tr ON fkc.referenced_object_id = tr.object_id
                 JOIN sys.columns cr ON fkc.referenced_object_id = cr.object_id
                     AND fkc.referenced_column_id = cr.column_id
-                WHERE tp.name = %s
-            """, (table_name,))
-            fks = cur.fetchall()
-            if fks:
-                schema += "  FOREIGN KEYS:\n"
-                for fk_col, ref_table, ref_col in fks:
-                    schema += f"    - {fk_col} -> {ref_table}.{ref_col}\n"
+                ORDER BY tp.name, fkc.constraint_object_id, fkc.constraint_column_id
+            """)
+            for table, col, ref_table, ref_col in cur.fetchall():
+                if table in model:
+                    model[table]["foreign_keys"].append({"from": col, "to_table": ref_table, "to_column": ref_col})
 
-            # Indexes
             cur.execute("""
-                SELECT i.name, i.is_unique,
-                       STRING_AGG(c.name, ', ') WITHIN GROUP (ORDER BY ic.key_ordinal)
+                SELECT t.name, i.name, i.is_unique, i.is_primary_key, c.name
                 FROM sys.indexes i
                 JOIN sys.tables t ON i.object_id = t.object_id
                 JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
                 JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
-                WHERE t.name = %s AND i.name IS NOT NULL
-                GROUP BY i.name, i.is_unique
-            """, (table_name,))
-            indexes = cur.fetchall()
-            if indexes:
-                schema += "  INDEXES:\n"
-                for idx_name, is_unique, idx_cols in indexes:
-                    unique = "UNIQUE " if is_unique else ""
-                    schema += f"    - {unique}{idx_name} ({idx_cols})\n"
-
-            # Sample data (3 rows)
-            try:
-                cur.execute(f"SELECT TOP 3 * FROM [{table_name}]")
-                sample_rows = cur.fetchall()
-                if sample_rows and col_names:
-                    schema += f"  SAMPLE DATA ({len(sample_rows)} rows):\n"
-                    for sr in sample_rows:
-                        pairs = []
-                        for i, val in enumerate(sr):
-                            if i >= len(col_names):
-                                break
-                            if isinstance(val, (bytes, memoryview)):
-                                continue
-                            pairs.append(f"{col_names[i]}={str(val)[:60]}")
-                        schema += f"    {', '.join(pairs)}\n"
-            except Exception:
-                pass
+                WHERE i.name IS NOT NULL AND t.is_ms_shipped = 0 AND ic.is_included_column = 0
+                ORDER BY t.name, i.name, ic.key_ordinal
+            """)
+            indexes = {}
+            for table, idx_name, unique, primary, col in cur.fetchall():
+                if table not in model:
+                    continue
+                idx = indexes.get((table, idx_name))
+                if idx is None:
+                    idx = {"name": idx_name, "unique": bool(unique), "primary": bool(primary), "columns": []}
+                    indexes[(table, idx_name)] = idx
+                    model[table]["indexes"].append(idx)
+                idx["columns"].append(col)
 
-        cur.close()
-        self.disconnect()
-        return schema
+            cur.close()
+        return model
+
+    def get_schema(self) -> str:
+        model = self.schema_model()
+        samples = {}
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            for table_name in model:
+                # Sample data (3 rows)
+                try:
+                    cur.execute(f"SELECT TOP 3 * FROM [{table_name}]")
+                    samples[table_name] = cur.fetchall()
+                except Exception:
+                    pass
+            cur.close()
+        return self._render_schema(model, samples)
 
     def list_tables(self) -> list:
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute("""
-            SELECT TABLE_NAME
-            FROM INFORMATION_SCHEMA.TABLES
-            WHERE TABLE_TYPE = 'BASE TABLE'
-            ORDER BY TABLE_NAME
-        """)
-        tables = [row[0] for row in cur.fetchall()]
-        cur.close()
-        self.disconnect()
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                SELECT TABLE_NAME
+                FROM INFORMATION_SCHEMA.TABLES
+                WHERE TABLE_TYPE = 'BASE TABLE'
+                ORDER BY TABLE_NAME
+            """)
+            tables = [row[0] for row in cur.fetchall()]
+            cur.close()
         return tables
 
     # --------------------------------------------------
     # Execution
     # --------------------------------------------------
     def execute(self, query: str) -> tuple:
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute(query)
-
-        if cur.description:
-            columns = [desc[0] for desc in cur.description]
-            rows = [list(r) for r in cur.fetchall()]
-        else:
-            columns = []
-            rows = []
-
-        self._conn.commit()
-        cur.close()
-        self.disconnect()
+        replica = self.replica_for(query)
+        if replica is not self:
+            return replica.execute(query)
+        # No query_timeout here: pymssql applies it process-wide (dbsettime), so
+        # concurrent requests would overwrite each other's. The watchdog cancels.
+        with self.borrow() as conn, self._guarded(conn):
+            cur = conn.cursor()
+            cur.execute(query)
+
+            if cur.description:
+                columns = [desc[0] for desc in cur.description]
+                rows = [list(r) for r in cur.fetchall()]
+            else:
+                columns = []
+                rows = []
+
+            conn.commit()
+            cur.close()
         return columns, rows
 
+    def _cancel_statement(self, conn):
+        conn._conn.cancel()
+
+    def _is_timeout_error(self, exc) -> bool:
+        return "20003" in str(exc)   # "Adaptive Server connection timed out"
+
+    def execute_iter(self, query: str, batch_size: int = 1000):
+        replica = self.replica_for(query)
+        if replica is not self:
+            yield from replica.execute_iter(query, batch_size)
+            return
+        conn = self.get_connection()
+        drained = False
+        try:
+            # Guarded across the yields: the watchdog cancels the open result mid-stream
+            with self._guarded(conn):
+                cur = conn.cursor()
+                cur.execute(query)
+                if cur.description:
+                    columns = [desc[0] for desc in cur.description]
+                    yield columns, [list(r) for r in cur.fetchmany(batch_size)]
+                    for rows in iter(lambda: cur.fetchmany(batch_size), []):
+                        yield columns, [list(r) for r in rows]
+                else:
+                    yield [], []
+                conn.commit()
+                cur.close()
+            drained = True
+        finally:
+            # Unread TDS rows would poison the next borrower
+            if drained:
+                self.release_connection(conn)
+            else:
+                self._discard_connection(conn)
+
     # --------------------------------------------------
     # Introspection
     # --------------------------------------------------
-    def get_foreign_keys(self) -> list:
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute("""
-            SELECT
-                tp.name  AS from_table,
-                cp.name  AS from_column,
-                tr.name  AS to_table,
-                cr.name  AS to_column
-            FROM sys.foreign_key_columns fkc
-            JOIN sys.tables tp ON fkc.parent_object_id = tp.object_id
-            JOIN sys.columns cp ON fkc.parent_object_id = cp.object_id
-                AND fkc.parent_column_id = cp.column_id
-            JOIN sys.tables tr ON fkc.referenced_object_id = tr.object_id
-            JOIN sys.columns cr ON fkc.referenced_object_id = cr.object_id
-                AND fkc.referenced_column_id = cr.column_id
-        """)
-        results = [
-            {"from_table": r[0], "from_column": r[1],
-             "to_table": r[2], "to_column": r[3]}
-            for r in cur.fetchall()
-        ]
-        cur.close()
-        self.disconnect()
-        return results
-
-    def get_indexes(self) -> list:
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute("""
-            SELECT
-                t.name AS table_name,
-                i.name AS index_name,
-                i.is_unique,
-                STRING_AGG(c.name, ',') WITHIN GROUP (ORDER BY ic.key_ordinal) AS columns
-            FROM sys.indexes i
-            JOIN sys.tables t ON i.object_id = t.object_id
-            JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
-            JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
-            WHERE i.name IS NOT NULL AND t.is_ms_shipped = 0
-            GROUP BY t.name, i.name, i.is_unique
-            ORDER BY t.name, i.name
-        """)
-        results = [
-            {"table": r[0], "index_name": r[1],
-             "unique": bool(r[2]),
-             "columns": r[3].split(",") if r[3] else []}
-            for r in cur.fetchall()
-        ]
-        cur.close()
-        self.disconnect()
-        return results
-
     def describe_table(self, table_name: str) -> dict:
-        self.connect()
-        cur = self._conn.cursor()
-
-        # Columns
-        cur.execute("""
-            SELECT c.COLUMN_NAME, c.DATA_TYPE, c.IS_NULLABLE,
-                   c.COLUMN_DEFAULT,
-                   CASE WHEN pk.COLUMN_NAME IS NOT NULL THEN 1 ELSE 0 END AS is_pk
-            FROM INFORMATION_SCHEMA.COLUMNS c
-            LEFT JOIN (
-                SELECT kcu.COLUMN_NAME
-                FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
-                JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
-                    ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
-                WHERE tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
-                  AND tc.TABLE_NAME = %s
-            ) pk ON pk.COLUMN_NAME = c.COLUMN_NAME
-            WHERE c.TABLE_NAME = %s
-            ORDER BY c.ORDINAL_POSITION
-        """, (table_name, table_name))
-        columns = [
-            {"name": r[0], "type": r[1],
-             "not_null": r[2] == "NO",
-             "default": r[3], "primary_key": bool(r[4])}
-            for r in cur.fetchall()
-        ]
-
-        # Foreign keys
-        cur.execute("""
-            SELECT cp.name, tr.name, cr.name
-            FROM sys.foreign_key_columns fkc
-            JOIN sys.tables tp ON fkc.parent_object_id = tp.object_id
-            JOIN sys.columns cp ON fkc.parent_object_id = cp.object_id
-                AND fkc.parent_column_id = cp.column_id
-            JOIN sys.tables tr ON fkc.referenced_object_id = tr.object_id
-            JOIN sys.columns cr ON fkc.referenced_object_id = cr.object_id
-                AND fkc.referenced_column_id = cr.column_id
-            WHERE tp.name = %s
-        """, (table_name,))
-        fks = [{"from": r[0], "to_table": r[1], "to_column": r[2]}
-               for r in cur.fetchall()]
-
-        # Indexes
-        cur.execute("""
-            SELECT i.name, i.is_unique,
-                   STRING_AGG(c.name, ',') WITHIN GROUP (ORDER BY ic.key_ordinal)
-            FROM sys.indexes i
-            JOIN sys.tables t ON i.object_id = t.object_id
-            JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
-            JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
-            WHERE t.name = %s AND i.name IS NOT NULL
-            GROUP BY i.name, i.is_unique
-        """, (table_name,))
-        indexes = [
-            {"name": r[0], "unique": bool(r[1]),
-             "columns": r[2].split(",") if r[2] else []}
-            for r in cur.fetchall()
-        ]
-
-        # Row count
-        cur.execute(f"SELECT COUNT(*) FROM [{table_name}]")
-        row_count = cur.fetchone()[0]
+        info = self._describe_from_model(table_name)
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            # Row count
+            cur.execute(f"SELECT COUNT(*) FROM [{table_name}]")
+            info["row_count"] = cur.fetchone()[0]
+            cur.close()
+        return info
 
-        cur.close()
-        self.disconnect()
-        return {"table": table_name, "columns": columns,
-                "foreign_keys": fks, "indexes": indexes,
-                "row_count": row_count}
-
-    def get_constraints(self) -> list:
-        self.connect()
-        cur = self._conn.cursor()
-        constraints = []
-
-        cur.execute("""
-            SELECT tc.TABLE_NAME, tc.CONSTRAINT_TYPE, tc.CONSTRAINT_NAME,
-                   STRING_AGG(kcu.COLUMN_NAME, ', ') WITHIN GROUP (ORDER BY kcu.ORDINAL_POSITION)
-            FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
-            JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
-                ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
-            WHERE tc.CONSTRAINT_TYPE IN ('PRIMARY KEY', 'FOREIGN KEY', 'UNIQUE')
-            GROUP BY tc.TABLE_NAME, tc.CONSTRAINT_TYPE, tc.CONSTRAINT_NAME
-            ORDER BY tc.TABLE_NAME
-        """)
-        for r in cur.fetchall():
-            constraints.append({"table": r[0], "type": r[1], "details": f"{r[2]} ({r[3]})"})
-
-        # NOT NULL
-        cur.execute("""
-            SELECT TABLE_NAME, COLUMN_NAME
-            FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE IS_NULLABLE = 'NO'
-            ORDER BY TABLE_NAME, ORDINAL_POSITION
-        """)
-        for r in cur.fetchall():
-            constraints.append({"table": r[0], "type": "NOT NULL", "details": r[1]})
+    def _estimate_table_stats(self):
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            # Heap (0) or clustered index (1) partitions hold the rows
+            cur.execute("""
+                SELECT t.name,
+                       SUM(CASE WHEN ps.index_id IN (0, 1) THEN ps.row_count ELSE 0 END),
+                       SUM(ps.used_page_count) * 8192,
+                       (SELECT MAX(STATS_DATE(st.object_id, st.stats_id))
+                        FROM sys.stats st WHERE st.object_id = t.object_id)
+                FROM sys.tables t
+                JOIN sys.dm_db_partition_stats ps ON ps.object_id = t.object_id
+                WHERE t.is_ms_shipped = 0
+                GROUP BY t.name, t.object_id
+            """)
+            stats = {
+                name: {"rows": rows, "size_bytes": size, "last_analyzed": analyzed}
+                for name, rows, size, analyzed in cur.fetchall()
+            }
+            cur.close()
+        return stats
 
-        cur.close()
-        self.disconnect()
-        return constraints
+    def _count_rows(self, table_name: str) -> int:
+        _, rows = self.execute(f"SELECT COUNT(*) FROM [{table_name}]")
+        return rows[0][0] if rows else 0
 
     def get_create_table(self, table_name: str) -> str:
-        self.connect()
-        cur = self._conn.cursor()
-
-        cur.execute("""
-            SELECT c.COLUMN_NAME, c.DATA_TYPE, c.CHARACTER_MAXIMUM_LENGTH,
-                   c.IS_NULLABLE, c.COLUMN_DEFAULT
-            FROM INFORMATION_SCHEMA.COLUMNS c
-            WHERE c.TABLE_NAME = %s
-            ORDER BY c.ORDINAL_POSITION
-        """, (table_name,))
-        cols = cur.fetchall()
-        if not cols:
-            cur.close()
-            self.disconnect()
-            return f"-- Table '{table_name}' not found"
-
-        lines = []
-        for col_name, dtype, max_len, nullable, default in cols:
-            col_def = f"  [{col_name}] {dtype}"
-            if max_len and max_len > 0:
-                col_def += f"({max_len})"
-            if nullable == "NO":
-                col_def += " NOT NULL"
-            if default:
-                col_def += f" DEFAULT {default}"
-            lines.append(col_def)
-
-        # Primary key
-        cur.execute("""
-            SELECT STRING_AGG(kcu.COLUMN_NAME, ', ')
-            FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
-            JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
-                ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
-            WHERE tc.TABLE_NAME = %s AND tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
-        """, (table_name,))
-        pk_row = cur.fetchone()
-        if pk_row and pk_row[0]:
-            lines.append(f"  PRIMARY KEY ({pk_row[0]})")
+        with self.borrow() as conn:
+            cur = conn.cursor()
 
-        cur.close()
-        self.disconnect()
+            cur.execute("""
+                SELECT c.COLUMN_NAME, c.DATA_TYPE, c.CHARACTER_MAXIMUM_LENGTH,
+                       c.IS_NULLABLE, c.COLUMN_DEFAULT
+                FROM INFORMATION_SCHEMA.COLUMNS c
+                WHERE c.TABLE_NAME = %s
+                ORDER BY c.ORDINAL_POSITION
+            """, (table_name,))
+            cols = cur.fetchall()
+            if not cols:
+                cur.close()
+                return f"-- Table '{table_name}' not found"
+
+            lines = []
+            for col_name, dtype, max_len, nullable, default in cols:
+                col_def = f"  [{col_name}] {dtype}"
+                if max_len and max_len > 0:
+                    col_def += f"({max_len})"
+                if nullable == "NO":
+                    col_def += " NOT NULL"
+                if default:
+                    col_def += f" DEFAULT {default}"
+                lines.append(col_def)
+
+            # Primary key
+            cur.execute("""
+                SELECT STRING_AGG(kcu.COLUMN_NAME, ', ')
+                FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+                JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+                    ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+                WHERE tc.TABLE_NAME = %s AND tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
+            """, (table_name,))
+            pk_row = cur.fetchone()
+            if pk_row and pk_row[0]:
+                lines.append(f"  PRIMARY KEY ({pk_row[0]})")
+
+            cur.close()
         return f"CREATE TABLE [{table_name}] (\n" + ",\n".join(lines) + "\n);"
 
     # --------------------------------------------------
@@ -394,12 +336,11 @@ class MSSQLAdapter(DatabaseAdapter):
 
         # T-SQL: DELETE FROM x WHERE y → SELECT COUNT(*) FROM x WHERE y
         count_sql = q.lower().replace("delete", "select count(*)", 1)
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute(count_sql)
-        row = cur.fetchone()
-        cur.close()
-        self.disconnect()
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            cur.execute(count_sql)
+            row = cur.fetchone()
+            cur.close()
         return row[0] if row else 0
 
     # --------------------------------------------------
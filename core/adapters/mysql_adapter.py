@@ -19,19 +19,7 @@ class MySQLAdapter(DatabaseAdapter):
     # --------------------------------------------------
     # Connection
     # --------------------------------------------------
-    def __init__(self, config: dict):
-        super().__init__(config)
-        self._pool = None
-
-    def connect(self):
-        import pymysql
-        from queue import Queue
-        self._pool = Queue(maxsize=10)
-        
-        # Pre-fill with one connection
-        self._pool.put(self._create_new_conn())
-
-    def _create_new_conn(self):
+    def _create_connection(self):
         import pymysql
         return pymysql.connect(
             host=self.config.get("host", "localhost"),
@@ -44,33 +32,38 @@ class MySQLAdapter(DatabaseAdapter):
             autocommit=True
         )
 
+    def _ping_connection(self, conn) -> bool:
+        conn.ping(reconnect=False)
+        return True
+
+    def connect(self):
+        # Warm the shared pool up to pool_min_size
+        self.pool.fill()
+
     def disconnect(self):
-        if self._pool:
-            while not self._pool.empty():
-                conn = self._pool.get()
-                conn.close()
-            self._pool = None
-
-    def get_connection(self):
-        if not self._pool:
-            self.connect()
-        
-        if self._pool.empty():
-            return self._create_new_conn()
-        return self._pool.get()
-
-    def release_connection(self, conn):
-        if self._pool and not self._pool.full():
-            self._pool.put(conn)
-        else:
-            conn.close()
+        self.close_pool()
+
+    def replica_lag(self) -> float:
+        import pymysql
+        with self.borrow() as conn:
+            with conn.cursor(pymysql.cursors.DictCursor) as cur:
+                try:
+                    cur.execute("SHOW REPLICA STATUS")
+                except pymysql.err.ProgrammingError:
+                    # Before MySQL 8.0.22 / MariaDB 10.5
+                    cur.execute("SHOW SLAVE STATUS")
+                row = cur.fetchone()
+        if not row:
+            return 0.0
+        lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+        # NULL means the replication threads are stopped
+        return None if lag is None else float(lag)
 
     def test_connection(self) -> bool:
         try:
-            conn = self.get_connection()
-            with conn.cursor() as cur:
-                cur.execute("SELECT 1")
-            self.release_connection(conn)
+            with self.borrow() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT 1")
             return True
         except Exception:
             return False
@@ -78,88 +71,95 @@ class MySQLAdapter(DatabaseAdapter):
     # --------------------------------------------------
     # Schema
     # --------------------------------------------------
-    def get_schema(self) -> str:
+    def schema_fingerprint(self):
+        """Checksum over table names and their CREATE_TIME/UPDATE_TIME."""
         conn = self.get_connection()
         try:
             with conn.cursor() as cur:
-                db = self.config.get("database", "")
                 cur.execute("""
-                    SELECT TABLE_NAME
+                    SELECT COUNT(*), SUM(CRC32(CONCAT_WS('|', TABLE_NAME, CREATE_TIME, UPDATE_TIME)))
                     FROM INFORMATION_SCHEMA.TABLES
-                    WHERE TABLE_SCHEMA = %s AND TABLE_TYPE = 'BASE TABLE'
+                    WHERE TABLE_SCHEMA = %s
+                """, (self.config.get("database", ""),))
+                return tuple(cur.fetchone())
+        finally:
+            self.release_connection(conn)
+
+    def _load_schema_model(self):
+        """
+        Columns, foreign keys and index columns for the whole database in
+        one INFORMATION_SCHEMA pass per view, grouped in Python.
+        """
+        db = self.config.get("database", "")
+        model = {}
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT c.TABLE_NAME, c.COLUMN_NAME, c.COLUMN_TYPE,
+                           c.IS_NULLABLE, c.COLUMN_DEFAULT, c.COLUMN_KEY
+                    FROM INFORMATION_SCHEMA.COLUMNS c
+                    JOIN INFORMATION_SCHEMA.TABLES t
+                        ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME
+                    WHERE c.TABLE_SCHEMA = %s AND t.TABLE_TYPE = 'BASE TABLE'
+                    ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION
+                """, (db,))
+                for table, col, col_type, nullable, default, col_key in cur.fetchall():
+                    info = model.setdefault(table, {"columns": [], "foreign_keys": [], "indexes": []})
+                    info["columns"].append({
+                        "name": col, "type": col_type,
+                        "not_null": nullable == "NO", "default": default,
+                        "primary_key": col_key == "PRI",
+                    })
+
+                cur.execute("""
+                    SELECT TABLE_NAME, COLUMN_NAME, REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME
+                    FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
+                    WHERE TABLE_SCHEMA = %s AND REFERENCED_TABLE_NAME IS NOT NULL
+                    ORDER BY TABLE_NAME, CONSTRAINT_NAME, ORDINAL_POSITION
                 """, (db,))
-                tables = [r[0] for r in cur.fetchall()]
-
-                schema = ""
-                for table_name in tables:
-                    schema += f"\nTABLE {table_name}:\n"
-
-                    # Columns with PK, NOT NULL, defaults
-                    cur.execute("""
-                        SELECT COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE,
-                               COLUMN_DEFAULT, COLUMN_KEY
-                        FROM INFORMATION_SCHEMA.COLUMNS
-                        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-                        ORDER BY ORDINAL_POSITION
-                    """, (db, table_name))
-                    col_info = cur.fetchall()
-                    col_names = []
-                    for col_name, col_type, nullable, default, col_key in col_info:
-                        col_names.append(col_name)
-                        notnull = " NOT NULL" if nullable == "NO" else ""
-                        default_str = f" DEFAULT {default}" if default is not None else ""
-                        pk_marker = " [PRIMARY KEY]" if col_key == "PRI" else ""
-                        schema += f"  - {col_name} ({col_type}{notnull}{default_str}{pk_marker})\n"
-
-                    # Foreign keys
-                    cur.execute("""
-                        SELECT COLUMN_NAME, REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME
-                        FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
-                        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-                          AND REFERENCED_TABLE_NAME IS NOT NULL
-                    """, (db, table_name))
-                    fks = cur.fetchall()
-                    if fks:
-                        schema += "  FOREIGN KEYS:\n"
-                        for fk_col, ref_table, ref_col in fks:
-                            schema += f"    - {fk_col} -> {ref_table}.{ref_col}\n"
-
-                    # Indexes
-                    cur.execute("""
-                        SELECT INDEX_NAME, NON_UNIQUE,
-                               GROUP_CONCAT(COLUMN_NAME ORDER BY SEQ_IN_INDEX)
-                        FROM INFORMATION_SCHEMA.STATISTICS
-                        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-                        GROUP BY INDEX_NAME, NON_UNIQUE
-                    """, (db, table_name))
-                    indexes = cur.fetchall()
-                    if indexes:
-                        schema += "  INDEXES:\n"
-                        for idx_name, non_unique, idx_cols in indexes:
-                            unique = "" if non_unique else "UNIQUE "
-                            schema += f"    - {unique}{idx_name} ({idx_cols})\n"
+                for table, col, ref_table, ref_col in cur.fetchall():
+                    if table in model:
+                        model[table]["foreign_keys"].append({"from": col, "to_table": ref_table, "to_column": ref_col})
+
+                # One row per index column (no GROUP_CONCAT length cap)
+                cur.execute("""
+                    SELECT TABLE_NAME, INDEX_NAME, NON_UNIQUE, COLUMN_NAME
+                    FROM INFORMATION_SCHEMA.STATISTICS
+                    WHERE TABLE_SCHEMA = %s AND COLUMN_NAME IS NOT NULL
+                    ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+                """, (db,))
+                indexes = {}
+                for table, idx_name, non_unique, col in cur.fetchall():
+                    if table not in model:
+                        continue
+                    idx = indexes.get((table, idx_name))
+                    if idx is None:
+                        idx = {"name": idx_name, "unique": not non_unique,
+                               "primary": idx_name == "PRIMARY", "columns": []}
+                        indexes[(table, idx_name)] = idx
+                        model[table]["indexes"].append(idx)
+                    idx["columns"].append(col)
+        finally:
+            self.release_connection(conn)
+        return model
 
+    def get_schema(self) -> str:
+        model = self.schema_model()
+        samples = {}
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                for table_name in model:
                     # Sample data (3 rows)
                     try:
                         cur.execute(f"SELECT * FROM `{table_name}` LIMIT 3")
-                        sample_rows = cur.fetchall()
-                        if sample_rows and col_names:
-                            schema += f"  SAMPLE DATA ({len(sample_rows)} rows):\n"
-                            for sr in sample_rows:
-                                pairs = []
-                                for i, val in enumerate(sr):
-                                    if i >= len(col_names):
-                                        break
-                                    if isinstance(val, (bytes, memoryview)):
-                                        continue
-                                    pairs.append(f"{col_names[i]}={str(val)[:60]}")
-                                schema += f"    {', '.join(pairs)}\n"
+                        samples[table_name] = cur.fetchall()
                     except Exception:
                         pass
-
-                return schema
         finally:
             self.release_connection(conn)
+        return self._render_schema(model, samples)
 
     def list_tables(self) -> list:
         conn = self.get_connection()
@@ -179,9 +179,20 @@ class MySQLAdapter(DatabaseAdapter):
     # Execution
     # --------------------------------------------------
     def execute(self, query: str) -> tuple:
+        replica = self.replica_for(query)
+        if replica is not self:
+            return replica.execute(query)
         conn = self.get_connection()
+        timeout_set = False
         try:
-            with conn.cursor() as cur:
+            with self._guarded(conn) as left, conn.cursor() as cur:
+                if left is not None:
+                    # SELECTs only, and MySQL 5.7.8+; KILL QUERY covers the rest
+                    try:
+                        cur.execute("SET SESSION max_execution_time = %s", (max(1, int(left * 1000)),))
+                        timeout_set = True
+                    except Exception:
+                        pass
                 cur.execute(query)
                 if cur.description:
                     columns = [desc[0] for desc in cur.description]
@@ -191,7 +202,63 @@ class MySQLAdapter(DatabaseAdapter):
                     rows = []
                 return columns, rows
         finally:
-            self.release_connection(conn)
+            if timeout_set and not self._clear_statement_timeout(conn):
+                self._discard_connection(conn)
+            else:
+                self.release_connection(conn)
+
+    def _clear_statement_timeout(self, conn) -> bool:
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SET SESSION max_execution_time = DEFAULT")
+            return True
+        except Exception:
+            return False
+
+    def _cancel_statement(self, conn):
+        # The busy connection can't take commands; KILL QUERY from a fresh one
+        killer = self._create_connection()
+        try:
+            with killer.cursor() as cur:
+                cur.execute("KILL QUERY %s", (conn.thread_id(),))
+        finally:
+            killer.close()
+
+    def _is_timeout_error(self, exc) -> bool:
+        # 3024: max_execution_time exceeded, 1317: query interrupted
+        return bool(exc.args) and exc.args[0] in (3024, 1317)
+
+    def execute_iter(self, query: str, batch_size: int = 1000):
+        replica = self.replica_for(query)
+        if replica is not self:
+            yield from replica.execute_iter(query, batch_size)
+            return
+        import pymysql
+        conn = self.get_connection()
+        drained = False
+        try:
+            # Guarded across the yields: an unbuffered query runs until its
+            # last row is read, so KILL QUERY stops the stream
+            with self._guarded(conn):
+                # Unbuffered cursor: rows stay on the server until fetched
+                cur = conn.cursor(pymysql.cursors.SSCursor)
+                cur.execute(query)
+                if cur.description:
+                    columns = [desc[0] for desc in cur.description]
+                    yield columns, [list(r) for r in cur.fetchmany(batch_size)]
+                    for rows in iter(lambda: cur.fetchmany(batch_size), []):
+                        yield columns, [list(r) for r in rows]
+                else:
+                    yield [], []
+                cur.close()
+            drained = True
+        finally:
+            # An abandoned unbuffered result leaves the socket mid-stream
+            if drained:
+                self.release_connection(conn)
+            else:
+                self._discard_connection(conn)
+
     def dry_run(self, query: str) -> dict:
         conn = self.get_connection()
         try:
@@ -219,140 +286,57 @@ class MySQLAdapter(DatabaseAdapter):
     # --------------------------------------------------
     # Introspection
     # --------------------------------------------------
-    def get_foreign_keys(self) -> list:
+    def describe_table(self, table_name: str) -> dict:
+        info = self._describe_from_model(table_name)
         conn = self.get_connection()
         try:
             with conn.cursor() as cur:
-                db = self.config.get("database", "")
-                cur.execute("""
-                    SELECT TABLE_NAME, COLUMN_NAME,
-                           REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME
-                    FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
-                    WHERE TABLE_SCHEMA = %s
-                      AND REFERENCED_TABLE_NAME IS NOT NULL
-                """, (db,))
-                return [
-                    {"from_table": r[0], "from_column": r[1],
-                     "to_table": r[2], "to_column": r[3]}
-                    for r in cur.fetchall()
-                ]
+                # Row count
+                cur.execute(f"SELECT COUNT(*) FROM `{table_name}`")
+                info["row_count"] = cur.fetchone()[0]
         finally:
             self.release_connection(conn)
+        return info
 
-    def get_indexes(self) -> list:
+    def _estimate_table_stats(self):
         conn = self.get_connection()
         try:
             with conn.cursor() as cur:
-                db = self.config.get("database", "")
+                # TABLE_ROWS is InnoDB's sampled estimate
                 cur.execute("""
-                    SELECT TABLE_NAME, INDEX_NAME, NON_UNIQUE,
-                           GROUP_CONCAT(COLUMN_NAME ORDER BY SEQ_IN_INDEX)
-                    FROM INFORMATION_SCHEMA.STATISTICS
-                    WHERE TABLE_SCHEMA = %s
-                    GROUP BY TABLE_NAME, INDEX_NAME, NON_UNIQUE
-                    ORDER BY TABLE_NAME, INDEX_NAME
-                """, (db,))
-                return [
-                    {"table": r[0], "index_name": r[1],
-                     "unique": not bool(r[2]),
-                     "columns": r[3].split(",") if r[3] else []}
-                    for r in cur.fetchall()
-                ]
-        finally:
-            self.release_connection(conn)
-
-    def describe_table(self, table_name: str) -> dict:
-        conn = self.get_connection()
-        try:
-            with conn.cursor() as cur:
-                db = self.config.get("database", "")
-
-                # Columns
-                cur.execute("""
-                    SELECT COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE,
-                           COLUMN_DEFAULT, COLUMN_KEY
-                    FROM INFORMATION_SCHEMA.COLUMNS
-                    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-                    ORDER BY ORDINAL_POSITION
-                """, (db, table_name))
-                columns = [
-                    {"name": r[0], "type": r[1],
-                     "not_null": r[2] == "NO",
-                     "default": r[3], "primary_key": r[4] == "PRI"}
-                    for r in cur.fetchall()
-                ]
-
-                # Foreign keys
-                cur.execute("""
-                    SELECT COLUMN_NAME, REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME
-                    FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
-                    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-                      AND REFERENCED_TABLE_NAME IS NOT NULL
-                """, (db, table_name))
-                fks = [{"from": r[0], "to_table": r[1], "to_column": r[2]}
-                       for r in cur.fetchall()]
-
-                # Indexes
-                cur.execute("""
-                    SELECT INDEX_NAME, NON_UNIQUE,
-                           GROUP_CONCAT(COLUMN_NAME ORDER BY SEQ_IN_INDEX)
-                    FROM INFORMATION_SCHEMA.STATISTICS
-                    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-                    GROUP BY INDEX_NAME, NON_UNIQUE
-                """, (db, table_name))
-                indexes = [
-                    {"name": r[0], "unique": not bool(r[1]),
-                     "columns": r[2].split(",") if r[2] else []}
-                    for r in cur.fetchall()
-                ]
-
-                # Row count
-                cur.execute(f"SELECT COUNT(*) FROM `{table_name}`")
-                row_count = cur.fetchone()[0]
-
-                return {"table": table_name, "columns": columns,
-                        "foreign_keys": fks, "indexes": indexes,
-                        "row_count": row_count}
+                    SELECT TABLE_NAME, TABLE_ROWS, DATA_LENGTH + INDEX_LENGTH
+                    FROM INFORMATION_SCHEMA.TABLES
+                    WHERE TABLE_SCHEMA = %s AND TABLE_TYPE = 'BASE TABLE'
+                """, (self.config.get("database", ""),))
+                return {
+                    name: {"rows": rows, "size_bytes": size, "last_analyzed": None}
+                    for name, rows, size in cur.fetchall()
+                }
         finally:
             self.release_connection(conn)
 
-    def get_constraints(self) -> list:
+    def estimate_query_rows(self, query: str):
+        import pymysql
         conn = self.get_connection()
         try:
-            with conn.cursor() as cur:
-                db = self.config.get("database", "")
-                constraints = []
-
-                # PK, FK, UNIQUE
-                cur.execute("""
-                    SELECT tc.TABLE_NAME, tc.CONSTRAINT_TYPE, tc.CONSTRAINT_NAME,
-                           GROUP_CONCAT(kcu.COLUMN_NAME ORDER BY kcu.ORDINAL_POSITION)
-                    FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
-                    JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
-                        ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
-                        AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA
-                        AND tc.TABLE_NAME = kcu.TABLE_NAME
-                    WHERE tc.TABLE_SCHEMA = %s
-                      AND tc.CONSTRAINT_TYPE IN ('PRIMARY KEY', 'FOREIGN KEY', 'UNIQUE')
-                    GROUP BY tc.TABLE_NAME, tc.CONSTRAINT_TYPE, tc.CONSTRAINT_NAME
-                    ORDER BY tc.TABLE_NAME
-                """, (db,))
-                for r in cur.fetchall():
-                    constraints.append({"table": r[0], "type": r[1], "details": f"{r[2]} ({r[3]})"})
-
-                # NOT NULL
-                cur.execute("""
-                    SELECT TABLE_NAME, COLUMN_NAME
-                    FROM INFORMATION_SCHEMA.COLUMNS
-                    WHERE TABLE_SCHEMA = %s AND IS_NULLABLE = 'NO'
-                    ORDER BY TABLE_NAME, ORDINAL_POSITION
-                """, (db,))
-                for r in cur.fetchall():
-                    constraints.append({"table": r[0], "type": "NOT NULL", "details": r[1]})
-
-                return constraints
+            with conn.cursor(pymysql.cursors.DictCursor) as cur:
+                cur.execute(f"EXPLAIN {query.rstrip(';')}")
+                plan = cur.fetchall()
         finally:
             self.release_connection(conn)
+        # Rows examined per step, scaled by the estimated filter ratio;
+        # nested-loop joins multiply
+        steps = [p for p in plan if p.get("select_type") in ("SIMPLE", "PRIMARY") and p.get("rows") is not None]
+        if not steps:
+            return None
+        estimate = 1.0
+        for step in steps:
+            estimate *= step["rows"] * float(step.get("filtered") or 100) / 100
+        return int(estimate)
+
+    def _count_rows(self, table_name: str) -> int:
+        _, rows = self.execute(f"SELECT COUNT(*) FROM `{table_name}`")
+        return rows[0][0] if rows else 0
 
     def get_create_table(self, table_name: str) -> str:
         conn = self.get_connection()
@@ -6,6 +6,45 @@ Uses oracledb (thin mode — no Instant Client required).
 from core.adapters.base import DatabaseAdapter
 
 
+class OracleSessionPool:
+    """
+    oracledb's native session pool behind the ConnectionPool interface
+    used by DatabaseAdapter (acquire/release/discard/fill/close/stats).
+    The driver handles sizing, timed waits, pinging and session lifetime.
+    """
+
+    min_size = 0   # the driver opens its own `min` sessions; no warm-up thread
+
+    def __init__(self, pool):
+        self._pool = pool
+
+    def acquire(self):
+        return self._pool.acquire()
+
+    def release(self, conn):
+        self._pool.release(conn)
+
+    def discard(self, conn):
+        self._pool.drop(conn)
+
+    def fill(self):
+        pass
+
+    def close(self):
+        self._pool.close(force=True)
+
+    def stats(self) -> dict:
+        return {
+            "size": self._pool.opened,
+            "idle": self._pool.opened - self._pool.busy,
+            "in_use": self._pool.busy,
+            "min_size": self._pool.min,
+            "max_size": self._pool.max,
+            "increment": self._pool.increment,
+            "stmt_cache_size": self._pool.stmtcachesize,
+        }
+
+
 class OracleAdapter(DatabaseAdapter):
 
     @property
@@ -15,27 +54,69 @@ class OracleAdapter(DatabaseAdapter):
     # --------------------------------------------------
     # Connection
     # --------------------------------------------------
-    def connect(self):
+    DEFAULT_ARRAYSIZE = 1000        # rows per fetch round trip (driver default is 100)
+    DEFAULT_STMT_CACHE_SIZE = 50
+
+    def _dsn(self) -> str:
+        return f"{self.config.get('host', 'localhost')}:{self.config.get('port', 1521)}/{self.config.get('service_name', 'XEPDB1')}"
+
+    def _build_pool(self):
         import oracledb
-        dsn = f"{self.config.get('host', 'localhost')}:{self.config.get('port', 1521)}/{self.config.get('service_name', 'XEPDB1')}"
-        self._conn = oracledb.connect(
+        settings = self._pool_settings()
+        pool = oracledb.create_pool(
             user=self.config.get("username", "system"),
             password=self.config.get("password", ""),
-            dsn=dsn,
+            dsn=self._dsn(),
+            min=settings["min_size"],
+            max=settings["max_size"],
+            increment=int(self.config.get("pool_increment") or 1),
+            getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+            wait_timeout=int(settings["timeout"] * 1000),
+            timeout=int(settings["idle_timeout"]),
+            max_lifetime_session=int(settings["max_lifetime"]),
+            ping_interval=60,
+            stmtcachesize=int(self.config.get("stmt_cache_size") or self.DEFAULT_STMT_CACHE_SIZE),
         )
+        return OracleSessionPool(pool)
+
+    def _tune_cursor(self, cur, arraysize=None, prefetchrows=None):
+        """Size fetch round trips: per-query values win over the connection config."""
+        cur.arraysize = int(arraysize or self.config.get("arraysize") or self.DEFAULT_ARRAYSIZE)
+        cur.prefetchrows = int(prefetchrows or self.config.get("prefetchrows") or cur.arraysize + 1)
+        return cur
+
+    def connect(self):
+        # create_pool opens pool_min_size sessions itself
+        self.pool.fill()
 
     def disconnect(self):
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        self.close_pool()
+
+    def replica_lag(self) -> float:
+        import oracledb
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            try:
+                # Active Data Guard standby, e.g. '+00 00:00:05'
+                cur.execute("SELECT value FROM v$dataguard_stats WHERE name = 'apply lag'")
+                row = cur.fetchone()
+            except oracledb.DatabaseError:
+                # No access to v$ views: reachable is the best we know
+                row = None
+            finally:
+                cur.close()
+        if not row or not row[0]:
+            return 0.0
+        days, _, clock = row[0].lstrip("+").partition(" ")
+        h, m, sec = (clock or "0:0:0").split(":")
+        return int(days or 0) * 86400 + int(h) * 3600 + int(m) * 60 + float(sec)
 
     def test_connection(self) -> bool:
         try:
-            self.connect()
-            cur = self._conn.cursor()
-            cur.execute("SELECT 1 FROM DUAL")
-            cur.close()
-            self.disconnect()
+            with self.borrow() as conn:
+                cur = conn.cursor()
+                cur.execute("SELECT 1 FROM DUAL")
+                cur.close()
             return True
         except Exception:
             return False
@@ -43,311 +124,243 @@ class OracleAdapter(DatabaseAdapter):
     # --------------------------------------------------
     # Schema
     # --------------------------------------------------
-    def get_schema(self) -> str:
-        self.connect()
-        cur = self._conn.cursor()
-
-        cur.execute("SELECT table_name FROM user_tables ORDER BY table_name")
-        tables = [r[0] for r in cur.fetchall()]
-
-        schema = ""
-        for table_name in tables:
-            schema += f"\nTABLE {table_name}:\n"
+    def schema_fingerprint(self):
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT COUNT(*), MAX(last_ddl_time) FROM user_objects")
+            row = tuple(cur.fetchone())
+            cur.close()
+        return row
+
+    def _load_schema_model(self):
+        """
+        Columns (with PK flags and defaults), foreign keys and index
+        columns for every table the user owns: one user_* dictionary
+        query each, instead of three per table.
+        """
+        model = {}
+        with self.borrow() as conn:
+            cur = self._tune_cursor(conn.cursor())
 
-            # Columns with PK, NOT NULL, defaults
             cur.execute("""
-                SELECT c.column_name, c.data_type, c.nullable, c.data_default,
+                SELECT c.table_name, c.column_name, c.data_type, c.nullable, c.data_default,
                        CASE WHEN pk.column_name IS NOT NULL THEN 1 ELSE 0 END
                 FROM user_tab_columns c
+                JOIN user_tables t ON t.table_name = c.table_name
                 LEFT JOIN (
-                    SELECT cc.column_name
+                    SELECT cc.table_name, cc.column_name
                     FROM user_cons_columns cc
                     JOIN user_constraints uc ON cc.constraint_name = uc.constraint_name
-                    WHERE uc.constraint_type = 'P' AND uc.table_name = :1
-                ) pk ON pk.column_name = c.column_name
-                WHERE c.table_name = :2
-                ORDER BY c.column_id
-            """, (table_name, table_name))
-            col_info = cur.fetchall()
-            col_names = []
-            for col_name, dtype, nullable, default, is_pk in col_info:
-                col_names.append(col_name)
-                notnull = " NOT NULL" if nullable == "N" else ""
-                default_str = f" DEFAULT {str(default).strip()}" if default else ""
-                pk_marker = " [PRIMARY KEY]" if is_pk else ""
-                schema += f"  - {col_name} ({dtype}{notnull}{default_str}{pk_marker})\n"
-
-            # Foreign keys
+                    WHERE uc.constraint_type = 'P'
+                ) pk ON pk.table_name = c.table_name AND pk.column_name = c.column_name
+                ORDER BY c.table_name, c.column_id
+            """)
+            for table, col, dtype, nullable, default, is_pk in cur.fetchall():
+                info = model.setdefault(table, {"columns": [], "foreign_keys": [], "indexes": []})
+                info["columns"].append({
+                    "name": col, "type": dtype,
+                    "not_null": nullable == "N",
+                    # data_default is a LONG with trailing whitespace/newlines
+                    "default": str(default).strip() if default is not None else None,
+                    "primary_key": bool(is_pk),
+                })
+
             cur.execute("""
-                SELECT a.column_name, c_pk.table_name, b.column_name
-                FROM user_cons_columns a
-                JOIN user_constraints c ON a.constraint_name = c.constraint_name
-                JOIN user_cons_columns b ON c.r_constraint_name = b.constraint_name
-                JOIN user_constraints c_pk ON c.r_constraint_name = c_pk.constraint_name
-                WHERE c.constraint_type = 'R' AND c.table_name = :1
-            """, (table_name,))
-            fks = cur.fetchall()
-            if fks:
-                schema += "  FOREIGN KEYS:\n"
-                for fk_col, ref_table, ref_col in fks:
-                    schema += f"    - {fk_col} -> {ref_table}.{ref_col}\n"
-
-            # Indexes
+                SELECT c.table_name, a.column_name, c_pk.table_name, b.column_name
+                FROM user_constraints c
+                JOIN user_cons_columns a ON a.constraint_name = c.constraint_name
+                JOIN user_constraints c_pk ON c_pk.constraint_name = c.r_constraint_name
+                JOIN user_cons_columns b ON b.constraint_name = c.r_constraint_name
+                    AND b.position = a.position
+                WHERE c.constraint_type = 'R'
+                ORDER BY c.table_name, c.constraint_name, a.position
+            """)
+            for table, col, ref_table, ref_col in cur.fetchall():
+                if table in model:
+                    model[table]["foreign_keys"].append({"from": col, "to_table": ref_table, "to_column": ref_col})
+
             cur.execute("""
-                SELECT i.index_name, i.uniqueness,
-                       LISTAGG(ic.column_name, ', ') WITHIN GROUP (ORDER BY ic.column_position)
+                SELECT i.table_name, i.index_name, i.uniqueness,
+                       CASE WHEN pk.constraint_name IS NOT NULL THEN 1 ELSE 0 END,
+                       ic.column_name
                 FROM user_indexes i
-                JOIN user_ind_columns ic ON i.index_name = ic.index_name
-                WHERE i.table_name = :1
-                GROUP BY i.index_name, i.uniqueness
-            """, (table_name,))
-            indexes = cur.fetchall()
-            if indexes:
-                schema += "  INDEXES:\n"
-                for idx_name, uniqueness, idx_cols in indexes:
-                    unique = "UNIQUE " if uniqueness == "UNIQUE" else ""
-                    schema += f"    - {unique}{idx_name} ({idx_cols})\n"
-
-            # Sample data (3 rows)
-            try:
-                cur.execute(f'SELECT * FROM "{table_name}" WHERE ROWNUM <= 3')
-                sample_rows = cur.fetchall()
-                if sample_rows and col_names:
-                    schema += f"  SAMPLE DATA ({len(sample_rows)} rows):\n"
-                    for sr in sample_rows:
-                        pairs = []
-                        for i, val in enumerate(sr):
-                            if i >= len(col_names):
-                                break
-                            if isinstance(val, (bytes, memoryview)):
-                                continue
-                            pairs.append(f"{col_names[i]}={str(val)[:60]}")
-                        schema += f"    {', '.join(pairs)}\n"
-            except Exception:
-                pass
-
-        cur.close()
-        self.disconnect()
-        return schema
+                JOIN user_ind_columns ic ON ic.index_name = i.index_name
+                LEFT JOIN user_constraints pk
+                    ON pk.index_name = i.index_name AND pk.constraint_type = 'P'
+                ORDER BY i.table_name, i.index_name, ic.column_position
+            """)
+            indexes = {}
+            for table, idx_name, uniqueness, primary, col in cur.fetchall():
+                if table not in model:
+                    continue
+                idx = indexes.get((table, idx_name))
+                if idx is None:
+                    idx = {"name": idx_name, "unique": uniqueness == "UNIQUE",
+                           "primary": bool(primary), "columns": []}
+                    indexes[(table, idx_name)] = idx
+                    model[table]["indexes"].append(idx)
+                idx["columns"].append(col)
+
+            cur.close()
+        return model
+
+    def get_schema(self) -> str:
+        model = self.schema_model()
+        samples = {}
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            for table_name in model:
+                # Sample data (3 rows)
+                try:
+                    cur.execute(f'SELECT * FROM "{table_name}" WHERE ROWNUM <= 3')
+                    samples[table_name] = cur.fetchall()
+                except Exception:
+                    pass
+            cur.close()
+        return self._render_schema(model, samples)
 
     def list_tables(self) -> list:
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute("SELECT table_name FROM user_tables ORDER BY table_name")
-        tables = [row[0] for row in cur.fetchall()]
-        cur.close()
-        self.disconnect()
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT table_name FROM user_tables ORDER BY table_name")
+            tables = [row[0] for row in cur.fetchall()]
+            cur.close()
         return tables
 
     # --------------------------------------------------
     # Execution
     # --------------------------------------------------
-    def execute(self, query: str) -> tuple:
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute(query)
-
-        if cur.description:
-            columns = [desc[0] for desc in cur.description]
-            rows = [list(r) for r in cur.fetchall()]
-        else:
-            columns = []
-            rows = []
-
-        self._conn.commit()
-        cur.close()
-        self.disconnect()
+    def execute(self, query: str, arraysize: int = None, prefetchrows: int = None) -> tuple:
+        replica = self.replica_for(query)
+        if replica is not self:
+            return replica.execute(query, arraysize, prefetchrows)
+        with self.borrow() as conn, self._guarded(conn) as left:
+            if left is not None:
+                # Bounds every round trip; the server aborts the call when it fires
+                conn.call_timeout = max(1, int(left * 1000))
+            try:
+                cur = self._tune_cursor(conn.cursor(), arraysize, prefetchrows)
+                cur.execute(query)
+
+                if cur.description:
+                    columns = [desc[0] for desc in cur.description]
+                    rows = [list(r) for r in cur.fetchall()]
+                else:
+                    columns = []
+                    rows = []
+
+                conn.commit()
+                cur.close()
+            finally:
+                if left is not None:
+                    conn.call_timeout = 0
         return columns, rows
 
+    def _cancel_statement(self, conn):
+        conn.cancel()
+
+    def _is_timeout_error(self, exc) -> bool:
+        # DPI-1067: call timeout exceeded, ORA-01013: user requested cancel
+        return any(code in str(exc) for code in ("DPI-1067", "ORA-01013"))
+
+    def execute_iter(self, query: str, batch_size: int = 1000):
+        replica = self.replica_for(query)
+        if replica is not self:
+            yield from replica.execute_iter(query, batch_size)
+            return
+        # Guarded across the yields; call_timeout bounds each fetch round trip
+        with self.borrow() as conn, self._guarded(conn) as left:
+            if left is not None:
+                conn.call_timeout = max(1, int(left * 1000))
+            cur = self._tune_cursor(conn.cursor(), batch_size, batch_size + 1)
+            try:
+                cur.execute(query)
+                if not cur.description:
+                    conn.commit()
+                    yield [], []
+                    return
+                columns = [desc[0] for desc in cur.description]
+                yield columns, [list(r) for r in cur.fetchmany(batch_size)]
+                for rows in iter(lambda: cur.fetchmany(batch_size), []):
+                    yield columns, [list(r) for r in rows]
+            finally:
+                cur.close()
+                if left is not None:
+                    conn.call_timeout = 0
+
     # --------------------------------------------------
     # Introspection
     # --------------------------------------------------
-    def get_foreign_keys(self) -> list:
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute("""
-            SELECT a.table_name, a.column_name,
-                   c_pk.table_name, b.column_name
-            FROM user_cons_columns a
-            JOIN user_constraints c ON a.constraint_name = c.constraint_name
-            JOIN user_cons_columns b ON c.r_constraint_name = b.constraint_name
-            JOIN user_constraints c_pk ON c.r_constraint_name = c_pk.constraint_name
-            WHERE c.constraint_type = 'R'
-            ORDER BY a.table_name
-        """)
-        results = [
-            {"from_table": r[0], "from_column": r[1],
-             "to_table": r[2], "to_column": r[3]}
-            for r in cur.fetchall()
-        ]
-        cur.close()
-        self.disconnect()
-        return results
-
-    def get_indexes(self) -> list:
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute("""
-            SELECT i.table_name, i.index_name, i.uniqueness,
-                   LISTAGG(ic.column_name, ',') WITHIN GROUP (ORDER BY ic.column_position)
-            FROM user_indexes i
-            JOIN user_ind_columns ic ON i.index_name = ic.index_name
-            GROUP BY i.table_name, i.index_name, i.uniqueness
-            ORDER BY i.table_name, i.index_name
-        """)
-        results = [
-            {"table": r[0], "index_name": r[1],
-             "unique": r[2] == "UNIQUE",
-             "columns": r[3].split(",") if r[3] else []}
-            for r in cur.fetchall()
-        ]
-        cur.close()
-        self.disconnect()
-        return results
-
     def describe_table(self, table_name: str) -> dict:
-        self.connect()
-        cur = self._conn.cursor()
-        tn = table_name.upper()
-
-        # Columns
-        cur.execute("""
-            SELECT c.column_name, c.data_type, c.nullable,
-                   c.data_default,
-                   CASE WHEN pk.column_name IS NOT NULL THEN 1 ELSE 0 END
-            FROM user_tab_columns c
-            LEFT JOIN (
-                SELECT cc.column_name
-                FROM user_cons_columns cc
-                JOIN user_constraints uc ON cc.constraint_name = uc.constraint_name
-                WHERE uc.constraint_type = 'P' AND uc.table_name = :1
-            ) pk ON pk.column_name = c.column_name
-            WHERE c.table_name = :2
-            ORDER BY c.column_id
-        """, (tn, tn))
-        columns = [
-            {"name": r[0], "type": r[1],
-             "not_null": r[2] == "N",
-             "default": r[3], "primary_key": bool(r[4])}
-            for r in cur.fetchall()
-        ]
-
-        # Foreign keys
-        cur.execute("""
-            SELECT a.column_name, c_pk.table_name, b.column_name
-            FROM user_cons_columns a
-            JOIN user_constraints c ON a.constraint_name = c.constraint_name
-            JOIN user_cons_columns b ON c.r_constraint_name = b.constraint_name
-            JOIN user_constraints c_pk ON c.r_constraint_name = c_pk.constraint_name
-            WHERE c.constraint_type = 'R' AND c.table_name = :1
-        """, (tn,))
-        fks = [{"from": r[0], "to_table": r[1], "to_column": r[2]}
-               for r in cur.fetchall()]
-
-        # Indexes
-        cur.execute("""
-            SELECT i.index_name, i.uniqueness,
-                   LISTAGG(ic.column_name, ',') WITHIN GROUP (ORDER BY ic.column_position)
-            FROM user_indexes i
-            JOIN user_ind_columns ic ON i.index_name = ic.index_name
-            WHERE i.table_name = :1
-            GROUP BY i.index_name, i.uniqueness
-        """, (tn,))
-        indexes = [
-            {"name": r[0], "unique": r[1] == "UNIQUE",
-             "columns": r[2].split(",") if r[2] else []}
-            for r in cur.fetchall()
-        ]
-
-        # Row count
-        cur.execute(f'SELECT COUNT(*) FROM "{tn}"')
-        row_count = cur.fetchone()[0]
-
-        cur.close()
-        self.disconnect()
-        return {"table": table_name, "columns": columns,
-                "foreign_keys": fks, "indexes": indexes,
-                "row_count": row_count}
-
-    def get_constraints(self) -> list:
-        self.connect()
-        cur = self._conn.cursor()
-        constraints = []
-
-        cur.execute("""
-            SELECT uc.table_name,
-                   CASE uc.constraint_type
-                       WHEN 'P' THEN 'PRIMARY KEY'
-                       WHEN 'R' THEN 'FOREIGN KEY'
-                       WHEN 'U' THEN 'UNIQUE'
-                       WHEN 'C' THEN 'CHECK'
-                   END,
-                   uc.constraint_name,
-                   LISTAGG(ucc.column_name, ', ') WITHIN GROUP (ORDER BY ucc.position)
-            FROM user_constraints uc
-            JOIN user_cons_columns ucc ON uc.constraint_name = ucc.constraint_name
-            WHERE uc.constraint_type IN ('P', 'R', 'U')
-            GROUP BY uc.table_name, uc.constraint_type, uc.constraint_name
-            ORDER BY uc.table_name
-        """)
-        for r in cur.fetchall():
-            constraints.append({"table": r[0], "type": r[1], "details": f"{r[2]} ({r[3]})"})
-
-        # NOT NULL
-        cur.execute("""
-            SELECT table_name, column_name
-            FROM user_tab_columns
-            WHERE nullable = 'N'
-            ORDER BY table_name, column_id
-        """)
-        for r in cur.fetchall():
-            constraints.append({"table": r[0], "type": "NOT NULL", "details": r[1]})
-
-        cur.close()
-        self.disconnect()
-        return constraints
+        info = self._describe_from_model(table_name)
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            # Row count
+            cur.execute(f'SELECT COUNT(*) FROM "{info["table"].upper()}"')
+            info["row_count"] = cur.fetchone()[0]
+            cur.close()
+        return info
+
+    def _estimate_table_stats(self):
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            # num_rows/last_analyzed come from the optimizer statistics (DBMS_STATS)
+            cur.execute("""
+                SELECT t.table_name, t.num_rows, seg.bytes, t.last_analyzed
+                FROM user_tables t
+                LEFT JOIN (
+                    SELECT segment_name, SUM(bytes) AS bytes
+                    FROM user_segments
+                    WHERE segment_type LIKE 'TABLE%'
+                    GROUP BY segment_name
+                ) seg ON seg.segment_name = t.table_name
+            """)
+            stats = {
+                name: {"rows": rows, "size_bytes": size, "last_analyzed": analyzed}
+                for name, rows, size, analyzed in cur.fetchall()
+            }
+            cur.close()
+        return stats
 
     def get_create_table(self, table_name: str) -> str:
-        self.connect()
-        cur = self._conn.cursor()
-        tn = table_name.upper()
-
-        cur.execute("""
-            SELECT column_name, data_type, data_length, nullable, data_default
-            FROM user_tab_columns
-            WHERE table_name = :1
-            ORDER BY column_id
-        """, (tn,))
-        cols = cur.fetchall()
-        if not cols:
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            tn = table_name.upper()
+
+            cur.execute("""
+                SELECT column_name, data_type, data_length, nullable, data_default
+                FROM user_tab_columns
+                WHERE table_name = :1
+                ORDER BY column_id
+            """, (tn,))
+            cols = cur.fetchall()
+            if not cols:
+                cur.close()
+                return f"-- Table '{table_name}' not found"
+
+            lines = []
+            for col_name, dtype, data_len, nullable, default in cols:
+                col_def = f"  {col_name} {dtype}"
+                if dtype in ("VARCHAR2", "CHAR", "NVARCHAR2", "RAW") and data_len:
+                    col_def += f"({data_len})"
+                if nullable == "N":
+                    col_def += " NOT NULL"
+                if default:
+                    col_def += f" DEFAULT {str(default).strip()}"
+                lines.append(col_def)
+
+            # Primary key
+            cur.execute("""
+                SELECT LISTAGG(ucc.column_name, ', ') WITHIN GROUP (ORDER BY ucc.position)
+                FROM user_constraints uc
+                JOIN user_cons_columns ucc ON uc.constraint_name = ucc.constraint_name
+                WHERE uc.table_name = :1 AND uc.constraint_type = 'P'
+            """, (tn,))
+            pk_row = cur.fetchone()
+            if pk_row and pk_row[0]:
+                lines.append(f"  PRIMARY KEY ({pk_row[0]})")
+
             cur.close()
-            self.disconnect()
-            return f"-- Table '{table_name}' not found"
-
-        lines = []
-        for col_name, dtype, data_len, nullable, default in cols:
-            col_def = f"  {col_name} {dtype}"
-            if dtype in ("VARCHAR2", "CHAR", "NVARCHAR2", "RAW") and data_len:
-                col_def += f"({data_len})"
-            if nullable == "N":
-                col_def += " NOT NULL"
-            if default:
-                col_def += f" DEFAULT {str(default).strip()}"
-            lines.append(col_def)
-
-        # Primary key
-        cur.execute("""
-            SELECT LISTAGG(ucc.column_name, ', ') WITHIN GROUP (ORDER BY ucc.position)
-            FROM user_constraints uc
-            JOIN user_cons_columns ucc ON uc.constraint_name = ucc.constraint_name
-            WHERE uc.table_name = :1 AND uc.constraint_type = 'P'
-        """, (tn,))
-        pk_row = cur.fetchone()
-        if pk_row and pk_row[0]:
-            lines.append(f"  PRIMARY KEY ({pk_row[0]})")
-
-        cur.close()
-        self.disconnect()
         return f'CREATE TABLE "{tn}" (\n' + ",\n".join(lines) + "\n);"
 
     # --------------------------------------------------
@@ -359,10 +372,9 @@ class OracleAdapter(DatabaseAdapter):
             return None
 
         count_sql = q.lower().replace("delete", "select count(*)", 1)
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute(count_sql)
-        row = cur.fetchone()
-        cur.close()
-        self.disconnect()
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            cur.execute(count_sql)
+            row = cur.fetchone()
+            cur.close()
         return row[0] if row else 0
@@ -3,6 +3,7 @@ PostgreSQL Adapter
 Uses psycopg2 for PostgreSQL connections.
 """
 
+import json
 from core.adapters.base import DatabaseAdapter
 
 
@@ -19,42 +20,51 @@ class PostgresAdapter(DatabaseAdapter):
     # --------------------------------------------------
     # Connection
     # --------------------------------------------------
-    def __init__(self, config: dict):
-        super().__init__(config)
-        self._pool = None
+    def _create_connection(self):
+        import psycopg2
+        conn = psycopg2.connect(
+            host=self.config.get("host", "localhost"),
+            port=int(self.config.get("port", 5432)),
+            user=self.config.get("username", "postgres"),
+            password=self.config.get("password", ""),
+            dbname=self.config.get("database", "postgres"),
+        )
+        conn.autocommit = True
+        return conn
+
+    def _ping_connection(self, conn) -> bool:
+        if conn.closed:
+            return False
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        return True
 
     def connect(self):
-        from psycopg2 import pool
-        params = {
-            "host": self.config.get("host", "localhost"),
-            "port": int(self.config.get("port", 5432)),
-            "user": self.config.get("username", "postgres"),
-            "password": self.config.get("password", ""),
-            "dbname": self.config.get("database", "postgres"),
-        }
-        # Create a thread-safe pool
-        self._pool = pool.ThreadedConnectionPool(1, 10, **params)
+        # Warm the shared pool up to pool_min_size
+        self.pool.fill()
 
     def disconnect(self):
-        if self._pool:
-            self._pool.closeall()
-            self._pool = None
+        self.close_pool()
 
-    def get_connection(self):
-        if not self._pool:
-            self.connect()
-        return self._pool.getconn()
-
-    def release_connection(self, conn):
-        if self._pool:
-            self._pool.putconn(conn)
+    def replica_lag(self) -> float:
+        with self.borrow() as conn:
+            with conn.cursor() as cur:
+                # A caught-up standby replays nothing, so its replay timestamp
+                # ages while the primary is idle: report 0 when LSNs match
+                cur.execute("""
+                    SELECT CASE
+                        WHEN NOT pg_is_in_recovery() THEN 0
+                        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+                        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+                    END
+                """)
+                return float(cur.fetchone()[0])
 
     def test_connection(self) -> bool:
         try:
-            conn = self.get_connection()
-            with conn.cursor() as cur:
-                cur.execute("SELECT 1")
-            self.release_connection(conn)
+            with self.borrow() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT 1")
             return True
         except Exception:
             return False
@@ -62,121 +72,155 @@ class PostgresAdapter(DatabaseAdapter):
     # --------------------------------------------------
     # Schema
     # --------------------------------------------------
-    def get_schema(self) -> str:
+    def _schemas(self) -> list:
+        """Schemas to introspect: the comma-separated "schemas" setting, default public."""
+        raw = self.config.get("schemas") or "public"
+        return [s.strip() for s in str(raw).split(",") if s.strip()] or ["public"]
+
+    def _table_key(self, schema: str, name: str) -> str:
+        # Tables in the first (default) schema keep their bare name
+        return name if schema == self._schemas()[0] else f"{schema}.{name}"
+
+    @staticmethod
+    def _qualified(info: dict) -> str:
+        """Quoted "schema"."table" for a schema model entry."""
+        schema = info["schema"].replace('"', '""')
+        name = info["name"].replace('"', '""')
+        return f'"{schema}"."{name}"'
+
+    def schema_fingerprint(self):
+        """Row counts and newest xmin of pg_class/pg_constraint in the introspected schemas."""
+        schemas = self._schemas()
         conn = self.get_connection()
         try:
             with conn.cursor() as cur:
                 cur.execute("""
-                    SELECT table_name
-                    FROM information_schema.tables
-                    WHERE table_schema = 'public' AND table_type = 'BASE TABLE'
-                    ORDER BY table_name
-                """)
-                tables = [r[0] for r in cur.fetchall()]
-
-                schema = ""
-                for table_name in tables:
-                    schema += f"\nTABLE {table_name}:\n"
-
-                    # Columns with PK markers, NOT NULL, defaults
-                    cur.execute("""
-                        SELECT c.column_name, c.data_type, c.is_nullable,
-                               c.column_default,
-                               CASE WHEN pk.column_name IS NOT NULL THEN TRUE ELSE FALSE END
-                        FROM information_schema.columns c
-                        LEFT JOIN (
-                            SELECT kcu.column_name
-                            FROM information_schema.table_constraints tc
-                            JOIN information_schema.key_column_usage kcu
-                                ON tc.constraint_name = kcu.constraint_name
-                                AND tc.table_schema = kcu.table_schema
-                            WHERE tc.constraint_type = 'PRIMARY KEY'
-                              AND tc.table_schema = 'public' AND tc.table_name = %s
-                        ) pk ON pk.column_name = c.column_name
-                        WHERE c.table_schema = 'public' AND c.table_name = %s
-                        ORDER BY c.ordinal_position
-                    """, (table_name, table_name))
-                    col_info = cur.fetchall()
-                    col_names = []
-                    for col_name, dtype, nullable, default, is_pk in col_info:
-                        col_names.append(col_name)
-                        notnull = " NOT NULL" if nullable == "NO" else ""
-                        default_str = f" DEFAULT {default}" if default else ""
-                        pk_marker = " [PRIMARY KEY]" if is_pk else ""
-                        schema += f"  - {col_name} ({dtype}{notnull}{default_str}{pk_marker})\n"
-
-                    # Foreign keys
-                    cur.execute("""
-                        SELECT kcu.column_name, ccu.table_name, ccu.column_name
-                        FROM information_schema.table_constraints tc
-                        JOIN information_schema.key_column_usage kcu
-                            ON tc.constraint_name = kcu.constraint_name
-                            AND tc.table_schema = kcu.table_schema
-                        JOIN information_schema.constraint_column_usage ccu
-                            ON ccu.constraint_name = tc.constraint_name
-                            AND ccu.table_schema = tc.table_schema
-                        WHERE tc.constraint_type = 'FOREIGN KEY'
-                          AND tc.table_schema = 'public' AND tc.table_name = %s
-                    """, (table_name,))
-                    fks = cur.fetchall()
-                    if fks:
-                        schema += "  FOREIGN KEYS:\n"
-                        for fk_col, ref_table, ref_col in fks:
-                            schema += f"    - {fk_col} -> {ref_table}.{ref_col}\n"
-
-                    # Indexes
-                    cur.execute("""
-                        SELECT i.relname, ix.indisunique,
-                               array_agg(a.attname ORDER BY k.n)
-                        FROM pg_index ix
-                        JOIN pg_class t ON t.oid = ix.indrelid
-                        JOIN pg_class i ON i.oid = ix.indexrelid
-                        JOIN pg_namespace ns ON ns.oid = t.relnamespace
-                        JOIN LATERAL unnest(ix.indkey) WITH ORDINALITY AS k(attnum, n) ON TRUE
-                        JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
-                        WHERE ns.nspname = 'public' AND t.relname = %s
-                        GROUP BY i.relname, ix.indisunique
-                    """, (table_name,))
-                    indexes = cur.fetchall()
-                    if indexes:
-                        schema += "  INDEXES:\n"
-                        for idx_name, is_unique, idx_cols in indexes:
-                            unique = "UNIQUE " if is_unique else ""
-                            schema += f"    - {unique}{idx_name} ({', '.join(idx_cols)})\n"
+                    SELECT (SELECT count(*) || ':' || COALESCE(max(c.xmin::text::bigint), 0)
+                            FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+                            WHERE n.nspname::text = ANY(%s)),
+                           (SELECT count(*) || ':' || COALESCE(max(co.xmin::text::bigint), 0)
+                            FROM pg_constraint co JOIN pg_namespace n ON n.oid = co.connamespace
+                            WHERE n.nspname::text = ANY(%s))
+                """, (schemas, schemas))
+                return cur.fetchone()
+        finally:
+            self.release_connection(conn)
 
+    def _load_schema_model(self):
+        """
+        Columns (with PKs and defaults), foreign keys and indexes for every
+        table in the configured schemas, straight from pg_catalog in three
+        queries. Each entry also carries its "schema" and "name".
+        """
+        schemas = self._schemas()
+        model = {}
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT n.nspname, c.relname, a.attname,
+                           format_type(a.atttypid, a.atttypmod),
+                           a.attnotnull, pg_get_expr(d.adbin, d.adrelid),
+                           COALESCE(a.attnum = ANY(pk.conkey), FALSE)
+                    FROM pg_class c
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    JOIN pg_attribute a ON a.attrelid = c.oid
+                         AND a.attnum > 0 AND NOT a.attisdropped
+                    LEFT JOIN pg_attrdef d ON d.adrelid = c.oid AND d.adnum = a.attnum
+                    LEFT JOIN pg_constraint pk ON pk.conrelid = c.oid AND pk.contype = 'p'
+                    WHERE c.relkind IN ('r', 'p') AND NOT c.relispartition
+                      AND n.nspname::text = ANY(%s)
+                    ORDER BY array_position(%s, n.nspname::text), c.relname, a.attnum
+                """, (schemas, schemas))
+                for schema, table, col, dtype, notnull, default, is_pk in cur.fetchall():
+                    info = model.setdefault(self._table_key(schema, table), {
+                        "schema": schema, "name": table,
+                        "columns": [], "foreign_keys": [], "indexes": [],
+                    })
+                    info["columns"].append({
+                        "name": col, "type": dtype,
+                        "not_null": bool(notnull), "default": default,
+                        "primary_key": bool(is_pk),
+                    })
+
+                cur.execute("""
+                    SELECT n.nspname, c.relname, a.attname,
+                           fn.nspname, f.relname, fa.attname
+                    FROM pg_constraint co
+                    JOIN pg_class c ON c.oid = co.conrelid
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    JOIN pg_class f ON f.oid = co.confrelid
+                    JOIN pg_namespace fn ON fn.oid = f.relnamespace
+                    CROSS JOIN LATERAL unnest(co.conkey, co.confkey) WITH ORDINALITY AS k(attnum, fattnum, n)
+                    JOIN pg_attribute a ON a.attrelid = co.conrelid AND a.attnum = k.attnum
+                    JOIN pg_attribute fa ON fa.attrelid = co.confrelid AND fa.attnum = k.fattnum
+                    WHERE co.contype = 'f' AND n.nspname::text = ANY(%s)
+                    ORDER BY n.nspname, c.relname, co.conname, k.n
+                """, (schemas,))
+                for schema, table, col, ref_schema, ref_table, ref_col in cur.fetchall():
+                    info = model.get(self._table_key(schema, table))
+                    if info is not None:
+                        info["foreign_keys"].append({
+                            "from": col, "to_table": self._table_key(ref_schema, ref_table),
+                            "to_column": ref_col,
+                        })
+
+                cur.execute("""
+                    SELECT n.nspname, t.relname, i.relname,
+                           ix.indisunique, ix.indisprimary,
+                           array_agg(a.attname ORDER BY k.n)
+                    FROM pg_index ix
+                    JOIN pg_class t ON t.oid = ix.indrelid
+                    JOIN pg_class i ON i.oid = ix.indexrelid
+                    JOIN pg_namespace n ON n.oid = t.relnamespace
+                    CROSS JOIN LATERAL unnest(ix.indkey) WITH ORDINALITY AS k(attnum, n)
+                    JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+                    WHERE n.nspname::text = ANY(%s)
+                    GROUP BY n.nspname, t.relname, i.relname, ix.indisunique, ix.indisprimary
+                    ORDER BY n.nspname, t.relname, i.relname
+                """, (schemas,))
+                for schema, table, idx_name, unique, primary, cols in cur.fetchall():
+                    info = model.get(self._table_key(schema, table))
+                    if info is not None:
+                        info["indexes"].append({
+                            "name": idx_name, "unique": bool(unique),
+                            "primary": bool(primary), "columns": list(cols),
+                        })
+        finally:
+            self.release_connection(conn)
+        return model
+
+    def get_schema(self) -> str:
+        model = self.schema_model()
+        samples = {}
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                for table_name, info in model.items():
                     # Sample data (3 rows)
                     try:
-                        cur.execute(f'SELECT * FROM "{table_name}" LIMIT 3')
-                        sample_rows = cur.fetchall()
-                        if sample_rows and col_names:
-                            schema += f"  SAMPLE DATA ({len(sample_rows)} rows):\n"
-                            for sr in sample_rows:
-                                pairs = []
-                                for i, val in enumerate(sr):
-                                    if i >= len(col_names):
-                                        break
-                                    if isinstance(val, (bytes, memoryview)):
-                                        continue
-                                    pairs.append(f"{col_names[i]}={str(val)[:60]}")
-                                schema += f"    {', '.join(pairs)}\n"
+                        cur.execute(f"SELECT * FROM {self._qualified(info)} LIMIT 3")
+                        samples[table_name] = cur.fetchall()
                     except Exception:
                         pass
-
-                return schema
         finally:
             self.release_connection(conn)
+        return self._render_schema(model, samples)
 
     def list_tables(self) -> list:
+        schemas = self._schemas()
         conn = self.get_connection()
         try:
             with conn.cursor() as cur:
                 cur.execute("""
-                    SELECT table_name
-                    FROM information_schema.tables
-                    WHERE table_schema = 'public' AND table_type = 'BASE TABLE'
-                    ORDER BY table_name
-                """)
-                return [row[0] for row in cur.fetchall()]
+                    SELECT n.nspname, c.relname
+                    FROM pg_class c
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    WHERE c.relkind IN ('r', 'p') AND NOT c.relispartition
+                      AND n.nspname::text = ANY(%s)
+                    ORDER BY array_position(%s, n.nspname::text), c.relname
+                """, (schemas, schemas))
+                return [self._table_key(schema, name) for schema, name in cur.fetchall()]
         finally:
             self.release_connection(conn)
 
@@ -184,10 +228,18 @@ class PostgresAdapter(DatabaseAdapter):
     # Execution
     # --------------------------------------------------
     def execute(self, query: str) -> tuple:
+        replica = self.replica_for(query)
+        if replica is not self:
+            return replica.execute(query)
         conn = self.get_connection()
         conn.autocommit = True
+        timeout_set = False
         try:
-            with conn.cursor() as cur:
+            with self._guarded(conn) as left, conn.cursor() as cur:
+                if left is not None:
+                    # Server-side too, so the backend stops even if we never get to cancel
+                    cur.execute("SET statement_timeout = %s", (max(1, int(left * 1000)),))
+                    timeout_set = True
                 cur.execute(query)
                 if cur.description:
                     columns = [desc[0] for desc in cur.description]
@@ -197,7 +249,64 @@ class PostgresAdapter(DatabaseAdapter):
                     rows = []
                 return columns, rows
         finally:
-            self.release_connection(conn)
+            if timeout_set and not self._clear_statement_timeout(conn):
+                self._discard_connection(conn)
+            else:
+                self.release_connection(conn)
+
+    def _clear_statement_timeout(self, conn) -> bool:
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SET statement_timeout = DEFAULT")
+            return True
+        except Exception:
+            return False
+
+    def _cancel_statement(self, conn):
+        # Same cancel request pg_cancel_backend() sends, over a side channel
+        conn.cancel()
+
+    def _is_timeout_error(self, exc) -> bool:
+        return getattr(exc, "pgcode", None) == "57014"   # query_canceled
+
+    def execute_iter(self, query: str, batch_size: int = 1000):
+        replica = self.replica_for(query)
+        if replica is not self:
+            yield from replica.execute_iter(query, batch_size)
+            return
+        # Named (server-side) cursors only accept row-returning statements
+        if not query.lstrip().lower().startswith(("select", "with", "values", "table")):
+            yield from super().execute_iter(query, batch_size)
+            return
+
+        import uuid
+        conn = self.get_connection()
+        try:
+            # Named cursors live inside a transaction
+            conn.autocommit = False
+            # Guarded across the yields, so cancel() and the deadline reach every FETCH
+            with self._guarded(conn) as left:
+                if left is not None:
+                    with conn.cursor() as cur:
+                        # LOCAL: ends with the rollback below
+                        cur.execute("SET LOCAL statement_timeout = %s", (max(1, int(left * 1000)),))
+                with conn.cursor(name=f"meridian_{uuid.uuid4().hex}") as cur:
+                    cur.itersize = batch_size
+                    cur.execute(query)
+                    rows = cur.fetchmany(batch_size)
+                    columns = [desc[0] for desc in cur.description]
+                    yield columns, [list(r) for r in rows]
+                    for rows in iter(lambda: cur.fetchmany(batch_size), []):
+                        yield columns, [list(r) for r in rows]
+        finally:
+            try:
+                conn.rollback()
+                conn.autocommit = True
+            except Exception:
+                self._discard_connection(conn)
+            else:
+                self.release_connection(conn)
+
     def dry_run(self, query: str) -> dict:
         conn = self.get_connection()
         try:
@@ -220,218 +329,86 @@ class PostgresAdapter(DatabaseAdapter):
                 "success": False
             }
         finally:
+            conn.autocommit = True
             self.release_connection(conn)
 
     # --------------------------------------------------
     # Introspection
     # --------------------------------------------------
-    def get_foreign_keys(self) -> list:
-        conn = self.get_connection()
-        try:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT
-                        tc.table_name   AS from_table,
-                        kcu.column_name AS from_column,
-                        ccu.table_name  AS to_table,
-                        ccu.column_name AS to_column
-                    FROM information_schema.table_constraints tc
-                    JOIN information_schema.key_column_usage kcu
-                        ON tc.constraint_name = kcu.constraint_name
-                        AND tc.table_schema = kcu.table_schema
-                    JOIN information_schema.constraint_column_usage ccu
-                        ON ccu.constraint_name = tc.constraint_name
-                        AND ccu.table_schema = tc.table_schema
-                    WHERE tc.constraint_type = 'FOREIGN KEY'
-                      AND tc.table_schema = 'public'
-                """)
-                return [
-                    {"from_table": r[0], "from_column": r[1],
-                     "to_table": r[2], "to_column": r[3]}
-                    for r in cur.fetchall()
-                ]
-        finally:
-            self.release_connection(conn)
-
-    def get_indexes(self) -> list:
-        conn = self.get_connection()
-        try:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT
-                        t.relname AS table_name,
-                        i.relname AS index_name,
-                        ix.indisunique AS is_unique,
-                        array_agg(a.attname ORDER BY k.n) AS columns
-                    FROM pg_index ix
-                    JOIN pg_class t ON t.oid = ix.indrelid
-                    JOIN pg_class i ON i.oid = ix.indexrelid
-                    JOIN pg_namespace ns ON ns.oid = t.relnamespace
-                    JOIN LATERAL unnest(ix.indkey) WITH ORDINALITY AS k(attnum, n) ON TRUE
-                    JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
-                    WHERE ns.nspname = 'public'
-                    GROUP BY t.relname, i.relname, ix.indisunique
-                    ORDER BY t.relname, i.relname
-                """)
-                return [
-                    {"table": r[0], "index_name": r[1],
-                     "unique": bool(r[2]), "columns": list(r[3])}
-                    for r in cur.fetchall()
-                ]
-        finally:
-            self.release_connection(conn)
-
     def describe_table(self, table_name: str) -> dict:
+        model = self.schema_model()
+        _, info = self._model_table(model, table_name)
+        described = self._describe_from_model(table_name, model)
+        target = self._qualified(info) if info else f'"{table_name}"'
         conn = self.get_connection()
         try:
             with conn.cursor() as cur:
-                # Columns
-                cur.execute("""
-                    SELECT c.column_name, c.data_type, c.is_nullable,
-                           c.column_default,
-                           CASE WHEN pk.column_name IS NOT NULL THEN TRUE ELSE FALSE END AS is_pk
-                    FROM information_schema.columns c
-                    LEFT JOIN (
-                        SELECT kcu.column_name
-                        FROM information_schema.table_constraints tc
-                        JOIN information_schema.key_column_usage kcu
-                            ON tc.constraint_name = kcu.constraint_name
-                            AND tc.table_schema = kcu.table_schema
-                        WHERE tc.constraint_type = 'PRIMARY KEY'
-                          AND tc.table_schema = 'public'
-                          AND tc.table_name = %s
-                    ) pk ON pk.column_name = c.column_name
-                    WHERE c.table_schema = 'public' AND c.table_name = %s
-                    ORDER BY c.ordinal_position
-                """, (table_name, table_name))
-                columns = [
-                    {"name": r[0], "type": r[1],
-                     "not_null": r[2] == "NO",
-                     "default": r[3], "primary_key": bool(r[4])}
-                    for r in cur.fetchall()
-                ]
-
-                # Foreign keys
-                cur.execute("""
-                    SELECT kcu.column_name, ccu.table_name, ccu.column_name
-                    FROM information_schema.table_constraints tc
-                    JOIN information_schema.key_column_usage kcu
-                        ON tc.constraint_name = kcu.constraint_name
-                        AND tc.table_schema = kcu.table_schema
-                    JOIN information_schema.constraint_column_usage ccu
-                        ON ccu.constraint_name = tc.constraint_name
-                        AND ccu.table_schema = tc.table_schema
-                    WHERE tc.constraint_type = 'FOREIGN KEY'
-                      AND tc.table_schema = 'public'
-                      AND tc.table_name = %s
-                """, (table_name,))
-                fks = [{"from": r[0], "to_table": r[1], "to_column": r[2]}
-                       for r in cur.fetchall()]
-
-                # Indexes
-                cur.execute("""
-                    SELECT i.relname, ix.indisunique,
-                           array_agg(a.attname ORDER BY k.n)
-                    FROM pg_index ix
-                    JOIN pg_class t ON t.oid = ix.indrelid
-                    JOIN pg_class i ON i.oid = ix.indexrelid
-                    JOIN pg_namespace ns ON ns.oid = t.relnamespace
-                    JOIN LATERAL unnest(ix.indkey) WITH ORDINALITY AS k(attnum, n) ON TRUE
-                    JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
-                    WHERE ns.nspname = 'public' AND t.relname = %s
-                    GROUP BY i.relname, ix.indisunique
-                """, (table_name,))
-                indexes = [{"name": r[0], "unique": bool(r[1]), "columns": list(r[2])}
-                           for r in cur.fetchall()]
-
                 # Row count
-                cur.execute(f'SELECT COUNT(*) FROM "{table_name}"')
-                row_count = cur.fetchone()[0]
-
-                return {"table": table_name, "columns": columns,
-                        "foreign_keys": fks, "indexes": indexes,
-                        "row_count": row_count}
+                cur.execute(f"SELECT COUNT(*) FROM {target}")
+                described["row_count"] = cur.fetchone()[0]
         finally:
             self.release_connection(conn)
+        return described
 
-    def get_constraints(self) -> list:
+    def _estimate_table_stats(self):
+        schemas = self._schemas()
         conn = self.get_connection()
         try:
             with conn.cursor() as cur:
-                constraints = []
-                cur.execute("""
-                    SELECT tc.table_name, tc.constraint_type, tc.constraint_name,
-                           string_agg(kcu.column_name, ', ' ORDER BY kcu.ordinal_position)
-                    FROM information_schema.table_constraints tc
-                    JOIN information_schema.key_column_usage kcu
-                        ON tc.constraint_name = kcu.constraint_name
-                        AND tc.table_schema = kcu.table_schema
-                    WHERE tc.table_schema = 'public'
-                      AND tc.constraint_type IN ('PRIMARY KEY', 'FOREIGN KEY', 'UNIQUE')
-                    GROUP BY tc.table_name, tc.constraint_type, tc.constraint_name
-                    ORDER BY tc.table_name, tc.constraint_type
-                """)
-                for r in cur.fetchall():
-                    constraints.append({"table": r[0], "type": r[1], "details": f"{r[2]} ({r[3]})"})
-
-                # NOT NULL constraints
                 cur.execute("""
-                    SELECT table_name, column_name
-                    FROM information_schema.columns
-                    WHERE table_schema = 'public' AND is_nullable = 'NO'
-                    ORDER BY table_name, ordinal_position
-                """)
-                for r in cur.fetchall():
-                    constraints.append({"table": r[0], "type": "NOT NULL", "details": r[1]})
-
-                return constraints
+                    SELECT n.nspname, c.relname, c.reltuples::bigint,
+                           pg_total_relation_size(c.oid),
+                           GREATEST(s.last_analyze, s.last_autoanalyze)
+                    FROM pg_class c
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+                    WHERE c.relkind IN ('r', 'p') AND NOT c.relispartition
+                      AND n.nspname::text = ANY(%s)
+                """, (schemas,))
+                return {
+                    self._table_key(schema, name): {
+                        # reltuples is -1 until the first VACUUM/ANALYZE
+                        "rows": rows if rows >= 0 else None,
+                        "size_bytes": size, "last_analyzed": analyzed,
+                    }
+                    for schema, name, rows, size, analyzed in cur.fetchall()
+                }
         finally:
             self.release_connection(conn)
 
+    def estimate_query_rows(self, query: str):
+        _, rows = self.execute(f"EXPLAIN (FORMAT JSON) {query.rstrip(';')}")
+        plan = rows[0][0] if rows else None
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"]) if plan else None
+
+    def _count_rows(self, table_name: str) -> int:
+        _, info = self._model_table(self.schema_model(), table_name)
+        target = self._qualified(info) if info else f'"{table_name}"'
+        _, rows = self.execute(f"SELECT COUNT(*) FROM {target}")
+        return rows[0][0] if rows else 0
+
     def get_create_table(self, table_name: str) -> str:
-        conn = self.get_connection()
-        try:
-            with conn.cursor() as cur:
-                # Build DDL from information_schema
-                cur.execute("""
-                    SELECT column_name, data_type, character_maximum_length,
-                           is_nullable, column_default
-                    FROM information_schema.columns
-                    WHERE table_schema = 'public' AND table_name = %s
-                    ORDER BY ordinal_position
-                """, (table_name,))
-                cols = cur.fetchall()
-                if not cols:
-                    return f"-- Table '{table_name}' not found"
-
-                lines = []
-                for col_name, dtype, max_len, nullable, default in cols:
-                    col_def = f"  {col_name} {dtype}"
-                    if max_len:
-                        col_def += f"({max_len})"
-                    if nullable == "NO":
-                        col_def += " NOT NULL"
-                    if default:
-                        col_def += f" DEFAULT {default}"
-                    lines.append(col_def)
-
-                # Primary key
-                cur.execute("""
-                    SELECT string_agg(kcu.column_name, ', ' ORDER BY kcu.ordinal_position)
-                    FROM information_schema.table_constraints tc
-                    JOIN information_schema.key_column_usage kcu
-                        ON tc.constraint_name = kcu.constraint_name
-                    WHERE tc.table_schema = 'public'
-                      AND tc.table_name = %s
-                      AND tc.constraint_type = 'PRIMARY KEY'
-                """, (table_name,))
-                pk_row = cur.fetchone()
-                if pk_row and pk_row[0]:
-                    lines.append(f"  PRIMARY KEY ({pk_row[0]})")
-
-                return f'CREATE TABLE "{table_name}" (\n' + ",\n".join(lines) + "\n);"
-        finally:
-            self.release_connection(conn)
+        name, info = self._model_table(self.schema_model(), table_name)
+        if not info:
+            return f"-- Table '{table_name}' not found"
+
+        lines = []
+        for col in info["columns"]:
+            col_def = f"  {col['name']} {col['type']}"
+            if col["not_null"]:
+                col_def += " NOT NULL"
+            if col["default"] is not None:
+                col_def += f" DEFAULT {col['default']}"
+            lines.append(col_def)
+
+        pk_cols = [c["name"] for c in info["columns"] if c["primary_key"]]
+        if pk_cols:
+            lines.append(f"  PRIMARY KEY ({', '.join(pk_cols)})")
+
+        target = f'"{name}"' if info["schema"] == self._schemas()[0] else self._qualified(info)
+        return f"CREATE TABLE {target} (\n" + ",\n".join(lines) + "\n);"
 
     # --------------------------------------------------
     # Safety
@@ -8,6 +8,50 @@ import json
 from core.adapters.base import DatabaseAdapter
 
 
+class RedisClientPool:
+    """
+    A shared redis-py connection pool behind the ConnectionPool interface
+    used by DatabaseAdapter. redis.Redis is thread-safe and checks a socket
+    out of its pool per command, so every borrow hands out the same client.
+    """
+
+    def __init__(self, client, min_size=0):
+        self._client = client
+        self.min_size = min_size
+
+    def acquire(self):
+        return self._client
+
+    def release(self, client):
+        pass
+
+    def discard(self, client):
+        # redis-py drops broken sockets from its own pool
+        pass
+
+    def fill(self):
+        """Open (and authenticate) at least `min_size` sockets in redis-py's pool."""
+        pool = self._client.connection_pool
+        held = []
+        try:
+            for _ in range(max(self.min_size, 1)):
+                held.append(pool.get_connection("PING"))   # connects on checkout
+        finally:
+            for conn in held:
+                pool.release(conn)
+
+    def close(self):
+        self._client.connection_pool.disconnect()
+
+    def stats(self) -> dict:
+        pool = self._client.connection_pool
+        return {
+            "size": len(getattr(pool, "_connections", [])),
+            "max_size": pool.max_connections,
+            "timeout": getattr(pool, "timeout", None),
+        }
+
+
 class RedisAdapter(DatabaseAdapter):
 
     @property
@@ -21,27 +65,34 @@ class RedisAdapter(DatabaseAdapter):
     # --------------------------------------------------
     # Connection
     # --------------------------------------------------
-    def connect(self):
+    def _build_pool(self):
         import redis as redis_lib
-        self._client = redis_lib.Redis(
+        settings = self._pool_settings()
+        # Blocking pool: callers wait pool_timeout for a socket instead of failing
+        pool = redis_lib.BlockingConnectionPool(
             host=self.config.get("host", "localhost"),
             port=int(self.config.get("port", 6379)),
             password=self.config.get("password", "") or None,
             db=int(self.config.get("db_number", 0)),
             decode_responses=True,
             socket_timeout=5,
+            max_connections=settings["max_size"],
+            timeout=settings["timeout"],
         )
+        return RedisClientPool(redis_lib.Redis(connection_pool=pool),
+                               min(settings["min_size"], settings["max_size"]))
+
+    def connect(self):
+        # Warm the shared pool up to pool_min_size
+        self.pool.fill()
 
     def disconnect(self):
-        if hasattr(self, "_client") and self._client:
-            self._client.close()
-            self._client = None
+        self.close_pool()
 
     def test_connection(self) -> bool:
         try:
-            self.connect()
-            self._client.ping()
-            self.disconnect()
+            with self.borrow() as client:
+                client.ping()
             return True
         except Exception:
             return False
@@ -50,42 +101,40 @@ class RedisAdapter(DatabaseAdapter):
     # Schema (key patterns + types)
     # --------------------------------------------------
     def get_schema(self) -> str:
-        self.connect()
-        schema = "REDIS KEY SPACE:\n"
-
-        # Sample up to 100 keys
-        cursor, keys = self._client.scan(count=100)
-        all_keys = list(keys)
-
-        # Group by type
-        type_map = {}
-        for key in all_keys[:100]:
-            ktype = self._client.type(key)
-            if ktype not in type_map:
-                type_map[ktype] = []
-            type_map[ktype].append(key)
-
-        for ktype, kkeys in type_map.items():
-            schema += f"\n  TYPE: {ktype} ({len(kkeys)} keys sampled)\n"
-            for k in kkeys[:10]:
-                schema += f"    - {k}\n"
-            if len(kkeys) > 10:
-                schema += f"    ... and {len(kkeys) - 10} more\n"
-
-        total = self._client.dbsize()
-        schema += f"\n  TOTAL KEYS IN DB: {total}\n"
-
-        self.disconnect()
+        with self.borrow() as client:
+            schema = "REDIS KEY SPACE:\n"
+
+            # Sample up to 100 keys
+            cursor, keys = client.scan(count=100)
+            all_keys = list(keys)
+
+            # Group by type
+            type_map = {}
+            for key in all_keys[:100]:
+                ktype = client.type(key)
+                if ktype not in type_map:
+                    type_map[ktype] = []
+                type_map[ktype].append(key)
+
+            for ktype, kkeys in type_map.items():
+                schema += f"\n  TYPE: {ktype} ({len(kkeys)} keys sampled)\n"
+                for k in kkeys[:10]:
+                    schema += f"    - {k}\n"
+                if len(kkeys) > 10:
+                    schema += f"    ... and {len(kkeys) - 10} more\n"
+
+            total = client.dbsize()
+            schema += f"\n  TOTAL KEYS IN DB: {total}\n"
+
         return schema
 
     def list_tables(self) -> list:
         """For Redis, 'tables' = key type groups."""
-        self.connect()
-        cursor, keys = self._client.scan(count=100)
-        types = set()
-        for key in keys:
-            types.add(f"{self._client.type(key)}")
-        self.disconnect()
+        with self.borrow() as client:
+            cursor, keys = client.scan(count=100)
+            types = set()
+            for key in keys:
+                types.add(f"{client.type(key)}")
         return sorted(types)
 
     # --------------------------------------------------
@@ -104,11 +153,14 @@ class RedisAdapter(DatabaseAdapter):
             "commands": [
                 {"command": "SET", "args": ["key1", "value1"]},
                 {"command": "GET", "args": ["key1"]}
-            ]
+            ],
+            "transaction": false
         }
-        """
-        self.connect()
 
+        Multi-command payloads go out as one pipeline (one round trip);
+        "transaction": true wraps them in MULTI/EXEC. The first failed
+        command's error is raised, though the commands after it have run.
+        """
         try:
             cmd = json.loads(query)
         except json.JSONDecodeError:
@@ -119,34 +171,41 @@ class RedisAdapter(DatabaseAdapter):
         results_columns = []
         results_rows = []
 
-        if "commands" in cmd:
-            # Multi-command
-            for step in cmd["commands"]:
-                command = step.get("command", "").upper()
-                args = step.get("args", [])
-                result = self._client.execute_command(command, *args)
-                results_rows.append([command, str(result)])
-            results_columns = ["command", "result"]
-        else:
-            command = cmd.get("command", "").upper()
-            args = cmd.get("args", [])
-            result = self._client.execute_command(command, *args)
-
-            # Format result based on type
-            if isinstance(result, list):
-                results_columns = ["index", "value"]
-                results_rows = [[i, str(v)] for i, v in enumerate(result)]
-            elif isinstance(result, dict):
-                results_columns = ["key", "value"]
-                results_rows = [[str(k), str(v)] for k, v in result.items()]
-            elif isinstance(result, set):
-                results_columns = ["member"]
-                results_rows = [[str(v)] for v in result]
+        with self.borrow() as client:
+            if "commands" in cmd:
+                # Multi-command: queue everything, send in a single round trip
+                pipe = client.pipeline(transaction=bool(cmd.get("transaction", False)))
+                commands = []
+                for step in cmd["commands"]:
+                    command = step.get("command", "").upper()
+                    args = step.get("args", [])
+                    pipe.execute_command(command, *args)
+                    commands.append(command)
+                results = pipe.execute(raise_on_error=False)
+                for result in results:
+                    if isinstance(result, Exception):
+                        raise result   # fail the batch, as the step-by-step loop did
+                results_rows = [[c, str(r)] for c, r in zip(commands, results)]
+                results_columns = ["command", "result"]
             else:
-                results_columns = ["result"]
-                results_rows = [[str(result)]]
+                command = cmd.get("command", "").upper()
+                args = cmd.get("args", [])
+                result = client.execute_command(command, *args)
+
+                # Format result based on type
+                if isinstance(result, list):
+                    results_columns = ["index", "value"]
+                    results_rows = [[i, str(v)] for i, v in enumerate(result)]
+                elif isinstance(result, dict):
+                    results_columns = ["key", "value"]
+                    results_rows = [[str(k), str(v)] for k, v in result.items()]
+                elif isinstance(result, set):
+                    results_columns = ["member"]
+                    results_rows = [[str(v)] for v in result]
+                else:
+                    results_columns = ["result"]
+                    results_rows = [[str(result)]]
 
-        self.disconnect()
         return results_columns, results_rows
 
     # --------------------------------------------------
@@ -163,14 +222,10 @@ class RedisAdapter(DatabaseAdapter):
             return None
 
         if command in ("FLUSHDB", "FLUSHALL"):
-            self.connect()
-            count = self._client.dbsize()
-            self.disconnect()
-            return count
+            with self.borrow() as client:
+                return client.dbsize()
 
         # DEL / UNLINK — count the keys
         args = cmd.get("args", [])
-        self.connect()
-        count = sum(1 for k in args if self._client.exists(k))
-        self.disconnect()
-        return count
+        with self.borrow() as client:
+            return sum(1 for k in args if client.exists(k))
@@ -5,10 +5,30 @@ Wraps the existing SQLite logic into the adapter interface.
 
 import sqlite3
 import os
+import re
+from urllib.request import pathname2url
 from core.adapters.base import DatabaseAdapter
 from core.paths import db_path
 
 
+# Applied to every pooled connection; override per connection with a
+# "pragmas" dict in the connection config (values are trusted config, not user input).
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,            # ms to wait on a locked database
+    "cache_size": -64000,            # negative = KiB, i.e. 64 MB page cache
+    "mmap_size": 268435456,          # 256 MB memory-mapped I/O
+    "temp_store": "MEMORY",
+}
+
+
+# EXPLAIN QUERY PLAN detail lines, e.g. "SCAN t", "SEARCH t USING INDEX ix (a=? AND b>?)"
+_EQP_STEP = re.compile(r"^(SCAN|SEARCH)(?: TABLE)? (\S+)(?: AS \S+)?(?: USING (?:COVERING )?INDEX (\S+) \((.*)\))?")
+
+_AGGREGATE = re.compile(r"\b(count|sum|avg|min|max|total|group_concat)\s*\(|\bgroup\s+by\b", re.IGNORECASE)
+
+
 def _resolve_db_path(path: str) -> str:
     if not path:
         return str(db_path("main.db"))
@@ -30,33 +50,51 @@ class SQLiteAdapter(DatabaseAdapter):
     # --------------------------------------------------
     # Connection
     # --------------------------------------------------
-    def connect(self):
+    def _create_connection(self):
         path = _resolve_db_path(self.config.get("db_path", "db/main.db"))
         parent = os.path.dirname(path)
         if parent:
             os.makedirs(parent, exist_ok=True)
-        # check_same_thread=False is needed for multi-threaded Flask apps
-        self._conn = sqlite3.connect(path, check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
-
-    def get_connection(self):
-        if not self._conn:
-            self.connect()
-        return self._conn
+        # Pooled connections are handed between threads (never shared at once)
+        if self.config.get("read_only"):
+            uri = f"file:{pathname2url(path)}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for name, value in self._pragmas().items():
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
+
+    def _replica_configs(self) -> list:
+        # Opt-in ("read_pool": true): reads go to a separate pool of mode=ro
+        # connections to the same file, which don't see a pinned session's
+        # uncommitted writes and double the file handles
+        if self.config.get("read_only") or str(self.config.get("read_pool", "")).lower() not in ("1", "true", "yes"):
+            return []
+        if self.config.get("db_path") == ":memory:":
+            return []
+        return [dict(self.config, read_only=True)]
+
+    def _pragmas(self) -> dict:
+        pragmas = dict(DEFAULT_PRAGMAS)
+        pragmas.update(self.config.get("pragmas") or {})
+        if self.config.get("read_only"):
+            # journal_mode is a property of the file; the read-write pool sets it
+            pragmas.pop("journal_mode", None)
+        return pragmas
 
-    def release_connection(self, conn):
-        # We keep the singleton alive for SQLite
-        pass
+    def connect(self):
+        # Warm the shared pool up to pool_min_size
+        self.pool.fill()
 
     def disconnect(self):
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        self.close_pool()
 
     def test_connection(self) -> bool:
         try:
-            conn = self.get_connection()
-            conn.execute("SELECT 1")
+            with self.borrow() as conn:
+                conn.execute("SELECT 1")
             return True
         except Exception:
             return False
@@ -64,242 +102,221 @@ class SQLiteAdapter(DatabaseAdapter):
     # --------------------------------------------------
     # Schema
     # --------------------------------------------------
-    def get_schema(self) -> str:
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name NOT LIKE 'sqlite_%';
-        """)
-        tables = cur.fetchall()
-        schema = ""
-        for row in tables:
-            table_name = row[0]
-            schema += f"\nTABLE {table_name}:\n"
-
-            # Column info with PK marker
-            cur.execute(f'PRAGMA table_info("{table_name}");')
-            cols = cur.fetchall()
-            for col in cols:
-                pk_marker = " [PRIMARY KEY]" if col[5] else ""
-                notnull = " NOT NULL" if col[3] else ""
-                default = f" DEFAULT {col[4]}" if col[4] is not None else ""
-                schema += f"  - {col[1]} ({col[2]}{notnull}{default}{pk_marker})\n"
-
-            # Foreign keys
-            cur.execute(f'PRAGMA foreign_key_list("{table_name}");')
-            fks = cur.fetchall()
-            if fks:
-                schema += f"  FOREIGN KEYS:\n"
-                for fk in fks:
-                    schema += f"    - {fk[3]} -> {fk[2]}.{fk[4]}\n"
-
-            # Indexes
-            cur.execute(f'PRAGMA index_list("{table_name}");')
-            indexes = cur.fetchall()
-            if indexes:
-                schema += f"  INDEXES:\n"
-                for idx in indexes:
-                    idx_name = idx[1]
-                    unique = "UNIQUE " if idx[2] else ""
-                    cur.execute(f'PRAGMA index_info("{idx_name}");')
-                    idx_cols = [ic[2] for ic in cur.fetchall()]
-                    schema += f"    - {unique}{idx_name} ({', '.join(idx_cols)})\n"
-
-            # Sample data (3 rows) for context - skip binary/blob columns
-            try:
-                cur.execute(f'SELECT * FROM "{table_name}" LIMIT 3;')
-                sample_rows = cur.fetchall()
-                if sample_rows:
-                    col_names = [c[1] for c in cols]
-                    col_types = [c[2].upper() for c in cols]
-                    schema += f"  SAMPLE DATA ({len(sample_rows)} rows):\n"
-                    for sr in sample_rows:
-                        pairs = []
-                        for i in range(min(len(col_names), len(sr))):
-                            if col_types[i] in ("BLOB", "BINARY", "VARBINARY", "IMAGE"):
-                                continue
-                            val = sr[i]
-                            if isinstance(val, bytes):
-                                continue
-                            val_str = str(val)[:60]
-                            pairs.append(f"{col_names[i]}={val_str}")
-                        schema += f"    {', '.join(pairs)}\n"
-            except Exception:
-                pass
-
-        self.disconnect()
-        return schema
-
-    def get_foreign_keys(self) -> list:
-        """Returns all foreign key relationships across all tables."""
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
-        tables = [r[0] for r in cur.fetchall()]
-        fk_list = []
-        for table in tables:
-            cur.execute(f'PRAGMA foreign_key_list("{table}");')
-            for fk in cur.fetchall():
-                fk_list.append({
-                    "from_table": table,
-                    "from_column": fk[3],
-                    "to_table": fk[2],
-                    "to_column": fk[4],
-                })
-        self.disconnect()
-        return fk_list
-
-    def get_indexes(self) -> list:
-        """Returns all indexes across all tables."""
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
-        tables = [r[0] for r in cur.fetchall()]
-        idx_list = []
-        for table in tables:
-            cur.execute(f'PRAGMA index_list("{table}");')
-            for idx in cur.fetchall():
-                cur.execute(f'PRAGMA index_info("{idx[1]}");')
-                cols = [ic[2] for ic in cur.fetchall()]
-                idx_list.append({
-                    "table": table,
-                    "index_name": idx[1],
-                    "unique": bool(idx[2]),
-                    "columns": cols,
+    def schema_fingerprint(self):
+        # Bumped by SQLite on every schema change
+        with self.borrow() as conn:
+            return conn.execute("PRAGMA schema_version").fetchone()[0]
+
+    def _load_schema_model(self):
+        """
+        Three set-based queries: sqlite_master joined with the pragma
+        table-valued functions for columns, foreign keys and index columns.
+        """
+        model = {}
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                SELECT m.name, p.name, p.type, p."notnull", p.dflt_value, p.pk
+                FROM sqlite_master m, pragma_table_info(m.name) p
+                WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+                ORDER BY m.rowid, p.cid
+            """)
+            for table, name, ctype, notnull, default, pk in cur.fetchall():
+                info = model.setdefault(table, {"columns": [], "foreign_keys": [], "indexes": []})
+                info["columns"].append({
+                    "name": name, "type": ctype,
+                    "not_null": bool(notnull), "default": default,
+                    "primary_key": bool(pk),
                 })
-        self.disconnect()
-        return idx_list
+
+            cur.execute("""
+                SELECT m.name, f."from", f."table", f."to"
+                FROM sqlite_master m, pragma_foreign_key_list(m.name) f
+                WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+                ORDER BY m.rowid, f.id, f.seq
+            """)
+            for table, col, ref_table, ref_col in cur.fetchall():
+                model[table]["foreign_keys"].append({"from": col, "to_table": ref_table, "to_column": ref_col})
+
+            # index_xinfo key=1 rows are the indexed columns (key=0 are the trailing rowid/aux columns)
+            cur.execute("""
+                SELECT m.name, il.name, il."unique", il.origin, ix.name
+                FROM sqlite_master m, pragma_index_list(m.name) il, pragma_index_xinfo(il.name) ix
+                WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%' AND ix.key = 1
+                ORDER BY m.rowid, il.seq, ix.seqno
+            """)
+            indexes = {}
+            for table, idx_name, unique, origin, col in cur.fetchall():
+                idx = indexes.get((table, idx_name))
+                if idx is None:
+                    idx = {"name": idx_name, "unique": bool(unique), "primary": origin == "pk", "columns": []}
+                    indexes[(table, idx_name)] = idx
+                    model[table]["indexes"].append(idx)
+                idx["columns"].append(col)
+        return model
+
+    def get_schema(self) -> str:
+        model = self.schema_model()
+        samples = {}
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            for table_name in model:
+                # Sample data (3 rows) for context
+                try:
+                    cur.execute(f'SELECT * FROM "{table_name}" LIMIT 3;')
+                    samples[table_name] = cur.fetchall()
+                except Exception:
+                    pass
+        return self._render_schema(model, samples)
 
     def describe_table(self, table_name: str) -> dict:
         """Returns detailed info about a single table."""
-        self.connect()
-        cur = self._conn.cursor()
-
-        # Columns
-        cur.execute(f'PRAGMA table_info("{table_name}");')
-        columns = []
-        for col in cur.fetchall():
-            columns.append({
-                "name": col[1], "type": col[2],
-                "not_null": bool(col[3]), "default": col[4],
-                "primary_key": bool(col[5]),
-            })
-
-        # Foreign keys
-        cur.execute(f'PRAGMA foreign_key_list("{table_name}");')
-        fks = [{"from": fk[3], "to_table": fk[2], "to_column": fk[4]} for fk in cur.fetchall()]
-
-        # Indexes
-        cur.execute(f'PRAGMA index_list("{table_name}");')
-        indexes = []
-        for idx in cur.fetchall():
-            cur.execute(f'PRAGMA index_info("{idx[1]}");')
-            cols = [ic[2] for ic in cur.fetchall()]
-            indexes.append({"name": idx[1], "unique": bool(idx[2]), "columns": cols})
-
-        # Row count
-        cur.execute(f'SELECT COUNT(*) FROM "{table_name}";')
-        row_count = cur.fetchone()[0]
-
-        self.disconnect()
-        return {
-            "table": table_name, "columns": columns,
-            "foreign_keys": fks, "indexes": indexes,
-            "row_count": row_count,
-        }
-
-    def get_constraints(self) -> list:
-        """Returns all constraints (PK, FK, NOT NULL, UNIQUE) across all tables."""
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
-        tables = [r[0] for r in cur.fetchall()]
-        constraints = []
-        for t in tables:
-            cur.execute(f'PRAGMA table_info("{t}");')
-            for col in cur.fetchall():
-                if col[5]:
-                    constraints.append({"table": t, "type": "PRIMARY KEY", "details": col[1]})
-            cur.execute(f'PRAGMA foreign_key_list("{t}");')
-            for fk in cur.fetchall():
-                constraints.append({"table": t, "type": "FOREIGN KEY", "details": f"{fk[3]} -> {fk[2]}.{fk[4]}"})
-            cur.execute(f'PRAGMA table_info("{t}");')
-            for col in cur.fetchall():
-                if col[3]:
-                    constraints.append({"table": t, "type": "NOT NULL", "details": col[1]})
-            cur.execute(f'PRAGMA index_list("{t}");')
-            for idx in cur.fetchall():
-                if idx[2]:
-                    cur.execute(f'PRAGMA index_info("{idx[1]}");')
-                    idx_cols = [ic[2] for ic in cur.fetchall()]
-                    constraints.append({"table": t, "type": "UNIQUE", "details": f"{idx[1]} ({', '.join(idx_cols)})"})
-        self.disconnect()
-        return constraints
+        info = self._describe_from_model(table_name)
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            cur.execute(f'SELECT COUNT(*) FROM "{table_name}";')
+            info["row_count"] = cur.fetchone()[0]
+        return info
+
+    def _estimate_table_stats(self):
+        """Row estimates from sqlite_stat1 (written by ANALYZE); sizes from dbstat if compiled in."""
+        stats = {}
+        with self.borrow() as conn:
+            try:
+                # The first number of each stat string is the table's row count
+                for tbl, rows in conn.execute(
+                        "SELECT tbl, MAX(CAST(stat AS INTEGER)) FROM sqlite_stat1 GROUP BY tbl"):
+                    stats[tbl] = {"rows": rows, "size_bytes": None, "last_analyzed": None}
+            except sqlite3.OperationalError:
+                pass   # never analyzed
+            try:
+                for name, size in conn.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name"):
+                    stats.setdefault(name, {"rows": None, "size_bytes": None, "last_analyzed": None})
+                    stats[name]["size_bytes"] = size
+            except sqlite3.OperationalError:
+                pass   # SQLITE_ENABLE_DBSTAT_VTAB not set
+        return stats
+
+    def estimate_query_rows(self, query: str):
+        """
+        sqlite_stat1 estimate for single-table plans: the table's rows for a
+        scan (an upper bound when filtered), or the index's rows-per-key for
+        an equality search. Needs ANALYZE to have run.
+        """
+        if _AGGREGATE.search(query):
+            return None   # the plan shows the scan, not the collapsed result
+        with self.borrow() as conn:
+            plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query.rstrip(';')}")]
+            steps = [d for d in plan if d.startswith(("SCAN", "SEARCH"))]
+            step = _EQP_STEP.match(steps[0]) if len(steps) == 1 else None
+            if not step:
+                return None   # joins, subqueries, or no table at all
+            if "INTEGER PRIMARY KEY (rowid=?)" in steps[0]:
+                return 1
+            _, table, index, terms = step.groups()
+            try:
+                stats = dict(conn.execute("SELECT idx, stat FROM sqlite_stat1 WHERE tbl = ?", (table,)).fetchall())
+            except sqlite3.OperationalError:
+                return None   # never analyzed
+        if not stats:
+            return None
+        table_rows = max(int(s.split()[0]) for s in stats.values())
+        if index and index in stats and terms and ">" not in terms and "<" not in terms:
+            per_key = stats[index].split()
+            depth = terms.count("=")
+            if 0 < depth < len(per_key):
+                return int(per_key[depth])
+        return table_rows
 
     def get_create_table(self, table_name: str) -> str:
         """Returns the DDL / CREATE TABLE statement for a table."""
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
-        row = cur.fetchone()
-        self.disconnect()
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
+            row = cur.fetchone()
         return row[0] if row and row[0] else f"-- Table '{table_name}' not found"
 
     def list_tables(self) -> list:
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name NOT LIKE 'sqlite_%';
-        """)
-        tables = [row[0] for row in cur.fetchall()]
-        self.disconnect()
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type='table' AND name NOT LIKE 'sqlite_%';
+            """)
+            tables = [row[0] for row in cur.fetchall()]
         return tables
 
     # --------------------------------------------------
     # Execution
     # --------------------------------------------------
     def execute(self, query: str) -> tuple:
-        conn = self.get_connection()
-        cur = conn.cursor()
-        try:
-            cur.execute(query)
-            if cur.description:
+        replica = self.replica_for(query)
+        if replica is not self:
+            return replica.execute(query)
+        with self.borrow() as conn, self._guarded(conn):
+            cur = conn.cursor()
+            try:
+                cur.execute(query)
+                if cur.description:
+                    columns = [desc[0] for desc in cur.description]
+                    rows = [list(r) for r in cur.fetchall()]
+                else:
+                    columns = []
+                    rows = []
+                conn.commit()
+                return columns, rows
+            finally:
+                cur.close()
+
+    def _cancel_statement(self, conn):
+        # No server-side timeout; interrupt() is the one thread-safe call
+        conn.interrupt()
+
+    def execute_iter(self, query: str, batch_size: int = 1000):
+        replica = self.replica_for(query)
+        if replica is not self:
+            yield from replica.execute_iter(query, batch_size)
+            return
+        # Guarded across the yields: interrupt() stops the open statement mid-stream
+        with self.borrow() as conn, self._guarded(conn):
+            cur = conn.cursor()
+            try:
+                cur.execute(query)
+                if not cur.description:
+                    conn.commit()
+                    yield [], []
+                    return
                 columns = [desc[0] for desc in cur.description]
-                rows = [list(r) for r in cur.fetchall()]
-            else:
-                columns = []
-                rows = []
-            conn.commit()
-            return columns, rows
-        finally:
-            cur.close()
+                yield columns, [list(r) for r in cur.fetchmany(batch_size)]
+                for rows in iter(lambda: cur.fetchmany(batch_size), []):
+                    yield columns, [list(r) for r in rows]
+            finally:
+                cur.close()
+
     def dry_run(self, query: str) -> dict:
-        conn = self.get_connection()
         # SQLite doesn't support easy dry-run with cursor alone without commit,
         # but we can wrap in a transaction and rollback.
-        try:
-            conn.execute("BEGIN")
-            cur = conn.cursor()
-            cur.execute(query)
-            affected = conn.total_changes
-            conn.rollback()
-            return {
-                "affected_rows": affected,
-                "status": "Success (Rolled back)",
-                "success": True
-            }
-        except Exception as e:
-            try: conn.rollback()
-            except: pass
-            return {
-                "affected_rows": 0,
-                "status": f"Error: {str(e)}",
-                "success": False
-            }
-        finally:
-            cur.close()
+        with self.borrow() as conn:
+            # total_changes is cumulative for a (pooled) connection
+            before = conn.total_changes
+            try:
+                conn.execute("BEGIN")
+                conn.execute(query)
+                affected = conn.total_changes - before
+                conn.rollback()
+                return {
+                    "affected_rows": affected,
+                    "status": "Success (Rolled back)",
+                    "success": True
+                }
+            except Exception as e:
+                try: conn.rollback()
+                except: pass
+                return {
+                    "affected_rows": 0,
+                    "status": f"Error: {str(e)}",
+                    "success": False
+                }
 
     # --------------------------------------------------
     # Safety
@@ -310,28 +327,37 @@ class SQLiteAdapter(DatabaseAdapter):
             return None
 
         count_sql = q.lower().replace("delete", "select count(*)", 1)
-        self.connect()
-        cur = self._conn.cursor()
-        cur.execute(count_sql)
-        row = cur.fetchone()
-        self.disconnect()
+        with self.borrow() as conn:
+            cur = conn.cursor()
+            cur.execute(count_sql)
+            row = cur.fetchone()
         return row[0] if row else 0
 
     # --------------------------------------------------
     # Snapshots
     # --------------------------------------------------
     def take_snapshot(self, filepath: str) -> bool:
-        import shutil
+        # Online backup API: consistent even with WAL frames not yet checkpointed
         source_path = _resolve_db_path(self.config.get("db_path", "db/main.db"))
         if not os.path.exists(source_path):
             return False
-        shutil.copy(source_path, filepath)
+        target = sqlite3.connect(filepath)
+        try:
+            with self.borrow() as conn:
+                conn.backup(target)
+        finally:
+            target.close()
         return True
 
     def restore_snapshot(self, filepath: str) -> bool:
-        import shutil
-        target_path = _resolve_db_path(self.config.get("db_path", "db/main.db"))
+        # Copy pages back through a live connection so pooled handles
+        # (and the WAL) stay consistent instead of overwriting the file
         if not os.path.exists(filepath):
             return False
-        shutil.copy(filepath, target_path)
+        source = sqlite3.connect(filepath)
+        try:
+            with self.borrow() as conn:
+                source.backup(conn)
+        finally:
+            source.close()
         return True
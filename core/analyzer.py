@@ -4,7 +4,6 @@ import re
 import time
 import uuid
 import threading
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from groq import Groq
 from dotenv import load_dotenv
 
@@ -23,6 +22,8 @@ except Exception:
 _analysis_jobs = {}  # job_id -> {status, progress, step, total_steps, result, created_at}
 _jobs_lock = threading.Lock()
 
+ANALYSIS_QUERY_TIMEOUT = 30  # seconds per generated query; cancelled on the server when exceeded
+
 
 def analyze_data(columns: list, rows: list, user_hint: str = "") -> dict:
     """
@@ -573,12 +574,10 @@ def get_job_status(job_id: str) -> dict:
         }
 
 
-def _ensure_limit(sql: str, limit: int = 500) -> str:
-    """Inject LIMIT clause if missing from a SQL query."""
-    sql_lower = sql.strip().lower()
-    if "limit" not in sql_lower:
-        sql = sql.rstrip(";") + f" LIMIT {limit}"
-    return sql
+def _ensure_limit(sql: str, dialect: str, limit: int = 500) -> str:
+    """Cap a generated query at `limit` rows in the dialect's own syntax."""
+    from core.row_limit import limit_sql
+    return limit_sql(sql, dialect, limit)
 
 
 def run_full_analysis_pipeline(job_id: str, connection_name: str, dialect: str):
@@ -586,6 +585,7 @@ def run_full_analysis_pipeline(job_id: str, connection_name: str, dialect: str):
     Background pipeline: collect schema → generate queries → execute → generate report.
     Updates _analysis_jobs[job_id] with progress at each step.
     """
+    from core.adapters.base import QueryCancelled
     from core.connection_manager import get_adapter_for_connection
     from core.validator import classify_query, is_safe
 
@@ -593,7 +593,7 @@ def run_full_analysis_pipeline(job_id: str, connection_name: str, dialect: str):
         # Step 1: Collect schema
         _update_job(job_id, status="collecting_schema", progress="Collecting database schema...", step=1)
         adapter = get_adapter_for_connection(connection_name)
-        schema = adapter.get_schema()
+        schema = adapter.cached_schema()
         tables = adapter.list_tables()
 
         if not tables:
@@ -601,14 +601,7 @@ def run_full_analysis_pipeline(job_id: str, connection_name: str, dialect: str):
             return
 
         # Collect row counts
-        table_stats = []
-        for t in tables:
-            try:
-                _, count_rows = adapter.execute(f'SELECT COUNT(*) FROM "{t}"')
-                count = count_rows[0][0] if count_rows else 0
-            except Exception:
-                count = 0
-            table_stats.append({"table": t, "rows": count})
+        table_stats = [{"table": s["table"], "rows": s["rows"] or 0} for s in adapter.table_stats()]
 
         # Collect FK info
         fk_info = []
@@ -635,7 +628,6 @@ def run_full_analysis_pipeline(job_id: str, connection_name: str, dialect: str):
 
         # Step 3..N: Execute queries
         query_results = []
-        executor = ThreadPoolExecutor(max_workers=1)
 
         for i, q in enumerate(queries):
             step_num = 3 + i
@@ -659,27 +651,24 @@ def run_full_analysis_pipeline(job_id: str, connection_name: str, dialect: str):
                 query_results.append(result_entry)
                 continue
 
-            # Ensure LIMIT
-            if dialect not in ("mongodb", "redis"):
-                sql = _ensure_limit(sql)
-                result_entry["sql"] = sql
+            # Push the row cap down to the engine (Redis commands pass through)
+            sql = _ensure_limit(sql, dialect)
+            result_entry["sql"] = sql
 
-            # Execute with timeout
+            # Execute under a deadline: a runaway query is cancelled, not left running
             try:
-                future = executor.submit(adapter.execute, sql)
-                columns, rows = future.result(timeout=30)
+                with adapter.deadline(ANALYSIS_QUERY_TIMEOUT):
+                    columns, rows = adapter.execute(sql)
                 # Convert rows to plain lists
                 result_entry["columns"] = columns
                 result_entry["rows"] = [list(r) if isinstance(r, (list, tuple)) else [r] for r in rows]
-            except FuturesTimeoutError:
-                result_entry["error"] = "Query timed out (>30s)"
+            except QueryCancelled:
+                result_entry["error"] = f"Query timed out (>{ANALYSIS_QUERY_TIMEOUT}s) and was cancelled"
             except Exception as e:
                 result_entry["error"] = str(e)
 
             query_results.append(result_entry)
 
-        executor.shutdown(wait=False)
-
         # Check if any queries succeeded
         successful = [qr for qr in query_results if not qr.get("error")]
         if not successful:
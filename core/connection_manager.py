@@ -6,7 +6,10 @@ Credentials are stored encrypted in db/connections.json.
 
 import os
 import json
+import time
 import base64
+import hashlib
+import threading
 from cryptography.fernet import Fernet
 
 from core.adapters import get_adapter, DB_TYPES
@@ -18,6 +21,9 @@ from core.paths import db_path
 CONN_FILE = db_path("connections.json")
 KEY_FILE = db_path(".secret_key")
 
+# Live adapters unused for this many seconds are disconnected and dropped
+ADAPTER_IDLE_TTL = int(os.getenv("ADAPTER_IDLE_TTL", "900"))
+
 
 # ---------------------------------------------------
 # Encryption helpers
@@ -70,6 +76,84 @@ def _save_connections(data: dict):
         json.dump(data, f, indent=2)
 
 
+# ---------------------------------------------------
+# Live adapter registry
+# ---------------------------------------------------
+# One adapter (and therefore one connection pool) per saved connection,
+# shared by every request in this process. Entries are keyed by name and
+# tagged with a hash of the stored config so edits made by another worker
+# are picked up on the next lookup.
+_registry = {}
+_registry_lock = threading.Lock()
+_registry_stats = {"hits": 0, "misses": 0, "unpooled": 0, "evictions": 0}
+
+
+def _config_hash(info: dict) -> str:
+    """Stable hash of a stored connection entry (password stays encrypted)."""
+    raw = json.dumps(info, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _close_adapters(adapters: list):
+    for adapter in adapters:
+        try:
+            adapter.disconnect()
+        except Exception:
+            pass
+
+
+def _pop_idle_locked(now: float) -> list:
+    """Remove idle entries. Caller must hold _registry_lock."""
+    idle = [n for n, e in _registry.items() if now - e["last_used"] > ADAPTER_IDLE_TTL]
+    evicted = [_registry.pop(n)["adapter"] for n in idle]
+    _registry_stats["evictions"] += len(evicted)
+    return evicted
+
+
+def _build_adapter(info: dict):
+    db_type = info["db_type"]
+    config = dict(info["config"])
+
+    # Decrypt password
+    if "password" in config and config["password"]:
+        try:
+            config["password"] = _decrypt(config["password"])
+        except Exception:
+            pass  # Already plaintext or corrupted
+
+    adapter_cls = get_adapter(db_type)
+    return adapter_cls(config)
+
+
+def invalidate_adapter(name: str):
+    """Drop the live adapter for a connection and close its pool."""
+    with _registry_lock:
+        entry = _registry.pop(name, None)
+    if entry:
+        _close_adapters([entry["adapter"]])
+
+
+def adapter_registry_stats() -> dict:
+    """Hit/miss counters and the live pools currently held by this process."""
+    now = time.time()
+    with _registry_lock:
+        live = [{
+            "name": name,
+            "db_type": entry["db_type"],
+            "age_seconds": round(now - entry["created"], 1),
+            "idle_seconds": round(now - entry["last_used"], 1),
+            "pool": entry["adapter"].pool_stats(),
+            "replicas": entry["adapter"].replica_status(),
+            "schema_cache": entry["adapter"].schema_cache_stats(),
+        } for name, entry in _registry.items()]
+        stats = dict(_registry_stats)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+    stats["idle_ttl"] = ADAPTER_IDLE_TTL
+    stats["live_pools"] = live
+    return stats
+
+
 # ---------------------------------------------------
 # Public API
 # ---------------------------------------------------
@@ -117,6 +201,7 @@ def add_connection(name: str, db_type: str, config: dict) -> dict:
         "config": encrypted_config,
     }
     _save_connections(conns)
+    invalidate_adapter(name.strip())
     return {"success": True, "message": f"Connection '{name}' saved."}
 
 
@@ -126,31 +211,53 @@ def delete_connection(name: str) -> dict:
         return {"success": False, "message": f"Connection '{name}' not found."}
     del conns[name]
     _save_connections(conns)
+    invalidate_adapter(name)
     return {"success": True, "message": f"Connection '{name}' deleted."}
 
 
 def get_adapter_for_connection(name: str):
     """
-    Returns an instantiated adapter for the named connection.
+    Returns the live adapter for the named connection.
+    Adapters that can serve concurrent requests are kept in the registry so
+    their pools survive across requests; others are built fresh each call.
     Decrypts the password before passing config to the adapter.
     """
     conns = _load_connections()
     if name not in conns:
+        invalidate_adapter(name)
         raise ValueError(f"Connection '{name}' not found.")
 
     info = conns[name]
-    db_type = info["db_type"]
-    config = dict(info["config"])
-
-    # Decrypt password
-    if "password" in config and config["password"]:
-        try:
-            config["password"] = _decrypt(config["password"])
-        except Exception:
-            pass  # Already plaintext or corrupted
-
-    adapter_cls = get_adapter(db_type)
-    return adapter_cls(config)
+    fingerprint = _config_hash(info)
+    now = time.time()
+    stale = []
+    try:
+        with _registry_lock:
+            stale = _pop_idle_locked(now)
+            entry = _registry.get(name)
+            if entry and entry["config_hash"] == fingerprint:
+                entry["last_used"] = now
+                _registry_stats["hits"] += 1
+                return entry["adapter"]
+            if entry:
+                stale.append(_registry.pop(name)["adapter"])
+
+            adapter = _build_adapter(info)
+            if not adapter.is_shareable:
+                _registry_stats["unpooled"] += 1
+                return adapter
+
+            _registry_stats["misses"] += 1
+            _registry[name] = {
+                "adapter": adapter,
+                "db_type": info["db_type"],
+                "config_hash": fingerprint,
+                "created": now,
+                "last_used": now,
+            }
+            return adapter
+    finally:
+        _close_adapters(stale)
 
 
 def test_connection(name: str) -> dict:
@@ -17,17 +17,27 @@ about what it accepts:
   constants; any value outside the set raises ``JoinSpecError``.
 * Hard caps are applied on columns, joins, and row count.
 
-The module has zero external dependencies and is self-testable: run
+The module depends only on its sibling ``row_limit`` and is self-testable: run
 ``python core/join_center.py`` to exercise the identifier quoter, the literal
 escaper, and the SQL builder against a fabricated schema.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import math
 import re
+import threading
+import weakref
+from collections import OrderedDict
 from typing import Any
 
+try:
+    from core.row_limit import limit_sql
+except ImportError:   # run as ``python core/join_center.py``
+    from row_limit import limit_sql
+
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -44,6 +54,7 @@ MAX_ROWS = 1000
 MAX_JOINS = 10
 MAX_COLUMNS = 200
 DEFAULT_LIMIT = 100
+JOIN_SQL_CACHE_SIZE = 256
 
 # Must start with letter/underscore; alnum/_/$ segments separated by single
 # spaces. No leading/trailing/consecutive spaces. ASCII-only by design.
@@ -110,6 +121,18 @@ def escape_literal(value: Any, dialect: str) -> str:
 # ---------------------------------------------------------------------------
 def build_schema_snapshot(adapter) -> dict:
     """Return a dialect-aware schema snapshot used for validation and UI hints."""
+    describe_all = getattr(adapter, "describe_all", None)
+    if describe_all is not None:
+        return _snapshot_from_describe_all(adapter, describe_all())
+    # Pin one pooled connection for the per-table describe_table calls
+    session = getattr(adapter, "session", None)
+    if session is None:
+        return _collect_schema_snapshot(adapter)
+    with session():
+        return _collect_schema_snapshot(adapter)
+
+
+def _collect_schema_snapshot(adapter) -> dict:
     dialect = getattr(adapter, "dialect", "") or ""
     tables_out: list[dict] = []
 
@@ -161,12 +184,164 @@ def build_schema_snapshot(adapter) -> dict:
     return {"dialect": dialect, "tables": tables_out}
 
 
-def _table_lookup(schema: dict) -> dict:
-    return {t["name"]: t for t in schema.get("tables", [])}
+def _snapshot_from_describe_all(adapter, described: dict) -> dict:
+    """Snapshot from the adapter's cached bulk describe; carries its version for ETags."""
+    tables_out: list[dict] = []
+    for info in described.get("tables", []):
+        tname = info.get("table", "")
+        tables_out.append({
+            "name": tname,
+            "columns": [{
+                "name": c.get("name", ""),
+                "type": c.get("type", ""),
+                "pk": bool(c.get("primary_key", False)),
+            } for c in info.get("columns") or []],
+            "foreign_keys": [{
+                "from_table": tname,
+                "from_column": fk.get("from", ""),
+                "to_table": fk.get("to_table", ""),
+                "to_column": fk.get("to_column", ""),
+            } for fk in info.get("foreign_keys") or []],
+        })
+    return {
+        "dialect": getattr(adapter, "dialect", "") or "",
+        "tables": tables_out,
+        "version": described.get("version"),
+    }
 
 
-def _column_names(table: dict) -> set:
-    return {c["name"] for c in table.get("columns", [])}
+# ---------------------------------------------------------------------------
+# Compiled schema model
+# ---------------------------------------------------------------------------
+class SchemaModel:
+    """
+    A schema snapshot compiled once for repeated lookups: the table dicts,
+    a frozenset of column names per table and FK adjacency lists in both
+    directions. Read-only; build a new one when the schema changes.
+    """
+
+    def __init__(self, schema: dict):
+        self.dialect = (schema.get("dialect") or "").lower()
+        self.version = schema.get("version")
+        self.tables = {t["name"]: t for t in schema.get("tables", [])}
+        self.columns = {
+            name: frozenset(c["name"] for c in t.get("columns", []))
+            for name, t in self.tables.items()
+        }
+        # table -> FKs it declares / FKs that point at it
+        self.references = {name: [] for name in self.tables}
+        self.referenced_by = {name: [] for name in self.tables}
+        for name, t in self.tables.items():
+            for fk in t.get("foreign_keys") or []:
+                self.references[name].append(fk)
+                if fk.get("to_table") in self.referenced_by:
+                    self.referenced_by[fk["to_table"]].append(fk)
+        self.graph = self._build_graph()
+
+    def has_column(self, table: str, column: str) -> bool:
+        return column in self.columns.get(table, ())
+
+    def _build_graph(self) -> dict:
+        """
+        Undirected FK graph: table -> [(neighbour, [(own column, neighbour column), ...])].
+        Snapshots list FK columns one per entry, in constraint order; consecutive
+        entries to the same table with distinct target columns are taken as one
+        composite key, a repeated target column starts a new FK.
+        """
+        graph = {name: [] for name in self.tables}
+        for name, fks in self.references.items():
+            groups: list = []
+            for fk in fks:
+                target = fk.get("to_table")
+                if target not in graph or target == name:
+                    continue   # dangling or self-referencing
+                pair = (fk.get("from_column", ""), fk.get("to_column", ""))
+                last = groups[-1] if groups else None
+                if last and last[0] == target and pair[1] not in {p[1] for p in last[1]}:
+                    last[1].append(pair)
+                else:
+                    groups.append((target, [pair]))
+            for target, pairs in groups:
+                graph[name].append((target, pairs))
+                graph[target].append((name, [(b, a) for a, b in pairs]))
+        return graph
+
+    def join_path(self, tables: list) -> list:
+        """
+        Connect the given tables through the FK graph with as few joins as
+        possible (greedy: repeatedly attach the nearest remaining table to
+        the tree built so far, pulling in bridge tables on the way).
+        Returns [(table, parent, [(parent column, table column), ...])] in
+        join order, starting from tables[0].
+        """
+        for t in tables:
+            if t not in self.tables:
+                raise JoinSpecError(f"Unknown table: {t!r}")
+        if not tables:
+            return []
+        in_tree = {tables[0]}
+        steps: list = []
+        remaining = [t for t in dict.fromkeys(tables[1:]) if t not in in_tree]
+        while remaining:
+            # Multi-source BFS from every table already in the tree
+            parents: dict = {t: None for t in in_tree}
+            queue = list(in_tree)
+            found = None
+            while queue and found is None:
+                nxt = []
+                for node in queue:
+                    for neighbour, pairs in self.graph[node]:
+                        if neighbour in parents:
+                            continue
+                        parents[neighbour] = (node, pairs)
+                        if neighbour in remaining:
+                            found = neighbour
+                            break
+                        nxt.append(neighbour)
+                    if found is not None:
+                        break
+                queue = nxt
+            if found is None:
+                raise JoinSpecError(
+                    f"No foreign-key path connects {', '.join(remaining)} to {tables[0]!r}."
+                )
+            chain = []
+            node = found
+            while parents[node] is not None:
+                parent, pairs = parents[node]
+                chain.append((node, parent, pairs))
+                node = parent
+            for step in reversed(chain):
+                steps.append(step)
+                in_tree.add(step[0])
+            remaining = [t for t in remaining if t not in in_tree]
+        return steps
+
+
+def _as_model(schema) -> SchemaModel:
+    return schema if isinstance(schema, SchemaModel) else SchemaModel(schema)
+
+
+# One compiled model per adapter, replaced when the describe_all version moves
+_MODELS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_MODELS_LOCK = threading.Lock()
+
+
+def get_schema_model(adapter) -> SchemaModel:
+    """Return the compiled SchemaModel for this adapter's current schema."""
+    describe_all = getattr(adapter, "describe_all", None)
+    if describe_all is None:
+        return SchemaModel(build_schema_snapshot(adapter))
+    described = describe_all()
+    version = described.get("version")
+    with _MODELS_LOCK:
+        model = _MODELS.get(adapter)
+    if model is not None and version is not None and model.version == version:
+        return model
+    model = SchemaModel(_snapshot_from_describe_all(adapter, described))
+    with _MODELS_LOCK:
+        _MODELS[adapter] = model
+    return model
 
 
 # ---------------------------------------------------------------------------
@@ -174,19 +349,16 @@ def _column_names(table: dict) -> set:
 # ---------------------------------------------------------------------------
 def suggest_joins(adapter, left_table: str, right_table: str) -> list:
     """Suggest plausible join conditions between two tables."""
-    schema = build_schema_snapshot(adapter)
-    tables = _table_lookup(schema)
-    left = tables.get(left_table)
-    right = tables.get(right_table)
-    if not left or not right:
+    model = get_schema_model(adapter)
+    if left_table not in model.tables or right_table not in model.tables:
         return []
 
     suggestions: list[dict] = []
     seen: set = set()
 
     # FK-driven suggestions (both directions)
-    for fk in left.get("foreign_keys", []) or []:
-        if fk.get("from_table") == left_table and fk.get("to_table") == right_table:
+    for fk in model.references[left_table]:
+        if fk.get("to_table") == right_table:
             key = (fk["from_column"], fk["to_column"])
             if key not in seen:
                 seen.add(key)
@@ -195,8 +367,8 @@ def suggest_joins(adapter, left_table: str, right_table: str) -> list:
                     "right": f"{right_table}.{fk['to_column']}",
                     "confidence": "fk",
                 })
-    for fk in right.get("foreign_keys", []) or []:
-        if fk.get("from_table") == right_table and fk.get("to_table") == left_table:
+    for fk in model.references[right_table]:
+        if fk.get("to_table") == left_table:
             key = (fk["to_column"], fk["from_column"])
             if key not in seen:
                 seen.add(key)
@@ -207,9 +379,7 @@ def suggest_joins(adapter, left_table: str, right_table: str) -> list:
                 })
 
     # Name-match fallback
-    left_cols = _column_names(left)
-    right_cols = _column_names(right)
-    for col in sorted(left_cols & right_cols):
+    for col in sorted(model.columns[left_table] & model.columns[right_table]):
         key = (col, col)
         if key in seen:
             continue
@@ -223,21 +393,53 @@ def suggest_joins(adapter, left_table: str, right_table: str) -> list:
     return suggestions
 
 
+def plan_join(adapter, tables: list, join_type: str = "INNER") -> dict:
+    """
+    Plan a JoinSpec connecting ``tables`` along the shortest FK paths,
+    adding bridge tables as needed. Returns {"spec", "path"}.
+    """
+    if not isinstance(tables, list) or not tables or not all(isinstance(t, str) for t in tables):
+        raise JoinSpecError("tables must be a non-empty list of table names.")
+    if len(tables) > MAX_JOINS + 1:
+        raise JoinSpecError(f"Too many tables (max {MAX_JOINS + 1}).")
+    join_type = (join_type or "INNER").upper()
+    if join_type not in VALID_JOIN_TYPES - {"CROSS"}:
+        raise JoinSpecError(f"Invalid join type: {join_type!r}")
+
+    model = get_schema_model(adapter)
+    steps = model.join_path(tables)
+    if len(steps) > MAX_JOINS:
+        raise JoinSpecError(f"Join path needs {len(steps)} joins (max {MAX_JOINS}).")
+
+    joins = []
+    path = []
+    for table, parent, pairs in steps:
+        joins.append({
+            "table": table,
+            "type": join_type,
+            "on": [{"left_table": parent, "left_column": pc,
+                    "right_table": table, "right_column": tc, "op": "="}
+                   for pc, tc in pairs],
+        })
+        path.append({"from": parent, "to": table, "bridge": table not in tables,
+                     "columns": [[pc, tc] for pc, tc in pairs]})
+    return {"spec": {"base_table": tables[0], "joins": joins}, "path": path}
+
+
 # ---------------------------------------------------------------------------
 # SQL builder
 # ---------------------------------------------------------------------------
-def _ensure_dialect(schema: dict) -> str:
-    dialect = (schema.get("dialect") or "").lower()
-    if dialect not in SUPPORTED_DIALECTS:
-        raise JoinSpecError(f"Unsupported dialect: {dialect!r}")
-    return dialect
+def _ensure_dialect(model: SchemaModel) -> str:
+    if model.dialect not in SUPPORTED_DIALECTS:
+        raise JoinSpecError(f"Unsupported dialect: {model.dialect!r}")
+    return model.dialect
 
 
 def _validate_column(alias_to_table: dict, ref_name: str, column: str) -> None:
-    table = alias_to_table.get(ref_name)
-    if table is None:
+    columns = alias_to_table.get(ref_name)
+    if columns is None:
         raise JoinSpecError(f"Unknown table/alias in reference: {ref_name!r}")
-    if column not in _column_names(table):
+    if column not in columns:
         raise JoinSpecError(f"Column {column!r} not found in {ref_name!r}.")
 
 
@@ -245,13 +447,62 @@ def _qualify(ref_name: str, column: str, dialect: str) -> str:
     return f"{quote_ident(ref_name, dialect)}.{quote_ident(column, dialect)}"
 
 
-def build_join_sql(spec: dict, schema: dict) -> str:
-    """Validate a JoinSpec against the schema and build a safe SELECT statement."""
+# Built SQL keyed by (schema version, dialect, canonical JoinSpec hash)
+_JOIN_SQL_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_JOIN_SQL_CACHE_LOCK = threading.Lock()
+_JOIN_SQL_CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+def _spec_key(spec: dict):
+    """Canonical hash of a JoinSpec, or None if it isn't plain JSON data."""
+    try:
+        canonical = json.dumps(spec, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def join_sql_cache_stats() -> dict:
+    with _JOIN_SQL_CACHE_LOCK:
+        return dict(_JOIN_SQL_CACHE_STATS, entries=len(_JOIN_SQL_CACHE))
+
+
+def build_join_sql(spec: dict, schema) -> str:
+    """
+    Validate a JoinSpec against the schema (a snapshot dict or a compiled
+    SchemaModel) and build a safe SELECT statement. When the schema carries
+    a version, results are memoised so repeated previews skip validation.
+    """
     if not isinstance(spec, dict):
         raise JoinSpecError("JoinSpec must be an object.")
+    model = _as_model(schema)
+
+    key = None
+    if model.version is not None:
+        spec_hash = _spec_key(spec)
+        if spec_hash is not None:
+            key = (model.version, model.dialect, spec_hash)
+            with _JOIN_SQL_CACHE_LOCK:
+                sql = _JOIN_SQL_CACHE.get(key)
+                if sql is not None:
+                    _JOIN_SQL_CACHE.move_to_end(key)
+                    _JOIN_SQL_CACHE_STATS["hits"] += 1
+                    return sql
+                _JOIN_SQL_CACHE_STATS["misses"] += 1
+
+    sql = _build_join_sql(spec, model)
+    if key is not None:
+        with _JOIN_SQL_CACHE_LOCK:
+            _JOIN_SQL_CACHE[key] = sql
+            _JOIN_SQL_CACHE.move_to_end(key)
+            while len(_JOIN_SQL_CACHE) > JOIN_SQL_CACHE_SIZE:
+                _JOIN_SQL_CACHE.popitem(last=False)
+    return sql
+
 
-    dialect = _ensure_dialect(schema)
-    tables = _table_lookup(schema)
+def _build_join_sql(spec: dict, model: SchemaModel) -> str:
+    dialect = _ensure_dialect(model)
+    tables = model.tables
 
     base_table = spec.get("base_table")
     if not isinstance(base_table, str) or not base_table:
@@ -265,8 +516,8 @@ def build_join_sql(spec: dict, schema: dict) -> str:
     if len(joins) > MAX_JOINS:
         raise JoinSpecError(f"Too many joins (max {MAX_JOINS}).")
 
-    # Build alias map: alias -> table def.  base_table is its own alias.
-    alias_to_table: dict = {base_table: tables[base_table]}
+    # Build alias map: alias -> column set.  base_table is its own alias.
+    alias_to_table: dict = {base_table: model.columns[base_table]}
     resolved_joins: list[dict] = []  # with normalized alias
     for idx, j in enumerate(joins):
         if not isinstance(j, dict):
@@ -285,7 +536,7 @@ def build_join_sql(spec: dict, schema: dict) -> str:
             raise JoinSpecError(f"Invalid alias: {alias!r}")
         if alias in alias_to_table:
             raise JoinSpecError(f"Duplicate alias: {alias!r}")
-        alias_to_table[alias] = tables[jtable]
+        alias_to_table[alias] = model.columns[jtable]
 
         on_clauses = j.get("on") or []
         if not isinstance(on_clauses, list):
@@ -337,7 +588,8 @@ def build_join_sql(spec: dict, schema: dict) -> str:
         keyword = "CROSS JOIN" if jtype == "CROSS" else f"{jtype} JOIN"
         piece = f"{keyword} {quote_ident(j['table'], dialect)}"
         if j["alias"] != j["table"]:
-            piece += f" AS {quote_ident(j['alias'], dialect)}"
+            # Oracle takes no AS before a table alias
+            piece += f" {'' if dialect == 'oracle' else 'AS '}{quote_ident(j['alias'], dialect)}"
         if jtype != "CROSS":
             on_sqls = []
             for cond in j["on"]:
@@ -433,8 +685,7 @@ def build_join_sql(spec: dict, schema: dict) -> str:
         sql += "\nWHERE " + " AND ".join(where_parts)
     if order_parts:
         sql += "\nORDER BY " + ", ".join(order_parts)
-    sql += f"\nLIMIT {limit}"
-    return sql
+    return limit_sql(sql, dialect, limit)
 
 
 # ---------------------------------------------------------------------------
@@ -442,7 +693,7 @@ def build_join_sql(spec: dict, schema: dict) -> str:
 # ---------------------------------------------------------------------------
 def execute_join(adapter, spec: dict) -> dict:
     """Build, execute, and return the result of a JoinSpec."""
-    schema = build_schema_snapshot(adapter)
+    schema = get_schema_model(adapter)
     if not isinstance(spec, dict):
         raise JoinSpecError("JoinSpec must be an object.")
     # Hard-cap limit before building SQL.
@@ -570,6 +821,15 @@ if __name__ == "__main__":
     check("IS NOT NULL built", '"orders"."total" IS NOT NULL' in sql)
     check("LIMIT applied", sql.rstrip().endswith("LIMIT 50"))
 
+    # row limit per dialect
+    for dialect_name, ending in (("mssql", None), ("oracle", "FETCH FIRST 50 ROWS ONLY")):
+        dialect_sql = build_join_sql(spec, dict(schema, dialect=dialect_name))
+        if ending:
+            check(f"{dialect_name} row limit", dialect_sql.endswith(ending), dialect_sql)
+        else:
+            check(f"{dialect_name} row limit", dialect_sql.startswith("SELECT TOP (50) ")
+                  and "LIMIT" not in dialect_sql, dialect_sql)
+
     # unknown column
     bad = dict(spec, base_columns=["nope"])
     try:
@@ -613,6 +873,61 @@ if __name__ == "__main__":
     mysql_sql = build_join_sql(spec, mysql_schema)
     check("mysql uses backticks", "`customers`.`id`" in mysql_sql)
 
+    print("SchemaModel / join SQL cache")
+    model = SchemaModel(dict(schema, version="v1"))
+    check("column frozensets", model.columns["orders"] == frozenset({"id", "customer_id", "total"}))
+    check("FK adjacency", [fk["from_table"] for fk in model.referenced_by["customers"]] == ["orders"])
+    check("model builds same SQL", build_join_sql(spec, model) == sql)
+    before = join_sql_cache_stats()["hits"]
+    reordered = {k: spec[k] for k in reversed(list(spec))}
+    check("cache hit on reordered spec",
+          build_join_sql(reordered, model) == sql and join_sql_cache_stats()["hits"] == before + 1)
+    check("new version misses",
+          build_join_sql(spec, SchemaModel(dict(schema, version="v2"))) == sql
+          and join_sql_cache_stats()["hits"] == before + 1)
+    try:
+        build_join_sql(bad, model)
+        check("cached model still validates", False, "no error")
+    except JoinSpecError:
+        check("cached model still validates", True)
+
+    print("join_path")
+    graph_schema = {
+        "dialect": "sqlite",
+        "tables": [
+            {"name": "customers", "columns": [{"name": "id"}], "foreign_keys": []},
+            {"name": "orders", "columns": [{"name": "id"}, {"name": "customer_id"}],
+             "foreign_keys": [{"from_table": "orders", "from_column": "customer_id",
+                               "to_table": "customers", "to_column": "id"}]},
+            {"name": "products", "columns": [{"name": "sku"}, {"name": "rev"}], "foreign_keys": []},
+            {"name": "order_items",
+             "columns": [{"name": "order_id"}, {"name": "sku"}, {"name": "rev"}],
+             "foreign_keys": [
+                 {"from_table": "order_items", "from_column": "order_id",
+                  "to_table": "orders", "to_column": "id"},
+                 {"from_table": "order_items", "from_column": "sku",
+                  "to_table": "products", "to_column": "sku"},
+                 {"from_table": "order_items", "from_column": "rev",
+                  "to_table": "products", "to_column": "rev"}]},
+            {"name": "audit", "columns": [{"name": "id"}], "foreign_keys": []},
+        ],
+    }
+    gmodel = SchemaModel(graph_schema)
+    steps = gmodel.join_path(["customers", "products"])
+    check("multi-hop through bridges",
+          [(t, p) for t, p, _ in steps]
+          == [("orders", "customers"), ("order_items", "orders"), ("products", "order_items")],
+          repr(steps))
+    check("composite key kept together",
+          steps[-1][2] == [("sku", "sku"), ("rev", "rev")], repr(steps[-1]))
+    check("already-connected tables add no joins",
+          len(gmodel.join_path(["orders", "customers", "orders"])) == 1)
+    try:
+        gmodel.join_path(["customers", "audit"])
+        check("rejects unreachable table", False, "no error")
+    except JoinSpecError:
+        check("rejects unreachable table", True)
+
     print()
     if failures:
         print(f"{len(failures)} failure(s):")
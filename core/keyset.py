@@ -0,0 +1,320 @@
+"""
+Keyset Pagination
+Seek-based paging for the result grid: when a SELECT reads a single table
+in an order that is provably unique, page N+1 is fetched with
+``WHERE key > last_key ORDER BY key LIMIT n`` instead of ``OFFSET``, so deep
+pages cost the same as the first. Anything this module can't prove safe
+returns None and the caller falls back to OFFSET paging.
+"""
+
+import re
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from core.join_center import JoinSpecError, escape_literal, quote_ident
+from core.row_limit import limit_sql
+
+# Oracle stays on OFFSET paging: string keys compared to DATE columns depend on NLS settings
+KEYSET_DIALECTS = {"sqlite", "mysql", "postgresql", "mssql"}
+
+# Top-level keywords that make a query unsuitable (or that we split on)
+_KEYWORDS = re.compile(
+    r"(select|distinct|from|where|group\s+by|having|order\s+by|limit|offset|fetch|"
+    r"union|intersect|except|join|window|top)\b",
+    re.IGNORECASE,
+)
+_REJECT = {"distinct", "group by", "having", "limit", "offset", "fetch",
+           "union", "intersect", "except", "join", "window", "top"}
+
+_AGGREGATE_RE = re.compile(
+    r"\b(count|sum|avg|min|max|group_concat|string_agg|array_agg|json_agg|listagg)\s*\(",
+    re.IGNORECASE,
+)
+
+_IDENT = r'(?:"[^"]+"|`[^`]+`|\[[^\]]+\]|[A-Za-z_][A-Za-z0-9_$]*)'
+_FROM_RE = re.compile(rf"^\s*({_IDENT})(?:\s+(?:as\s+)?({_IDENT}))?\s*$", re.IGNORECASE)
+_ORDER_ITEM_RE = re.compile(rf"^\s*(?:{_IDENT}\s*\.\s*)?({_IDENT})(?:\s+(asc|desc))?\s*$", re.IGNORECASE)
+# "<expr> AS name" or "<expr> name" at the end of a select-list item
+_SELECT_ALIAS_RE = re.compile(rf"^(.*?[\w\"`\])'])\s+(?:as\s+)?({_IDENT})\s*$", re.IGNORECASE | re.DOTALL)
+
+
+def _unquote(ident: str) -> str:
+    if ident[:1] in ('"', "`", "["):
+        return ident[1:-1]
+    return ident
+
+
+def _top_level_keywords(sql: str) -> list:
+    """[(keyword, start, end)] for keywords outside parentheses and quotes."""
+    found = []
+    depth = 0
+    quote = None
+    i = 0
+    while i < len(sql):
+        ch = sql[i]
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in ("'", '"', "`"):
+            quote = ch
+        elif ch == "[":
+            quote = "]"
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif depth == 0 and (i == 0 or not (sql[i - 1].isalnum() or sql[i - 1] in "_$")):
+            m = _KEYWORDS.match(sql, i)
+            if m:
+                found.append((" ".join(m.group(1).lower().split()), m.start(), m.end()))
+                i = m.end()
+                continue
+        i += 1
+    return found
+
+
+def _split_top_level_commas(text: str) -> list:
+    parts, depth, start = [], 0, 0
+    for i, ch in enumerate(text):
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+
+def _output_aliases(select_list: str) -> set:
+    """Lower-cased names the select list gives its items (AS name, or a bare trailing name)."""
+    aliases = set()
+    for item in _split_top_level_commas(select_list):
+        m = _SELECT_ALIAS_RE.match(item.strip())
+        if m:
+            aliases.add(_unquote(m.group(2)).lower())
+    return aliases
+
+
+def _lookup(mapping: dict, name: str):
+    if name in mapping:
+        return name
+    for key in mapping:
+        if key.lower() == name.lower():
+            return key
+    return None
+
+
+def plan_keyset(sql: str, model: dict, dialect: str):
+    """
+    Work out a seek key for ``sql``. Returns None unless the query is a
+    plain single-table SELECT (no joins, grouping, DISTINCT, set operators
+    or LIMIT) whose ORDER BY columns are NOT NULL and include a primary or
+    unique key. A non-unique ORDER BY gets the primary key appended as a
+    tie-breaker; no ORDER BY orders by the primary key.
+        {"head": "SELECT ... FROM t", "where": str|None,
+         "key": [(column, descending)], "dialect": str}
+    """
+    if dialect not in KEYSET_DIALECTS or not model:
+        return None
+    sql = sql.strip().rstrip(";")
+    keywords = _top_level_keywords(sql)
+    if not keywords or keywords[0][0] != "select" or keywords[0][1] != 0:
+        return None
+    if any(k in _REJECT for k, _, _ in keywords):
+        return None
+    positions = {k: (s, e) for k, s, e in keywords}
+    if len(positions) != len(keywords) or "from" not in positions:
+        return None   # repeated top-level clause, e.g. a scalar SELECT in the list
+
+    def clause(name):
+        start = positions[name][1]
+        later = [s for k, s, _ in keywords if s > start]
+        return sql[start:min(later) if later else len(sql)]
+
+    if _AGGREGATE_RE.search(clause("select")):
+        return None   # aggregates collapse the rows; there is nothing to seek
+
+    m = _FROM_RE.match(clause("from"))
+    if not m:
+        return None   # comma join, subquery or table function
+    table = _lookup(model, _unquote(m.group(1)))
+    if table is None:
+        return None
+    info = model[table]
+    columns = {c["name"]: c for c in info["columns"]}
+
+    primary = next((i["columns"] for i in info["indexes"] if i.get("primary")), None) \
+        or [c["name"] for c in info["columns"] if c["primary_key"]]
+    unique_keys = [set(primary)] if primary else []
+    for idx in info["indexes"]:
+        if idx["unique"] and all(columns.get(c, {}).get("not_null") for c in idx["columns"]):
+            unique_keys.append(set(idx["columns"]))
+    if not unique_keys:
+        return None
+
+    key = []
+    if "order by" in positions:
+        for item in _split_top_level_commas(clause("order by")):
+            om = _ORDER_ITEM_RE.match(item)
+            if not om:
+                return None   # expression, ordinal or NULLS FIRST/LAST
+            name = _lookup(columns, _unquote(om.group(1)))
+            if name is None:
+                return None   # not a table column
+            if not (columns[name]["not_null"] or columns[name]["primary_key"]):
+                return None   # NULLs don't compare
+            key.append((name, (om.group(2) or "").lower() == "desc"))
+    names = {name for name, _ in key}
+    if not any(k <= names for k in unique_keys):
+        if not primary:
+            return None
+        key += [(c, False) for c in primary if c not in names]
+
+    # ORDER BY and last_key() would read the aliased expression, not the column:
+    # SELECT name AS id ... ORDER BY id sorts by name but seeks on t.id
+    aliases = _output_aliases(clause("select"))
+    if any(name.lower() in aliases for name, _ in key):
+        return None
+
+    try:
+        for name, _ in key:
+            quote_ident(name, dialect)
+    except JoinSpecError:
+        return None
+
+    head_end = min(s for k, s, _ in keywords if k in ("where", "order by")) \
+        if ("where" in positions or "order by" in positions) else len(sql)
+    return {
+        "head": sql[:head_end].rstrip(),
+        "where": clause("where").strip() if "where" in positions else None,
+        "key": key,
+        "dialect": dialect,
+    }
+
+
+def keyset_sql(plan: dict, after, page_size: int, skip: int = 0) -> str:
+    """
+    The page query: rows strictly after the key tuple ``after`` (None for
+    the start), skipping ``skip`` more rows when jumping past unseen pages.
+    """
+    dialect = plan["dialect"]
+    conditions = []
+    if plan["where"]:
+        conditions.append(f"({plan['where']})")
+    if after is not None:
+        # Expanded row comparison: works for mixed ASC/DESC keys on every dialect
+        ors = []
+        for i, (name, desc) in enumerate(plan["key"]):
+            terms = [f"{quote_ident(n, dialect)} = {escape_literal(after[j], dialect)}"
+                     for j, (n, _) in enumerate(plan["key"][:i])]
+            terms.append(f"{quote_ident(name, dialect)} {'<' if desc else '>'} "
+                         f"{escape_literal(after[i], dialect)}")
+            ors.append("(" + " AND ".join(terms) + ")")
+        conditions.append("(" + " OR ".join(ors) + ")")
+
+    sql = plan["head"]
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += " ORDER BY " + ", ".join(
+        f"{quote_ident(name, dialect)} {'DESC' if desc else 'ASC'}" for name, desc in plan["key"])
+    return limit_sql(sql, dialect, page_size, skip)
+
+
+def _key_value(value):
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (datetime, date, Decimal, UUID)):
+        return str(value)
+    return None
+
+
+def last_key(plan: dict, columns: list, rows: list):
+    """Key tuple of the last row, or None if the key isn't in the result (or not serialisable)."""
+    if not rows:
+        return None
+    lowered = [str(c).lower() for c in columns]
+    values = []
+    for name, _ in plan["key"]:
+        if name.lower() not in lowered:
+            return None
+        value = _key_value(rows[-1][lowered.index(name.lower())])
+        if value is None:
+            return None
+        values.append(value)
+    return values
+
+
+def fetch_page(adapter, plan: dict, page: int, page_size: int, known: dict) -> tuple:
+    """
+    Fetch ``page`` seeking from the nearest page before it whose last key is
+    in ``known`` ({page: key}); records this page's last key there.
+    Returns (columns, rows, page_sql).
+    """
+    start = max((p for p in known if p < page), default=0)
+    page_sql = keyset_sql(plan, known.get(start), page_size, (page - 1 - start) * page_size)
+    columns, rows = adapter.execute(page_sql)
+    key = last_key(plan, columns, rows)
+    if key is not None:
+        known[page] = key
+    return columns, rows, page_sql
+
+
+if __name__ == "__main__":
+    failures: list[str] = []
+
+    def check(label: str, cond: bool, detail: str = "") -> None:
+        if cond:
+            print(f"  PASS  {label}")
+        else:
+            failures.append(f"{label}: {detail}")
+            print(f"  FAIL  {label}  {detail}")
+
+    model = {
+        "t": {
+            "columns": [
+                {"name": "id", "primary_key": True, "not_null": True},
+                {"name": "name", "primary_key": False, "not_null": True},
+                {"name": "grp", "primary_key": False, "not_null": False},
+            ],
+            "indexes": [],
+        },
+    }
+
+    print("plan_keyset")
+    plan = plan_keyset("SELECT id, name FROM t ORDER BY name", model, "sqlite")
+    check("appends primary key tie-breaker",
+          plan is not None and plan["key"] == [("name", False), ("id", False)], str(plan))
+    check("no ORDER BY orders by primary key",
+          (plan_keyset("SELECT * FROM t", model, "sqlite") or {}).get("key") == [("id", False)])
+    check("rejects nullable ORDER BY column",
+          plan_keyset("SELECT * FROM t ORDER BY grp", model, "sqlite") is None)
+    check("rejects ORDER BY on an alias of another column",
+          plan_keyset("SELECT name AS id, grp FROM t ORDER BY id", model, "sqlite") is None)
+    check("rejects alias without AS",
+          plan_keyset('SELECT name "ID", grp FROM t ORDER BY id', model, "sqlite") is None)
+    check("rejects alias shadowing the appended primary key",
+          plan_keyset("SELECT upper(name) id FROM t ORDER BY name", model, "sqlite") is None)
+    check("allows aliases of other names",
+          plan_keyset("SELECT id, name AS label FROM t", model, "sqlite") is not None)
+    check("rejects joins",
+          plan_keyset("SELECT * FROM t JOIN u ON t.id = u.id", model, "sqlite") is None)
+
+    print("keyset_sql / last_key")
+    sql = keyset_sql(plan, ["b", 7], 50)
+    check("seeks past the last key", "(\"name\" > 'b')" in sql and "\"id\" > 7" in sql, sql)
+    check("ends with LIMIT", sql.endswith("LIMIT 50"), sql)
+    check("last_key reads the key columns",
+          last_key(plan, ["id", "name"], [(1, "a"), (7, "b")]) == ["b", 7])
+    check("last_key needs every key column",
+          last_key(plan, ["name"], [("b",)]) is None)
+
+    print()
+    if failures:
+        print(f"{len(failures)} failure(s):")
+        for f in failures:
+            print(f"  - {f}")
+        raise SystemExit(1)
+    print("All self-tests passed.")
@@ -6,6 +6,7 @@ from datetime import datetime
 from core.paths import db_path
 
 METRICS_FILE = db_path("usage_metrics.json")
+EXPORT_METRICS_FILE = db_path("export_metrics.json")
 
 def log_call(provider, model, latency, prompt_tokens=0, completion_tokens=0):
     """Logs an LLM call to the persistent metrics file."""
@@ -79,3 +80,50 @@ def get_summary():
         "trends": trends,
         "recent_history": metrics[-20:]
     }
+
+
+def log_export(rows, bytes_sent, duration, compressed=False, completed=True):
+    """Logs a streamed CSV export to the persistent export metrics file."""
+    EXPORT_METRICS_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+    exports = []
+    if EXPORT_METRICS_FILE.exists():
+        try:
+            with open(EXPORT_METRICS_FILE, "r") as f:
+                exports = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            exports = []
+
+    exports.append({
+        "timestamp": datetime.now().isoformat(),
+        "rows": rows,
+        "bytes": bytes_sent,
+        "duration": round(duration, 3),
+        "gzip": compressed,
+        "completed": completed,
+    })
+
+    # Keep last 1000 entries for performance
+    if len(exports) > 1000:
+        exports = exports[-1000:]
+
+    with open(EXPORT_METRICS_FILE, "w") as f:
+        json.dump(exports, f, indent=2)
+
+def get_export_summary():
+    """Returns totals for streamed exports (rows, bytes, recent history)."""
+    empty = {"total_exports": 0, "total_rows": 0, "total_bytes": 0, "recent_history": []}
+    if not EXPORT_METRICS_FILE.exists():
+        return empty
+    try:
+        with open(EXPORT_METRICS_FILE, "r") as f:
+            exports = json.load(f)
+    except Exception:
+        return empty
+
+    return {
+        "total_exports": len(exports),
+        "total_rows": sum(e.get("rows", 0) for e in exports),
+        "total_bytes": sum(e.get("bytes", 0) for e in exports),
+        "recent_history": exports[-20:],
+    }
@@ -0,0 +1,208 @@
+"""
+Result Pagination
+Paging, totals and statement budgets for the result grid, shared by the
+server-rendered pages (app.py) and the JSON API (api_routes.py). Pages
+come from driver paging tokens (Cassandra), keyset seeks (core.keyset) or
+dialect-aware LIMIT/OFFSET (core.row_limit), through the per-session
+result cache. Functions that remember state between requests take the
+Flask session as their first argument.
+"""
+
+from core import keyset
+from core import result_cache
+from core import row_limit
+from core.adapters.base import QueryCancelled
+
+PAGE_SIZE = 50
+KEYSET_SESSION_KEYS = 20   # visited-page keys remembered per query
+
+# Seconds a request's statements may run before they are cancelled
+ROLE_QUERY_BUDGETS = {
+    "VIEWER": 30,
+    "EDITOR": 120,
+    "ADMIN":  600,
+}
+
+
+def query_budget(role):
+    """Statement deadline for a role; unknown roles get the tightest one."""
+    return ROLE_QUERY_BUDGETS.get(role, min(ROLE_QUERY_BUDGETS.values()))
+
+
+def is_system_query(sql):
+    sql = sql.lower()
+    return any(k in sql for k in ("sqlite_master", "pragma", "information_schema"))
+
+
+def paginate_sql(sql, page, dialect):
+    return row_limit.limit_sql(sql, dialect, PAGE_SIZE, (page - 1) * PAGE_SIZE)
+
+
+def safe_count(adapter, sql, cap=None):
+    """COUNT(*) of a read (its own LIMIT/TOP included); with cap, stops after cap + 1 rows."""
+    if is_system_query(sql):
+        return None
+    try:
+        _, rows = adapter.execute(row_limit.count_sql(sql, adapter.dialect, cap))
+        return rows[0][0] if rows else 0
+    except QueryCancelled:
+        raise
+    except Exception:
+        return None
+
+
+def paginate_by_token(session, adapter, sql, page):
+    """
+    Page engines that resume from a driver paging token (Cassandra).
+    Tokens for pages already visited are kept in the session, so moving
+    forward costs one round trip; jumping ahead walks from the last one.
+    Returns (columns, rows, page, has_more).
+    """
+    saved = session.get("paging_tokens") or {}
+    states = saved.get("states") if saved.get("sql") == sql else None
+    states = states or [None]          # states[i] resumes page i + 1
+    if len(states) > 1 and states[-1] is None:
+        page = min(page, len(states) - 1)   # already saw the last page
+
+    current = min(page, len(states))
+    while True:
+        columns, rows, next_state = adapter.execute_page(sql, PAGE_SIZE, states[current - 1])
+        if len(states) == current:
+            states.append(next_state)
+        if current == page or not next_state:
+            break
+        current += 1
+
+    session["paging_tokens"] = {"sql": sql, "states": states}
+    return columns, rows, current, bool(next_state)
+
+
+def _keyset_plan(adapter, sql):
+    if str(adapter.config.get("keyset_pagination", "true")).lower() in ("0", "false", "no"):
+        return None
+    try:
+        return keyset.plan_keyset(sql, adapter.schema_model(), adapter.dialect)
+    except Exception:
+        return None
+
+
+def paginate_by_keyset(session, adapter, sql, page):
+    """
+    Seek pagination (core.keyset) for single-table reads with a unique
+    ordering. The last key of each visited page is kept in the session, so
+    a page is one index seek from the nearest visited page before it.
+    Returns (columns, rows, page_sql), or None to fall back to OFFSET.
+    """
+    plan = _keyset_plan(adapter, sql)
+    if plan is None:
+        return None
+
+    saved = session.get("keyset_pages") or {}
+    known = {int(p): key for p, key in saved.get("keys", [])} if saved.get("sql") == sql else {}
+    try:
+        columns, rows, page_sql = keyset.fetch_page(adapter, plan, page, PAGE_SIZE, known)
+    except Exception:
+        return None
+
+    # Cookie-backed session: keep only the keys nearest the current page
+    nearest = sorted(known.items(), key=lambda kv: abs(kv[0] - page))[:KEYSET_SESSION_KEYS]
+    session["keyset_pages"] = {"sql": sql, "keys": sorted(nearest)}
+    return columns, rows, page_sql
+
+
+def _load_next_page(adapter, sql, page, previous):
+    """
+    Fetch page from the end of the previous page's rows without touching
+    the request session (runs on the prefetch pool).
+    """
+    plan = _keyset_plan(adapter, sql)
+    if plan:
+        key = keyset.last_key(plan, previous[0], previous[1])
+        known = {page - 1: key} if key is not None else {}
+        return keyset.fetch_page(adapter, plan, page, PAGE_SIZE, known)
+    page_sql = paginate_sql(sql, page, adapter.dialect)
+    columns, rows = adapter.execute(page_sql)
+    return columns, rows, page_sql
+
+
+def _scope(session, adapter, sql):
+    return result_cache.scope(session.get("active_db", "Default SQLite"), adapter, sql)
+
+
+def read_page(session, adapter, sql, page, count=True):
+    """
+    One page of a SQL read (keyset or OFFSET), served from the session's
+    result cache when possible; the following page is prefetched in the
+    background. Returns (columns, rows, page_sql, totals), totals being the
+    pager fields from read_totals() ({} when count is False).
+    """
+    cache = result_cache.for_session(session)
+    prefix = _scope(session, adapter, sql)
+    entry = cache.get(prefix + (page,))
+    if entry is None:
+        entry = paginate_by_keyset(session, adapter, sql, page)
+        if entry is None:
+            page_sql = paginate_sql(sql, page, adapter.dialect)
+            columns, rows = adapter.execute(page_sql)
+            entry = (columns, rows, page_sql)
+        cache.put(prefix + (page,), entry)
+    columns, rows, page_sql = entry
+
+    totals = {}
+    if count:
+        totals = read_totals(session, adapter, sql, cache, prefix)
+        totals["has_more"] = bool(rows) and len(rows) >= PAGE_SIZE and (
+            totals["total_rows"] is None or totals["total_estimated"]
+            or page * PAGE_SIZE < totals["total_rows"])
+
+    if rows and len(rows) >= PAGE_SIZE:
+        budget = query_budget(session.get("role"))
+        cache.prefetch(prefix + (page + 1,), _bounded(
+            adapter, budget, lambda: _load_next_page(adapter, sql, page + 1, entry)))
+    return columns, rows, page_sql, totals
+
+
+def _bounded(adapter, seconds, load):
+    """load() under its own deadline: background threads don't inherit the request's."""
+    def run():
+        with adapter.deadline(seconds):
+            return load()
+    return run
+
+
+def _count_total(adapter, sql):
+    """The background count job: exact up to COUNT_CAP + 1, cancelled after COUNT_TIMEOUT."""
+    try:
+        with adapter.deadline(result_cache.COUNT_TIMEOUT):
+            return {"count": safe_count(adapter, sql, cap=result_cache.COUNT_CAP)}
+    except QueryCancelled:
+        return {"count": None, "timed_out": True}
+
+
+def read_totals(session, adapter, sql, cache=None, prefix=None):
+    """
+    Total rows for the pager without waiting on COUNT(*): the exact count
+    once the background job has finished (total_rows None past
+    result_cache.COUNT_CAP), otherwise the planner's estimate while it runs.
+    Returns {"total_rows", "total_estimated", "total_display", "count_status"}.
+    """
+    if cache is None:
+        cache = result_cache.for_session(session)
+        prefix = _scope(session, adapter, sql)
+    key = prefix + ("total",)
+    total = cache.get(key)
+    estimate = None
+    if total is None:
+        cache.prefetch(key, lambda: _count_total(adapter, sql))
+    if total is None or total["count"] is None:
+        estimate = cache.get(prefix + ("estimate",))
+        if estimate is None:
+            try:
+                estimate = {"rows": adapter.estimate_query_rows(sql)}
+            except Exception:
+                estimate = {"rows": None}
+            cache.put(prefix + ("estimate",), estimate)
+    pending_since = cache.pending_since(key)
+    if total is None and pending_since is None:
+        total = cache.get(key)   # finished while we were estimating
+    return result_cache.describe_total(total, estimate, pending_since)
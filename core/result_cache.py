@@ -0,0 +1,183 @@
+"""
+Result Page Cache
+Per-session, server-side LRU of fetched result pages and totals, so page
+flips over the same read don't go back to the database. Entries are keyed
+by connection, the adapter's data version and a normalised query
+fingerprint: a write through the app moves the data version, and a short
+TTL bounds staleness from writes made elsewhere. Each session has a byte
+budget; the least recently used pages are evicted first.
+"""
+
+import hashlib
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+SESSION_BUDGET_BYTES = int(os.environ.get("RESULT_CACHE_BYTES", 4 * 1024 * 1024))
+MAX_SESSIONS = 50
+ENTRY_TTL = 60            # seconds
+PREFETCH_WORKERS = 2
+COUNT_CAP = 10000         # exact counts stop here and show as "10,000+"
+COUNT_TIMEOUT = 30        # seconds before a background count is cancelled
+
+_sessions = OrderedDict()     # session id -> SessionResultCache
+_sessions_lock = threading.Lock()
+_prefetcher = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="result-prefetch")
+
+
+def query_fingerprint(sql: str) -> str:
+    """sha1 of the query with whitespace outside string literals collapsed and any trailing ';' dropped."""
+    out = []
+    quote = None
+    pending_space = False
+    for ch in sql.strip().rstrip(";").strip():
+        if quote:
+            out.append(ch)
+            if ch == quote:
+                quote = None
+            continue
+        if ch.isspace():
+            pending_space = True
+            continue
+        if pending_space and out:
+            out.append(" ")
+        pending_space = False
+        out.append(ch)
+        if ch in ("'", '"', "`"):
+            quote = ch
+    return hashlib.sha1("".join(out).encode("utf-8")).hexdigest()
+
+
+def _approx_size(value) -> int:
+    """Rough in-memory size of a cached page: (columns, rows, sql) or a scalar."""
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_approx_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class SessionResultCache:
+    """LRU of one session's pages and totals under a byte budget."""
+
+    def __init__(self, budget: int = SESSION_BUDGET_BYTES):
+        self.budget = budget
+        self._entries = OrderedDict()   # key -> (stored_at, size, value)
+        self._bytes = 0
+        self._inflight = {}   # key -> time the background load started
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "prefetched": 0}
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry[0] < ENTRY_TTL:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[2]
+            if entry:
+                self._drop(key)
+            self._stats["misses"] += 1
+            return None
+
+    def put(self, key, value):
+        size = _approx_size(value)
+        if size > self.budget:
+            return   # a single oversized page isn't worth evicting everything for
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.time(), size, value)
+            self._bytes += size
+            while self._bytes > self.budget:
+                self._drop(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+    def _drop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def prefetch(self, key, loader):
+        """Run loader() on the prefetch pool and cache its result, unless cached or already running."""
+        with self._lock:
+            if key in self._inflight or key in self._entries:
+                return
+            self._inflight[key] = time.time()
+
+        def run():
+            try:
+                self.put(key, loader())
+                with self._lock:
+                    self._stats["prefetched"] += 1
+            except Exception:
+                pass   # the foreground request will fetch (and report) it
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+
+        _prefetcher.submit(run)
+
+    def pending_since(self, key):
+        """Start time of a background load for key still in flight, else None."""
+        with self._lock:
+            return self._inflight.get(key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries), bytes=self._bytes, budget=self.budget)
+
+
+def for_session(session) -> SessionResultCache:
+    """The cache for a Flask session, creating its id on first use."""
+    sid = session.get("result_cache_id")
+    if not sid:
+        sid = session["result_cache_id"] = uuid.uuid4().hex
+    with _sessions_lock:
+        cache = _sessions.get(sid)
+        if cache is None:
+            cache = _sessions[sid] = SessionResultCache()
+            while len(_sessions) > MAX_SESSIONS:
+                _sessions.popitem(last=False)
+        else:
+            _sessions.move_to_end(sid)
+        return cache
+
+
+def scope(connection_name: str, adapter, sql: str) -> tuple:
+    """Key prefix shared by every page and the total of one read."""
+    return (connection_name, adapter.data_version, query_fingerprint(sql))
+
+
+def describe_total(total, estimate, pending_since) -> dict:
+    """
+    Pager fields for a read. total is the finished count entry
+    ({"count": int|None}, counted up to COUNT_CAP + 1; "timed_out" when it
+    was cancelled) or None while it is pending; estimate is the planner's
+    {"rows": int|None}.
+    """
+    if total is not None and total["count"] is not None:
+        count = total["count"]
+        if count > COUNT_CAP:
+            # Open-ended: pagers must go by has_more, "10,000+" is display only
+            return {"total_rows": None, "total_estimated": False,
+                    "total_display": f"{COUNT_CAP:,}+", "count_status": "capped"}
+        return {"total_rows": count, "total_estimated": False,
+                "total_display": f"{count:,}", "count_status": "done"}
+
+    if total is not None:
+        status = "timeout" if total.get("timed_out") else "unavailable"
+    elif pending_since is None:
+        status = "unavailable"   # the count job failed or its result was evicted
+    elif time.time() - pending_since > COUNT_TIMEOUT:
+        status = "timeout"
+    else:
+        status = "pending"
+    rows = (estimate or {}).get("rows")
+    if rows is None:
+        return {"total_rows": None, "total_estimated": False, "total_display": "", "count_status": status}
+    rows = int(rows)
+    display = f"~{min(rows, COUNT_CAP):,}" + ("+" if rows > COUNT_CAP else "")
+    return {"total_rows": rows, "total_estimated": True, "total_display": display, "count_status": status}
@@ -0,0 +1,244 @@
+"""
+Row Limits
+One place that knows how each engine spells "at most n rows, skipping m":
+LIMIT/OFFSET (SQLite, MySQL, Postgres, CQL), TOP / OFFSET ... FETCH
+(SQL Server), OFFSET ... FETCH FIRST (Oracle 12c+) and limit/skip or
+$skip/$limit in Mongo JSON queries. Queries are scanned token by token, so
+"limit" inside a string, comment, quoted name or a longer identifier is
+never mistaken for a clause, and trailing comments or ';' don't swallow
+the appended one.
+"""
+
+import json
+import re
+
+# Engines that take LIMIT n [OFFSET m] after the query
+LIMIT_OFFSET_DIALECTS = {"sqlite", "mysql", "postgresql"}
+
+_WORD = re.compile(r"[A-Za-z_][A-Za-z0-9_$#]*")
+_SET_OPERATORS = {"union", "intersect", "except", "minus"}
+
+
+def _scan(sql: str) -> tuple:
+    """
+    Walk the query once. Returns (words, end): the words outside
+    parentheses, strings, quoted identifiers and comments as
+    [(lowered word, start, end)], and the offset just past the last
+    significant character (so trailing comments and ';' can be cut).
+    """
+    words = []
+    depth = 0
+    end = 0
+    i, n = 0, len(sql)
+    while i < n:
+        ch = sql[i]
+        if ch.isspace() or ch == ";":
+            i += 1
+            continue
+        if sql.startswith("--", i):
+            j = sql.find("\n", i)
+            i = n if j < 0 else j
+            continue
+        if sql.startswith("/*", i):
+            j = sql.find("*/", i + 2)
+            i = n if j < 0 else j + 2
+            continue
+        if ch in ("'", '"', "`", "["):
+            close = "]" if ch == "[" else ch
+            j = sql.find(close, i + 1)
+            while j >= 0 and close != "]" and sql.startswith(close, j + 1):
+                j = sql.find(close, j + 2)   # doubled quote is an escaped one
+            i = end = n if j < 0 else j + 1
+            continue
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        else:
+            m = _WORD.match(sql, i)
+            if m:
+                if depth == 0 and sql[i - 1:i] != ".":   # t.limit is a column
+                    words.append((m.group().lower(), m.start(), m.end()))
+                i = end = m.end()
+                continue
+            if ch.isdigit():
+                while i + 1 < n and (sql[i + 1].isalnum() or sql[i + 1] == "."):
+                    i += 1   # 1e10, 0x1F: one token, not a number and a word
+        i += 1
+        end = i
+    return words, end
+
+
+def _next_char(sql: str, pos: int) -> str:
+    rest = sql[pos:].lstrip()
+    return rest[:1]
+
+
+def _limit_clauses(sql: str, words: list) -> list:
+    """[(keyword, start, end)] of the top-level clauses that bound the row count."""
+    found = []
+    names = [w for w, _, _ in words]
+    for i, (word, start, stop) in enumerate(words):
+        following = names[i + 1] if i + 1 < len(names) else ""
+        nxt = _next_char(sql, stop)
+        if word in ("limit", "offset") and (nxt.isdigit() or nxt in ("(", "?", ":", "$", "%", "@")
+                                            or following == "all"):
+            found.append((word, start, stop))
+        elif word == "fetch" and following in ("first", "next"):
+            found.append((word, start, stop))
+        elif word == "top" and i and (names[i - 1] == "select" or (
+                names[i - 1] in ("all", "distinct") and i > 1 and names[i - 2] == "select")) \
+                and (nxt.isdigit() or nxt == "("):
+            found.append((word, start, stop))
+        elif word == "rownum" and "where" in names[:i]:
+            found.append((word, start, stop))
+    return found
+
+
+def has_row_limit(sql: str) -> bool:
+    """True if the outer query already caps or skips rows (LIMIT, OFFSET, TOP, FETCH, ROWNUM)."""
+    words, _ = _scan(sql)
+    return bool(_limit_clauses(sql, words))
+
+
+def _literal_limit(sql: str, clauses: list):
+    """The row cap when it is a plain number (LIMIT 50, TOP (50), FETCH FIRST 50), else None."""
+    caps = []
+    for word, _, stop in clauses:
+        if word == "offset":
+            continue   # a skip alone doesn't bound the rows
+        rest = sql[stop:]
+        if word == "fetch":
+            rest = re.sub(r"^\s*(first|next)", "", rest, flags=re.IGNORECASE)
+        elif word == "rownum":
+            m = re.match(r"\s*(<=?)\s*(\d+)", rest)
+            if not m:
+                return None
+            caps.append(int(m.group(2)) - (1 if m.group(1) == "<" else 0))
+            continue
+        m = re.match(r"\s*\(?\s*(\d+)\s*\)?", rest)
+        if not m:
+            return None
+        caps.append(int(m.group(1)))
+    return min(caps) if caps else None
+
+
+def _alias(name: str, dialect: str) -> str:
+    # Oracle rejects AS before a table alias
+    return name if dialect == "oracle" else f"AS {name}"
+
+
+def limit_sql(sql: str, dialect: str, limit: int, offset: int = 0) -> str:
+    """
+    Rewrite a read so the engine returns at most `limit` rows after
+    skipping `offset`. A query that already has its own cap is left alone
+    when that cap is a literal no larger than `limit`, and wrapped in a
+    derived table otherwise. Mongo JSON gets limit/skip (find) or trailing
+    $skip/$limit stages (aggregate); Redis commands pass through.
+    """
+    dialect = (dialect or "").lower()
+    limit, offset = int(limit), int(offset or 0)
+    if dialect == "mongodb":
+        return _limit_mongo(sql, limit, offset)
+    if dialect == "redis":
+        return sql
+
+    words, end = _scan(sql)
+    body = sql[:end]
+    clauses = _limit_clauses(body, words)
+    if clauses:
+        cap = _literal_limit(body, clauses)
+        if not offset and cap is not None and cap <= limit:
+            return body
+        if dialect == "cassandra":
+            return body   # CQL has no derived tables; its own LIMIT stands
+        body = f"SELECT * FROM ({body}) {_alias('limited', dialect)}"
+        words, _ = _scan(body)
+
+    names = [w for w, _, _ in words]
+    if dialect == "mssql":
+        return _limit_mssql(body, words, names, limit, offset)
+    if dialect == "oracle":
+        if offset:
+            return f"{body} OFFSET {offset} ROWS FETCH NEXT {limit} ROWS ONLY"
+        return f"{body} FETCH FIRST {limit} ROWS ONLY"
+    if dialect == "cassandra":
+        if offset:
+            raise ValueError("CQL has no OFFSET; page Cassandra results with paging state.")
+        return f"{body} LIMIT {limit}"
+    if offset:
+        return f"{body} LIMIT {limit} OFFSET {offset}"
+    return f"{body} LIMIT {limit}"
+
+
+def _limit_mssql(body: str, words: list, names: list, limit: int, offset: int) -> str:
+    if _SET_OPERATORS & set(names):
+        # TOP would bind to the first SELECT only; bound the whole result instead
+        body = f"SELECT * FROM ({body}) AS limited"
+        words, _ = _scan(body)
+        names = [w for w, _, _ in words]
+    if not offset:
+        # TOP (n) right after SELECT [ALL | DISTINCT] of the outer query
+        i = names.index("select") if "select" in names else -1
+        if i >= 0:
+            if i + 1 < len(names) and names[i + 1] in ("all", "distinct"):
+                i += 1
+            pos = words[i][2]
+            return f"{body[:pos]} TOP ({limit}){body[pos:]}"
+    ordered = any(w == "order" and names[i + 1:i + 2] == ["by"] for i, w in enumerate(names))
+    if not ordered:
+        body += " ORDER BY (SELECT NULL)"   # OFFSET ... FETCH requires an ORDER BY
+    return f"{body} OFFSET {offset} ROWS FETCH NEXT {limit} ROWS ONLY"
+
+
+def _limit_mongo(query: str, limit: int, offset: int) -> str:
+    try:
+        cmd = json.loads(query)
+    except ValueError:
+        return query
+    if not isinstance(cmd, dict):
+        return query
+    operation = cmd.get("operation", "find")
+    if operation == "find":
+        current = cmd.get("limit")
+        if isinstance(current, int) and not isinstance(current, bool) and 0 < current <= limit and not offset:
+            return query
+        cmd["limit"] = limit
+        if offset:
+            cmd["skip"] = offset
+    elif operation == "aggregate":
+        pipeline = list(cmd.get("pipeline") or [])
+        last = pipeline[-1] if pipeline and isinstance(pipeline[-1], dict) else {}
+        if "$out" in last or "$merge" in last:
+            return query   # must stay the final stage, and returns no rows anyway
+        if not offset and isinstance(last.get("$limit"), int) and last["$limit"] <= limit:
+            return query
+        if offset:
+            pipeline.append({"$skip": offset})
+        pipeline.append({"$limit": limit})
+        cmd["pipeline"] = pipeline
+    else:
+        return query
+    return json.dumps(cmd)
+
+
+def count_sql(sql: str, dialect: str, cap: int = None) -> str:
+    """
+    COUNT(*) over a read. A trailing ORDER BY is dropped (it can't change
+    the count, and SQL Server rejects it in a derived table). With `cap`,
+    the engine stops after cap + 1 rows.
+    """
+    dialect = (dialect or "").lower()
+    if dialect in ("mongodb", "redis", "cassandra"):
+        raise ValueError(f"No SQL COUNT for {dialect}")
+    words, end = _scan(sql)
+    body = sql[:end]
+    if not _limit_clauses(body, words):
+        names = [w for w, _, _ in words]
+        for i in range(len(names) - 1, -1, -1):
+            if names[i] == "order" and names[i + 1:i + 2] == ["by"]:
+                body = body[:words[i][1]].rstrip()
+                break
+    if cap:
+        body = limit_sql(f"SELECT 1 AS one FROM ({body}) {_alias('capped', dialect)}", dialect, cap + 1)
+    return f"SELECT COUNT(*) FROM ({body}) {_alias('subq', dialect)}"
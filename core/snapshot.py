@@ -126,7 +126,11 @@ def restore_snapshot(snap_id: str, adapter) -> bool:
     if not adapter or not adapter.supports_snapshot:
         raise ValueError("Adapter does not support snapshots.")
 
-    return adapter.restore_snapshot(snap["file_path"])
+    restored = adapter.restore_snapshot(snap["file_path"])
+    # A restore can bring back an older schema under the same fingerprint
+    adapter.invalidate_schema_cache()
+    adapter.note_write()
+    return restored
 
 
 def undo(steps=1, adapter=None, connection_name="Default SQLite"):
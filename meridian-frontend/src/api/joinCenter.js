@@ -6,6 +6,9 @@ export const getJoinSchema = () =>
 export const suggestJoins = (leftTable, rightTable) =>
   api.post('/api/join/suggest', { left_table: leftTable, right_table: rightTable }).then(r => r.data)
 
+export const planJoin = (tables, type = 'INNER') =>
+  api.post('/api/join/plan', { tables, type }).then(r => r.data)
+
 export const previewJoinSql = (spec) =>
   api.post('/api/join/preview', spec).then(r => r.data)
 
@@ -6,6 +6,9 @@ export const runCommand = (command) =>
 export const paginateResults = (page) =>
   api.get(`/api/command/paginate?page=${page}`).then(r => r.data)
 
+export const getResultCount = () =>
+  api.get('/api/command/count').then(r => r.data)
+
 export const executeWrite = (sql) =>
   api.post('/api/execute', { sql }).then(r => r.data)
 
@@ -8,7 +8,7 @@ import { GradientCard } from '../components/ui/Card'
 import { useDb } from '../context/DbContext'
 import { useAuth } from '../context/AuthContext'
 import { useToast } from '../context/ToastContext'
-import { runCommand, paginateResults } from '../api/query'
+import { runCommand, paginateResults, getResultCount } from '../api/query'
 import { setProvider } from '../api/admin'
 import ReactMarkdown from 'react-markdown'
 import {
@@ -88,8 +88,33 @@ export default function QueryPage() {
     } catch { toast.error('Failed to switch provider') }
   }
 
-  const totalPages = result?.total_rows ? Math.ceil(result.total_rows / (result.page_size || 50)) : 0
+  // First pages arrive with the planner's estimate; poll until the exact count lands
+  useEffect(() => {
+    if (result?.count_status !== 'pending') return
+    let cancelled = false
+    let attempt = 0
+    const poll = async () => {
+      try {
+        const data = await getResultCount()
+        if (cancelled) return
+        if (data.count_status !== 'pending') {
+          setResult(prev => prev && ({ ...prev, ...data }))
+        } else if (++attempt < 20) {
+          timer = setTimeout(poll, 1500)
+        }
+      } catch { /* keep the estimate */ }
+    }
+    let timer = setTimeout(poll, 1500)
+    return () => { cancelled = true; clearTimeout(timer) }
+  }, [result?.count_status, result?.sql])
+
   const currentPage = result?.page || 1
+  // Token-paged engines (Cassandra) and capped counts only report whether another
+  // page exists; a planner estimate may undershoot, so has_more always wins
+  const totalPages = result?.total_rows
+    ? Math.max(Math.ceil(result.total_rows / (result.page_size || 50)),
+        result.has_more ? currentPage + 1 : currentPage)
+    : result?.has_more ? currentPage + 1 : (currentPage > 1 ? currentPage : 0)
 
   return (
     <AppShell wide>
@@ -260,7 +285,9 @@ export default function QueryPage() {
                   <div>
                     <div className="flex items-center justify-between mb-2">
                       <span className="text-xs text-zinc-500">
-                        {result.total_rows != null ? `${result.total_rows.toLocaleString()} rows` : `${result.results.length} rows`}
+                        {result.total_display
+                          ? `${result.total_display} rows`
+                          : result.total_rows != null ? `${result.total_rows.toLocaleString()} rows` : `${result.results.length} rows`}
                       </span>
                     </div>
                     <ResultsTable columns={result.columns} rows={result.results} maxHeight="50vh" />